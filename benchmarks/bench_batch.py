@@ -0,0 +1,42 @@
+from char_table.strwidth import get_engine
+from char_table.batch import encode_utf32, get_batch_engine, np
+
+from benchmarks.corpora import build_corpora
+from benchmarks.harness import Recorder, best_time
+
+# Length of the short strings the corpora are cut into, like report cells.
+CELL_CHARS = 12
+
+
+def run(recorder: Recorder, repeat: int) -> None:
+    """
+    Batch suite: many short strings measured one by one with str_width versus in one
+    vectorized call, in millions of strings per second.
+
+    Results are checked against str_width once per corpus before timing. Skipped
+    when NumPy is not installed.
+    """
+    if np is None:
+        print("⚠️  Skipping batch benchmarks: NumPy is not installed")
+        return
+
+    engine = get_engine()
+    batch = get_batch_engine()
+
+    for name, lines in build_corpora().items():
+        cells = [line[i:i + CELL_CHARS] for line in lines for i in range(0, len(line), CELL_CHARS)]
+        million = len(cells) / 1e6
+
+        expected = [engine.str_width(cell) for cell in cells]
+        if batch.widths(cells).tolist() != expected:
+            raise AssertionError(f"Batch widths differ from str_width on the {name} corpus")
+
+        seconds = best_time(lambda: [engine.str_width(cell) for cell in cells], repeat)
+        recorder.add(f"batch.{name}.loop", million / seconds, "Mstr/s", higher_is_better=True)
+
+        seconds = best_time(lambda: batch.widths(cells), repeat)
+        recorder.add(f"batch.{name}.numpy", million / seconds, "Mstr/s", higher_is_better=True)
+
+        codepoints, offsets = encode_utf32(cells)
+        seconds = best_time(lambda: batch.width_of_buffer(codepoints, offsets), repeat)
+        recorder.add(f"batch.{name}.buffer", million / seconds, "Mstr/s", higher_is_better=True)
@@ -0,0 +1,184 @@
+import os
+import tempfile
+import contextlib
+from typing import Callable, Iterator
+
+from builder.core.settings import configure, settings
+from builder.core.scheduler import default_jobs
+from builder.core.archive_store import ArchiveStore
+from builder.core.verify import verify_archive, verify_tree
+from builder.core.width_map import WidthMap
+from builder.core.version import major_minor, read_version
+from builder.core.source_cache import SourceUnavailableError, cached_path, ensure_source
+from builder.parser.emoji_parser import parse_emoji_stream, shared_emoji_tables
+from builder.parser.east_asian_width_parser import shared_east_asian_width
+from builder.parser.language_parser import extract_lang_map
+from builder.parser.symbol_parser import extract_symbol_map
+from builder.writer.meta_writer import write_meta_json
+from builder.writer.row_writer import write_category_text
+from builder.writer.range_writer import write_ranges_json
+from builder.writer.default_writer import write_current_json
+from builder.writer.sinks import Dataset, write_dataset
+from builder.registry import DATASETS, REGISTRY
+
+from benchmarks.harness import Recorder, best_time, quiet
+
+
+@contextlib.contextmanager
+def scratch_output() -> Iterator[str]:
+    """
+    Points every writer at a temporary output root so benchmarks never touch char_table/.
+    """
+    previous = settings.output_dir
+    with tempfile.TemporaryDirectory(prefix="char-table-bench-") as tmp_dir:
+        configure(output_dir=tmp_dir)
+        try:
+            yield tmp_dir
+        finally:
+            configure(output_dir=previous)
+
+
+def _clear_shared() -> None:
+    # Every timed run starts cold: no memoized fetch or parse from a previous run.
+    shared_emoji_tables.cache_clear()
+    shared_east_asian_width.cache_clear()
+
+
+def warm_sources() -> set[str]:
+    """
+    Makes sure every upstream source is in the source cache, so timed runs read them from disk.
+
+    Returns:
+        set[str]: Names of the generators whose sources are all available
+    """
+    targets = {name: spec.target() for name, spec in REGISTRY.items()}
+    missing = set()
+    for version, rel_path in sorted({source for target in targets.values() for source in target.sources()}):
+        try:
+            with quiet():
+                ensure_source(rel_path, version)
+        except SourceUnavailableError as exc:
+            print(f"⚠️  Skipping benchmarks that need it: {exc}")
+            missing.add((version, rel_path))
+    return {name for name, target in targets.items() if not missing.intersection(target.sources())}
+
+
+def _parsers(ready: set[str]) -> dict[str, Callable[[], WidthMap]]:
+    # One parse stage per dataset; both emoji tables come out of the same single pass.
+    def parse_emoji(mode: str) -> WidthMap:
+        version = major_minor()
+        with open(cached_path(version, f"emoji/{version}/emoji-test.txt"), "r", encoding="utf-8") as f:
+            return parse_emoji_stream(f)[mode]
+
+    stages = {
+        name: (lambda name=name: extract_lang_map(name))
+        for name in ("cjk_unified", "japanese_kana", "korean_syllables")
+    }
+    stages.update({
+        name: (lambda name=name: extract_symbol_map(name))
+        for name in ("fullwidth_variants", "fullwidth_punctuations")
+    })
+    stages["emoji_base"] = lambda: parse_emoji("emoji_base")
+    stages["emoji_zwj"] = lambda: parse_emoji("emoji_zwj")
+    return {name: parse for name, parse in stages.items() if name in ready}
+
+
+def bench_generators(recorder: Recorder, repeat: int, ready: set[str]) -> None:
+    """
+    Times each generator end to end (parse + all writes) into a scratch output root.
+
+    Source generators run first, so width_table merges freshly written datasets.
+    """
+    with scratch_output():
+        for name, spec in REGISTRY.items():
+            if name not in ready:
+                continue
+            with quiet():
+                seconds = best_time(spec.generate, repeat, setup=_clear_shared)
+            recorder.add(f"builders.generator.{name}", seconds, "s")
+
+
+def bench_stages(recorder: Recorder, repeat: int, ready: set[str]) -> None:
+    """
+    Times the parse stage and each write stage of every dataset separately.
+
+    Parse stages start cold: no memoized fetch or parse is reused.
+    """
+    version = read_version()
+    parsers = _parsers(ready)
+    if "east_asian_width" in ready:
+        seconds = best_time(lambda: shared_east_asian_width(version), repeat, setup=_clear_shared)
+        recorder.add("builders.parse.east_asian_width", seconds, "s")
+
+    with scratch_output():
+        for spec in DATASETS:
+            category, name = spec.category, spec.name
+            if name not in parsers:
+                continue
+
+            parse = parsers[name]
+            recorder.add(f"builders.parse.{name}", best_time(parse, repeat, setup=_clear_shared), "s")
+            data = parse()
+
+            rel_path = f"{category}/{name}.json"
+            with quiet():
+                digest = write_current_json(category, name, data).sha256
+            writes = {
+                "current_json": lambda: write_current_json(category, name, data),
+                "ranges_json": lambda: write_ranges_json(category, name, data),
+                "category_text": lambda: write_category_text(name, data),
+                "meta_json": lambda: write_meta_json(name, "benchmark", rel_path, len(data), digest),
+                "sinks": lambda: write_dataset(Dataset(name, category, "benchmark", data)),
+            }
+            for stage, write in writes.items():
+                with quiet():
+                    seconds = best_time(write, repeat)
+                recorder.add(f"builders.write.{stage}.{name}", seconds, "s")
+
+        with quiet():
+            for spec in DATASETS:
+                if spec.name in parsers:
+                    spec.generate()
+            seconds = best_time(REGISTRY["width_table"].generate, repeat)
+        recorder.add("builders.write.width_table", seconds, "s")
+
+
+def bench_verify(recorder: Recorder, repeat: int, ready: set[str]) -> None:
+    """
+    Times `python -m builder.verify`'s two passes: a freshly built scratch tree, and
+    the shipped archive store (read only).
+    """
+    jobs = default_jobs()
+    with scratch_output() as tmp_dir:
+        with quiet():
+            for name, spec in REGISTRY.items():
+                if name in ready:
+                    spec.generate()
+        checked, mismatches = verify_tree(tmp_dir, jobs)
+        if mismatches:
+            raise AssertionError(f"Freshly built tree fails verification: {mismatches[0]}")
+        recorder.add("builders.verify.tree", best_time(lambda: verify_tree(tmp_dir, jobs), repeat), "s")
+
+    store = ArchiveStore(os.path.join(settings.output_dir, "archive", "store"))
+    if store.snapshots():
+        recorder.add("builders.verify.archive", best_time(lambda: verify_archive(store, jobs), repeat), "s")
+
+
+def run(recorder: Recorder, repeat: int) -> None:
+    """
+    Builder suite: per-generator wall time, per-stage parse and write times, and the
+    integrity check of a built tree and of the archive store.
+
+    Upstream sources are fetched (or revalidated) once up front and the timed runs
+    are made offline, so network latency never leaks into the numbers.
+    """
+    ready = warm_sources()
+    previous = settings.offline
+    configure(offline=True)
+    try:
+        bench_generators(recorder, repeat, ready)
+        bench_stages(recorder, repeat, ready)
+        bench_verify(recorder, repeat, ready)
+    finally:
+        settings.offline = previous
+        _clear_shared()
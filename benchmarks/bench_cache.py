@@ -0,0 +1,71 @@
+import random
+from itertools import chain
+
+from char_table.strwidth import get_engine
+from char_table.width_cache import WidthCache
+
+from benchmarks.corpora import SEED, build_corpora
+from benchmarks.harness import Recorder, best_time
+
+# Distinct column values (labels, words, emoji) and log records drawn from them.
+VOCABULARY = 20_000
+RECORDS = 200_000
+
+# Zipf exponent: value k recurs with weight 1 / k**ZIPF_S, as word and host frequencies do.
+ZIPF_S = 1.1
+
+# Share of plain ASCII values (hostnames, status words), which bypass the cache.
+ASCII_SHARE = 0.3
+
+# Cache bounds compared: roomy enough for the hot set, and a tenth of the vocabulary.
+CACHE_SIZES = {"large": VOCABULARY, "small": VOCABULARY // 10}
+
+
+def _vocabulary(rng: random.Random) -> list[str]:
+    # Short cells cut from every corpus, plus ASCII host names, shuffled so rank is independent of script.
+    lines = list(chain.from_iterable(zip(*build_corpora().values())))
+    values: set[str] = set()
+    while len(values) < VOCABULARY * (1 - ASCII_SHARE):
+        line = rng.choice(lines)
+        start = rng.randrange(len(line) - 12)
+        values.add(line[start:start + rng.randint(2, 12)].strip() or line[start])
+    hosts = {f"node-{rng.randrange(10**6):06d}.dc{rng.randrange(8)}" for _ in range(int(VOCABULARY * ASCII_SHARE))}
+    vocabulary = sorted(values | hosts)
+    rng.shuffle(vocabulary)
+    return vocabulary
+
+
+def _records() -> list[str]:
+    rng = random.Random(SEED)
+    vocabulary = _vocabulary(rng)
+    weights = [1 / rank ** ZIPF_S for rank in range(1, len(vocabulary) + 1)]
+    return rng.choices(vocabulary, weights, k=RECORDS)
+
+
+def run(recorder: Recorder, repeat: int) -> None:
+    """
+    Cache suite: a Zipf-distributed stream of recurring column values measured with
+    plain str_width and through WidthCache, in millions of strings per second.
+
+    Every timed run starts from an empty cache, so misses and evictions are included.
+    Hit rates are recorded alongside the throughput.
+    """
+    engine = get_engine()
+    records = _records()
+    million = len(records) / 1e6
+    expected = [engine.str_width(value) for value in records]
+
+    seconds = best_time(lambda: [engine.str_width(value) for value in records], repeat)
+    recorder.add("cache.zipf.uncached", million / seconds, "Mstr/s", higher_is_better=True)
+
+    for label, max_entries in CACHE_SIZES.items():
+        cache = WidthCache(engine, max_entries)
+        if [cache.str_width(value) for value in records] != expected:
+            raise AssertionError("Cached widths differ from str_width")
+
+        seconds = best_time(lambda: [cache.str_width(value) for value in records], repeat, setup=cache.clear)
+        stats = cache.stats()
+        recorder.add(f"cache.zipf.{label}", million / seconds, "Mstr/s", higher_is_better=True)
+        recorder.add(f"cache.zipf.{label}.hit_rate", stats.hit_rate, "ratio", higher_is_better=True)
+        print(f"🔬 {label} cache ({max_entries:,} entries): {stats.hits:,} hits, "
+              f"{stats.misses:,} misses, {stats.evictions:,} evictions")
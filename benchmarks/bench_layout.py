@@ -0,0 +1,68 @@
+from itertools import chain
+
+from char_table.layout import MeasuredText
+from char_table.strwidth import get_engine
+
+from benchmarks.corpora import build_corpora
+from benchmarks.harness import Recorder, best_time
+
+# Line sizes in UTF-8 bytes; the largest is the 1 MB case, the smallest the scaling reference.
+LINE_BYTES = (256 * 1024, 512 * 1024, 1024 * 1024)
+
+# Column width lines are wrapped to.
+WRAP_COLS = 80
+
+# Cut points searched in one pre-measured line (search only; slicing the result is a plain copy).
+CUTS = 1000
+
+
+def _mixed_line(size: int) -> str:
+    # Corpus lines of every script, interleaved and joined by spaces into one line of `size` bytes or more.
+    corpora = build_corpora()
+    parts: list[str] = []
+    total = 0
+    for line in chain.from_iterable(zip(*corpora.values())):
+        parts.append(line)
+        total += len(line.encode()) + 1
+        if total >= size:
+            break
+    return " ".join(parts)
+
+
+def run(recorder: Recorder, repeat: int) -> None:
+    """
+    Layout suite: truncate, pad and wrap over single lines of 256 KB to 1 MB mixing
+    CJK, Hangul, kana and ZWJ emoji.
+
+    Each operation measures the line once (prefix sums) and places its cut points by
+    binary search, so time should grow linearly with the line: `.scaling` is the 1 MB
+    time divided by four times the 256 KB time, 1.0 for perfectly linear.
+    """
+    engine = get_engine()
+    full = _mixed_line(LINE_BYTES[-1])
+    base_chars = len(full) * LINE_BYTES[0] // LINE_BYTES[-1]
+
+    times: dict[str, dict[int, float]] = {"measure": {}, "truncate": {}, "pad": {}, "wrap": {}}
+    for size in LINE_BYTES:
+        text = full[:len(full) * size // LINE_BYTES[-1]]
+        measured = MeasuredText(text, engine)
+        if measured.width != engine.str_width(text):
+            raise AssertionError(f"Layout width differs from str_width on the {size // 1024} KB line")
+        half = measured.width // 2
+
+        times["measure"][size] = best_time(lambda: MeasuredText(text, engine), repeat)
+        times["truncate"][size] = best_time(lambda: MeasuredText(text, engine).truncate(half), repeat)
+        times["pad"][size] = best_time(lambda: MeasuredText(text, engine).pad(measured.width + 40, "center"), repeat)
+        times["wrap"][size] = best_time(lambda: MeasuredText(text, engine).wrap(WRAP_COLS), repeat)
+
+    for op, by_size in times.items():
+        for size, seconds in by_size.items():
+            recorder.add(f"layout.{op}.{size // 1024}kb", seconds, "s")
+        recorder.add(f"layout.{op}.scaling", by_size[LINE_BYTES[-1]] / (4 * by_size[LINE_BYTES[0]]), "x")
+
+    measured = MeasuredText(full, engine)
+    step = max(measured.width // CUTS, 1)
+    seconds = best_time(lambda: [measured.cut(cols) for cols in range(0, measured.width, step)], repeat)
+    recorder.add("layout.cut.1024kb", seconds / CUTS * 1e6, "µs")
+
+    print(f"📝 Layout lines: {base_chars:,} to {len(full):,} characters")
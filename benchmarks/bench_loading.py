@@ -0,0 +1,91 @@
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+from char_table.table import DATASETS, resolve_data_dir
+from char_table.mmap_table import TABLE_FILE, open_table
+from char_table.rules_table import derive_datasets
+
+from benchmarks.harness import Recorder, best_time, peak_rss_mb
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _load_json(path: str) -> object:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _load_mapped(path: str) -> None:
+    open_table(path).close()
+
+
+def probe(path: str) -> dict[str, float]:
+    """
+    Loads one dataset file in a fresh interpreter and reports its cost.
+
+    Runs in a child process (see `python -m benchmarks.bench_loading <path>`), so
+    the peak RSS reflects this file alone rather than everything loaded before it.
+
+    Args:
+        path (str): Dataset file (.json, .ranges.json or .bin)
+
+    Returns:
+        dict[str, float]: Baseline and peak RSS in MB, and the RSS added by the load
+    """
+    base = peak_rss_mb()
+    loaded = open_table(path) if path.endswith(".bin") else _load_json(path)
+    peak = peak_rss_mb()
+    del loaded
+    return {"base_rss_mb": base, "peak_rss_mb": peak, "delta_rss_mb": peak - base}
+
+
+def _probe_in_child(path: str) -> dict[str, float]:
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_loading", path],
+        cwd=ROOT_DIR, check=True, capture_output=True, text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def dataset_files(data_dir: str) -> dict[str, str]:
+    """
+    Lists every loadable dataset file under a data directory, keyed by metric subject.
+
+    Returns:
+        dict[str, str]: e.g. {"cjk_unified.json": ".../cjk/cjk_unified.json", ...}
+    """
+    files = {}
+    for rel_path in DATASETS:
+        for suffix in (".json", ".ranges.json"):
+            path = os.path.join(data_dir, rel_path.removesuffix(".json") + suffix)
+            if os.path.exists(path):
+                files[os.path.basename(path)] = path
+    table_path = os.path.join(data_dir, TABLE_FILE)
+    if os.path.exists(table_path):
+        files[TABLE_FILE] = table_path
+    return files
+
+
+def run(recorder: Recorder, repeat: int) -> None:
+    """
+    Loading suite: parse time and resident memory of each shipped dataset file, and the
+    time the rules backend takes to compute them instead (uncached and from the cache file).
+    """
+    for subject, path in dataset_files(resolve_data_dir()).items():
+        load = _load_mapped if path.endswith(".bin") else _load_json
+        recorder.add(f"load.{subject}.seconds", best_time(lambda: load(path), repeat), "s")
+        recorder.add(f"load.{subject}.rss_mb", _probe_in_child(path)["delta_rss_mb"], "MB")
+
+    # The zero-file backend: datasets computed from the block tables, then read back from its marshal cache.
+    recorder.add("load.rules.seconds", best_time(derive_datasets, repeat), "s")
+    with tempfile.TemporaryDirectory(prefix="char-table-rules-") as workdir:
+        cache_path = os.path.join(workdir, "rules.marshal")
+        derive_datasets(cache_path)
+        recorder.add("load.rules.cache.seconds", best_time(lambda: derive_datasets(cache_path), repeat), "s")
+
+
+if __name__ == "__main__":
+    print(json.dumps(probe(sys.argv[1])))
@@ -0,0 +1,36 @@
+from char_table.table import get_table
+from char_table.strwidth import get_engine
+from char_table.mmap_table import open_table
+
+from benchmarks.corpora import build_corpora
+from benchmarks.harness import Recorder, best_time
+
+
+def run(recorder: Recorder, repeat: int) -> None:
+    """
+    Lookup suite: code point and string throughput over the synthetic corpora.
+
+    Tables are loaded before timing starts; only the lookups themselves are measured.
+    Reports millions of code points per second for the interval table and the
+    mapped binary table, and MB of UTF-8 text per second for str_width.
+    """
+    table = get_table()
+    engine = get_engine()
+    mapped = open_table()
+
+    try:
+        for name, lines in build_corpora().items():
+            codepoints = [ord(ch) for line in lines for ch in line]
+            text_mb = sum(len(line.encode("utf-8")) for line in lines) / 1e6
+            million_cps = len(codepoints) / 1e6
+
+            seconds = best_time(lambda: [table.lookup(cp) for cp in codepoints], repeat)
+            recorder.add(f"lookup.{name}.table", million_cps / seconds, "Mcp/s", higher_is_better=True)
+
+            seconds = best_time(lambda: [mapped.lookup(cp) for cp in codepoints], repeat)
+            recorder.add(f"lookup.{name}.mmap", million_cps / seconds, "Mcp/s", higher_is_better=True)
+
+            seconds = best_time(lambda: [engine.str_width(line) for line in lines], repeat)
+            recorder.add(f"lookup.{name}.str_width", text_mb / seconds, "MB/s", higher_is_better=True)
+    finally:
+        mapped.close()
@@ -0,0 +1,127 @@
+import os
+import sys
+import json
+import time
+import shutil
+import asyncio
+import tempfile
+import subprocess
+from statistics import quantiles
+
+from char_table.strwidth import get_engine
+
+from benchmarks.corpora import build_corpora
+from benchmarks.harness import Recorder, best_time
+
+# Strings per request, cut like report cells, and requests each client sends.
+BATCH = 64
+CELL_CHARS = 12
+REQUESTS = 50
+
+# Concurrent clients connected to the daemon.
+CLIENTS = 32
+
+# Seconds to wait for the daemon to bind its socket.
+START_TIMEOUT = 30
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _batches() -> list[list[str]]:
+    cells = [
+        line[i:i + CELL_CHARS]
+        for lines in build_corpora().values()
+        for line in lines
+        for i in range(0, len(line), CELL_CHARS)
+    ]
+    return [cells[i:i + BATCH] for i in range(0, CLIENTS * REQUESTS * BATCH, BATCH)]
+
+
+def _start_daemon(socket_path: str) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "char_table.serve", "--socket", socket_path],
+        cwd=ROOT, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + START_TIMEOUT
+    while not os.path.exists(socket_path):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            raise RuntimeError("char_table.serve did not start")
+        time.sleep(0.05)
+    return process
+
+
+async def _client(socket_path: str, requests: list[bytes], pipelined: bool, latencies: list[float]) -> list[bytes]:
+    reader, writer = await asyncio.open_unix_connection(socket_path, limit=1024 * 1024)
+    responses = []
+    if pipelined:
+        writer.write(b"".join(requests))
+        await writer.drain()
+        for _ in requests:
+            responses.append(await reader.readline())
+    else:
+        for request in requests:
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            responses.append(await reader.readline())
+            latencies.append(time.perf_counter() - start)
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+async def _clients(socket_path: str, per_client: list[list[bytes]], pipelined: bool,
+                   latencies: list[float]) -> list[list[bytes]]:
+    return await asyncio.gather(*(
+        _client(socket_path, requests, pipelined, latencies) for requests in per_client
+    ))
+
+
+def run(recorder: Recorder, repeat: int) -> None:
+    """
+    Serve suite: CLIENTS concurrent clients of a `python -m char_table.serve` daemon
+    on a Unix socket, each sending REQUESTS batches of BATCH strings.
+
+    Latency is measured with one request in flight per client; throughput with every
+    client pipelining all its requests at once. The cold start of a fresh interpreter
+    that imports char_table and measures one string is recorded for comparison, as the
+    cost each short-lived tool pays without the daemon.
+    """
+    batches = _batches()
+    engine = get_engine()
+    requests = [(json.dumps({"id": i, "strings": batch}, ensure_ascii=False) + "\n").encode()
+                for i, batch in enumerate(batches)]
+    per_client = [requests[i::CLIENTS] for i in range(CLIENTS)]
+    million = sum(map(len, batches)) / 1e6
+
+    workdir = tempfile.mkdtemp(prefix="char-table-serve-")
+    socket_path = os.path.join(workdir, "width.sock")
+    process = _start_daemon(socket_path)
+    try:
+        responses = asyncio.run(_clients(socket_path, per_client, True, []))
+        for client_requests, client_responses in zip(per_client, responses):
+            for request, response in zip(client_requests, client_responses):
+                strings = json.loads(request)["strings"]
+                if json.loads(response)["widths"] != [engine.str_width(s) for s in strings]:
+                    raise AssertionError("Daemon widths differ from str_width")
+
+        best_p50 = best_p99 = float("inf")
+        for _ in range(max(1, repeat)):
+            latencies: list[float] = []
+            asyncio.run(_clients(socket_path, per_client, False, latencies))
+            cuts = quantiles(latencies, n=100)
+            best_p50, best_p99 = min(best_p50, cuts[49]), min(best_p99, cuts[98])
+        recorder.add("serve.latency.p50", best_p50 * 1e3, "ms")
+        recorder.add("serve.latency.p99", best_p99 * 1e3, "ms")
+
+        seconds = best_time(lambda: asyncio.run(_clients(socket_path, per_client, True, [])), repeat)
+        recorder.add("serve.throughput", million / seconds, "Mstr/s", higher_is_better=True)
+    finally:
+        process.terminate()
+        process.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    command = [sys.executable, "-c", "from char_table import str_width; str_width('漢字')"]
+    seconds = best_time(lambda: subprocess.run(command, cwd=ROOT, check=True), repeat)
+    recorder.add("serve.cold_process", seconds * 1e3, "ms")
@@ -0,0 +1,121 @@
+import json
+from fnmatch import fnmatch
+from dataclasses import dataclass
+from typing import Optional
+
+# Allowed relative slowdown before a metric counts as a regression.
+DEFAULT_THRESHOLD = 0.25
+
+# Absolute differences below these are timer or allocator noise, whatever the ratio;
+# without them a 0.1 ms stage taking 0.2 ms would be a "100% regression".
+NOISE_FLOOR = {
+    "s": 0.002,
+    "MB": 0.5,
+}
+
+
+@dataclass
+class Comparison:
+    """
+    One metric checked against the baseline.
+
+    Attributes:
+        name (str): Metric name
+        baseline (Optional[float]): Baseline value, None for metrics new in this run
+        current (float): Value from this run
+        change (float): Relative change in the metric's "worse" direction (0.10 = 10% worse)
+        threshold (float): Allowed relative change for this metric
+        unit (str): Unit label, used to look up the noise floor
+    """
+    name: str
+    baseline: Optional[float]
+    current: float
+    change: float
+    threshold: float
+    unit: str = ""
+
+    @property
+    def regressed(self) -> bool:
+        if self.baseline is None or self.change <= self.threshold:
+            return False
+        return abs(self.current - self.baseline) > NOISE_FLOOR.get(self.unit, 0.0)
+
+
+def load_results(path: str) -> dict:
+    """
+    Reads a results or baseline file written by benchmarks/run.py.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def threshold_for(name: str, thresholds: dict[str, float], default: float) -> float:
+    """
+    Picks the threshold of the most specific (longest) glob pattern matching a metric name.
+
+    Args:
+        name (str): Metric name, e.g. "load.cjk_unified.json.rss_mb"
+        thresholds (dict[str, float]): Glob pattern → allowed relative change
+        default (float): Threshold when no pattern matches
+
+    Returns:
+        float: Allowed relative change
+    """
+    matches = [pattern for pattern in thresholds if fnmatch(name, pattern)]
+    if not matches:
+        return default
+    return thresholds[max(matches, key=len)]
+
+
+def compare(current: dict, baseline: dict, default: float = DEFAULT_THRESHOLD) -> list[Comparison]:
+    """
+    Compares a run against a baseline, metric by metric.
+
+    Thresholds come from the baseline's "thresholds" table (glob → fraction),
+    falling back to `default`. Times and memory regress when they grow; metrics
+    flagged higher_is_better (throughputs) regress when they shrink. Differences
+    under the unit's NOISE_FLOOR never count.
+
+    Args:
+        current (dict): Results of this run
+        baseline (dict): Stored baseline results
+        default (float): Threshold for metrics without a matching pattern
+
+    Returns:
+        list[Comparison]: One entry per metric of the current run, sorted by name
+    """
+    thresholds = baseline.get("thresholds", {})
+    base_metrics = baseline.get("metrics", {})
+    comparisons = []
+
+    for name, metric in sorted(current["metrics"].items()):
+        value = metric["value"]
+        base = base_metrics.get(name, {}).get("value")
+        change = 0.0
+        if base:
+            change = (value - base) / base
+            if metric["higher_is_better"]:
+                change = -change
+        threshold = threshold_for(name, thresholds, default)
+        comparisons.append(Comparison(name, base, value, change, threshold, metric["unit"]))
+
+    return comparisons
+
+
+def print_report(comparisons: list[Comparison]) -> int:
+    """
+    Prints a comparison table and returns the number of regressions.
+
+    Δ is the relative change in the metric's worse direction: positive means slower,
+    larger or lower throughput than the baseline.
+    """
+    regressions = 0
+    for c in comparisons:
+        if c.baseline is None:
+            print(f"🆕 {c.name:<52} {c.current:>12.4f}")
+            continue
+        mark = "❌" if c.regressed else "✅"
+        regressions += c.regressed
+        print(f"{mark} {c.name:<52} {c.baseline:>12.4f} → {c.current:>12.4f} "
+              f"(Δ {c.change:+.1%}, limit {c.threshold:.0%})")
+    return regressions
@@ -0,0 +1,61 @@
+import random
+
+from char_table.table import get_sequences
+
+# Synthetic corpus size per script, in characters (or ZWJ sequences).
+CORPUS_CHARS = 200_000
+
+# Characters per line; lines end with "\n" and are measured one by one like terminal rows.
+LINE_CHARS = 80
+
+# Fixed seed so every run measures the same text.
+SEED = 20250101
+
+# Code point spans each corpus draws from, weighted towards the commonly used blocks.
+SCRIPT_SPANS = {
+    "cjk": ((0x4E00, 0x9FFF, 8), (0x3400, 0x4DBF, 1), (0x20000, 0x2A6DF, 1)),
+    "hangul": ((0xAC00, 0xD7A3, 1),),
+    "kana": ((0x3041, 0x3096, 1), (0x30A1, 0x30FA, 1)),
+}
+
+# Share of ASCII spaces and punctuation mixed into each corpus, as in real text.
+ASCII_SHARE = 0.1
+ASCII_CHARS = " ,.!?0123456789"
+
+
+def _script_lines(spans: tuple[tuple[int, int, int], ...], rng: random.Random) -> list[str]:
+    weights = [weight for _, _, weight in spans]
+    lines = []
+    for _ in range(CORPUS_CHARS // LINE_CHARS):
+        chars = []
+        for _ in range(LINE_CHARS):
+            if rng.random() < ASCII_SHARE:
+                chars.append(rng.choice(ASCII_CHARS))
+            else:
+                start, end, _ = rng.choices(spans, weights)[0]
+                chars.append(chr(rng.randint(start, end)))
+        lines.append("".join(chars))
+    return lines
+
+
+def _zwj_lines(rng: random.Random) -> list[str]:
+    # Sequences from the shipped emoji_zwj dataset, separated by spaces like chat messages.
+    sequences = sorted(get_sequences())
+    per_line = LINE_CHARS // 8
+    return [
+        " ".join(rng.choice(sequences) for _ in range(per_line))
+        for _ in range(CORPUS_CHARS // LINE_CHARS)
+    ]
+
+
+def build_corpora() -> dict[str, list[str]]:
+    """
+    Generates the deterministic lookup corpora: CJK, Hangul, kana and ZWJ emoji.
+
+    Returns:
+        dict[str, list[str]]: Corpus name → list of lines
+    """
+    rng = random.Random(SEED)
+    corpora = {name: _script_lines(spans, rng) for name, spans in SCRIPT_SPANS.items()}
+    corpora["zwj_emoji"] = _zwj_lines(rng)
+    return corpora
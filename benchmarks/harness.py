@@ -0,0 +1,81 @@
+import os
+import time
+import contextlib
+from dataclasses import dataclass, asdict
+from typing import Callable, Iterator, Optional
+
+from builder.core.trace import peak_rss_mb
+
+
+@dataclass
+class Metric:
+    """
+    One benchmark measurement.
+
+    Attributes:
+        value (float): Measured value
+        unit (str): Unit label, e.g. "s", "MB", "MB/s"
+        higher_is_better (bool): True for throughputs, False for times and memory
+    """
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+
+class Recorder:
+    """
+    Collects named metrics from the benchmark suites and prints each one as it lands.
+    """
+
+    def __init__(self):
+        self.metrics: dict[str, Metric] = {}
+
+    def add(self, name: str, value: float, unit: str, higher_is_better: bool = False) -> None:
+        """
+        Records a metric, e.g. add("builders.cjk_unified", 0.21, "s").
+
+        Args:
+            name (str): Dotted metric name, "<suite>.<subject>[.<aspect>]"
+            value (float): Measured value
+            unit (str): Unit label
+            higher_is_better (bool): Direction used when comparing against a baseline
+        """
+        self.metrics[name] = Metric(value, unit, higher_is_better)
+        print(f"⏱️  {name:<52} {value:>12.4f} {unit}")
+
+    def to_dict(self) -> dict[str, dict]:
+        return {name: asdict(metric) for name, metric in sorted(self.metrics.items())}
+
+
+def best_time(func: Callable[[], object], repeat: int = 3, setup: Optional[Callable[[], object]] = None) -> float:
+    """
+    Runs `func` `repeat` times and returns the fastest wall-clock time in seconds.
+
+    The minimum is the least noisy estimate of the intrinsic cost: slower runs
+    only add scheduler and cache interference on top of it.
+
+    Args:
+        func (Callable[[], object]): Code under measurement
+        repeat (int): Number of timed runs
+        setup (Optional[Callable[[], object]]): Untimed call before every run, e.g. clearing caches
+
+    Returns:
+        float: Best run time in seconds
+    """
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    """
+    Silences the builders' progress prints while they are being timed.
+    """
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
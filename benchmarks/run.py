@@ -0,0 +1,127 @@
+import os
+import sys
+import json
+import platform
+import argparse
+from datetime import datetime, timezone
+from typing import Callable
+
+from builder.core.settings import configure
+from builder.core.version import read_version
+
+from benchmarks import (
+    bench_batch,
+    bench_builders,
+    bench_cache,
+    bench_layout,
+    bench_loading,
+    bench_lookup,
+    bench_serve,
+)
+from benchmarks.harness import Recorder
+from benchmarks.compare import DEFAULT_THRESHOLD, compare, load_results, print_report
+
+# Benchmark suites in run order; each records its metrics under its own prefix.
+SUITES: dict[str, Callable[[Recorder, int], None]] = {
+    "builders": bench_builders.run,
+    "load": bench_loading.run,
+    "lookup": bench_lookup.run,
+    "batch": bench_batch.run,
+    "layout": bench_layout.run,
+    "cache": bench_cache.run,
+    "serve": bench_serve.run,
+}
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results", "latest.json")
+
+
+def run_suites(names: list[str], repeat: int) -> dict:
+    """
+    Runs the selected suites and returns the machine-readable results document.
+
+    Args:
+        names (list[str]): Suite names from SUITES
+        repeat (int): Timed runs per measurement (the fastest is kept)
+
+    Returns:
+        dict: {"unicode_version", "python", "platform", "timestamp", "metrics": {name: metric}}
+    """
+    recorder = Recorder()
+    for name in names:
+        print(f"🏁 Running {name} benchmarks ...")
+        SUITES[name](recorder, repeat)
+
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return {
+        "unicode_version": read_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": now,
+        "metrics": recorder.to_dict(),
+    }
+
+
+def write_results(path: str, results: dict) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"📝 Results written: {path}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Benchmark the char-table builders, dataset loading and width lookups.",
+    )
+    parser.add_argument("suites", nargs="*", metavar="suite",
+                        help=f"Suites to run (default: all of {', '.join(SUITES)})")
+    parser.add_argument("-r", "--repeat", type=int, default=3,
+                        help="Timed runs per measurement; the fastest is kept (default: 3)")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT,
+                        help="Where to write this run's results JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative regression for metrics without a per-metric "
+                             f"threshold in the baseline (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store this run as the new baseline, keeping its thresholds")
+    parser.add_argument("--offline", action="store_true",
+                        help="Read upstream sources only from the cache or --mirror")
+    parser.add_argument("--mirror", help="Local mirror of the upstream tree")
+    parser.add_argument("--cache-dir", help="Source cache directory")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.suites if name not in SUITES]
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(unknown)}")
+
+    configure(offline=args.offline or None, mirror_dir=args.mirror, cache_dir=args.cache_dir)
+
+    results = run_suites(args.suites or list(SUITES), args.repeat)
+    write_results(args.output, results)
+
+    baseline = load_results(args.baseline) if os.path.exists(args.baseline) else None
+
+    if args.update_baseline:
+        if baseline and "thresholds" in baseline:
+            results["thresholds"] = baseline["thresholds"]
+        write_results(args.baseline, results)
+        return 0
+
+    if baseline is None:
+        print(f"⚠️  No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    regressions = print_report(compare(results, baseline, args.threshold))
+    if regressions:
+        print(f"❌ {regressions} metric(s) regressed beyond their threshold")
+        return 1
+    print("✅ No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+import os
+import sys
+import glob
+import argparse
+from datetime import datetime, timezone
+
+from builder.core.settings import settings
+from builder.core.version import read_version
+from builder.core.archive_store import TIMESTAMP_FORMAT, ArchiveStore, SnapshotNotFoundError
+
+
+def _size(num_bytes: int) -> str:
+    return f"{num_bytes / 1024:.1f} KB" if num_bytes < 1024 * 1024 else f"{num_bytes / (1024 * 1024):.2f} MB"
+
+
+def cmd_create(store: ArchiveStore, args: argparse.Namespace) -> int:
+    """
+    Snapshots char_table/current, categories and meta into the store.
+    """
+    timestamp = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
+    snapshot, new_blobs = store.add_tree(read_version(), timestamp)
+    print(f"✅ Snapshot archived: {snapshot.id} ({len(snapshot.files)} files, {new_blobs} new blobs)")
+    return 0
+
+
+def cmd_list(store: ArchiveStore, args: argparse.Namespace) -> int:
+    """
+    Lists snapshots, oldest first.
+    """
+    snapshots = store.snapshots()
+    for snapshot in snapshots:
+        total = sum(entry["size"] for entry in snapshot.files.values())
+        print(f"📦 {snapshot.id:<32} {len(snapshot.files):>3} files  {_size(total):>10}")
+    print(f"🗄️  {len(snapshots)} snapshots, {_size(store.blob_bytes())} of blobs in {store.root}")
+    return 0
+
+
+def cmd_show(store: ArchiveStore, args: argparse.Namespace) -> int:
+    """
+    Lists the files of one snapshot with their digests.
+    """
+    snapshot = store.snapshot(args.ref)
+    print(f"📦 {snapshot.id} (Unicode {snapshot.version})")
+    for rel_path, entry in snapshot.files.items():
+        print(f"  {entry['sha256'][:12]}  {entry['size']:>9}  {rel_path}")
+    return 0
+
+
+def cmd_cat(store: ArchiveStore, args: argparse.Namespace) -> int:
+    """
+    Writes one table of one snapshot to stdout.
+    """
+    sys.stdout.buffer.write(store.read(args.ref, args.table))
+    return 0
+
+
+def cmd_export(store: ArchiveStore, args: argparse.Namespace) -> int:
+    """
+    Restores a snapshot (or some of its tables) under a directory.
+    """
+    for path in store.export(args.ref, args.destination, args.tables or None):
+        print(f"✅ Restored: {path}")
+    return 0
+
+
+def cmd_import(store: ArchiveStore, args: argparse.Namespace) -> int:
+    """
+    Imports legacy tarballs; by default every char_table/archive/*.tar.gz not imported yet.
+    """
+    tarballs = args.tarballs or sorted(glob.glob(os.path.join(settings.output_dir, "archive", "*.tar.gz")))
+    known = {snapshot.id for snapshot in store.snapshots()}
+    for path in tarballs:
+        name = os.path.basename(path).removeprefix("char_table_").removesuffix(".tar.gz")
+        if name in known and not args.tarballs:
+            print(f"⏭️  {name} is already imported")
+            continue
+        snapshot, new_blobs = store.import_tarball(path)
+        print(f"✅ Imported {os.path.basename(path)} as {snapshot.id} ({len(snapshot.files)} files, {new_blobs} new blobs)")
+    print(f"🗄️  Store holds {_size(store.blob_bytes())} of blobs; "
+          f"tarballs: {_size(sum(os.path.getsize(p) for p in tarballs))}")
+    return 0
+
+
+COMMANDS = {
+    "create": cmd_create,
+    "list": cmd_list,
+    "show": cmd_show,
+    "cat": cmd_cat,
+    "export": cmd_export,
+    "import": cmd_import,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m builder.archive",
+        description="Content-addressed snapshots of char_table/ (current, categories, meta).",
+    )
+    parser.add_argument("--store", help="Store directory (default: char_table/archive/store)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("create", help="Archive the current tables as a new snapshot")
+    sub.add_parser("list", help="List snapshots")
+
+    show = sub.add_parser("show", help="List the files of a snapshot")
+    show.add_argument("ref", nargs="?", default="latest", help="latest, snapshot id, version or timestamp prefix")
+
+    cat = sub.add_parser("cat", help="Print one table of a snapshot")
+    cat.add_argument("ref", help="latest, snapshot id, version or timestamp prefix")
+    cat.add_argument("table", help="Dataset name (cjk_unified), file name (width_table.bin) or path (meta/...)")
+
+    export = sub.add_parser("export", help="Restore a snapshot, or some of its tables, into a directory")
+    export.add_argument("ref", help="latest, snapshot id, version or timestamp prefix")
+    export.add_argument("destination", help="Directory that receives current/, categories/ and meta/")
+    export.add_argument("tables", nargs="*", help="Only these tables")
+
+    imp = sub.add_parser("import", help="Import legacy .tar.gz snapshots (default: all in char_table/archive/)")
+    imp.add_argument("tarballs", nargs="*", help="Tarballs to import")
+    return parser
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    store = ArchiveStore(args.store)
+    try:
+        sys.exit(COMMANDS[args.command](store, args))
+    except SnapshotNotFoundError as exc:
+        print(f"❌ {exc.args[0]}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,269 @@
+import os
+import re
+import json
+import zlib
+import hashlib
+import tarfile
+import posixpath
+import threading
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from builder.core.settings import settings
+
+# Directories under the output root that a snapshot captures (same set as the old tarballs).
+SNAPSHOT_DIRS = ("current", "categories", "meta")
+
+# Legacy tarball names written by scripts/archive.sh: char_table_<timestamp>_v<version>.tar.gz
+TARBALL_NAME = re.compile(r"^char_table_(?P<timestamp>\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})_v(?P<version>[\w.]+)\.tar\.gz$")
+
+# Snapshot timestamp format, kept from scripts/archive.sh.
+TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+
+
+class SnapshotNotFoundError(KeyError):
+    """
+    Raised when a snapshot reference or a table name matches nothing in the archive.
+    """
+
+
+def _member_path(name: str) -> str:
+    # Tarball member name → snapshot path, refusing anything that would leave the snapshot root.
+    path = posixpath.normpath(name)
+    if posixpath.isabs(path) or path == ".." or path.startswith("../"):
+        raise ValueError(f"Unsafe path in archive tarball: {name!r}")
+    return path.removeprefix("char_table/")
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    One archived state of char_table/.
+
+    Attributes:
+        id (str): "<timestamp>_v<version>", e.g. "2025-05-25_17-30-49_v16.0.0"
+        version (str): Unicode version from VERSION.txt at archive time
+        timestamp (str): UTC time of the snapshot, "YYYY-MM-DD_HH-MM-SS"
+        files (dict[str, dict]): Path under char_table/ (e.g. "current/cjk/cjk_unified.json")
+            → {"sha256": ..., "size": ...}
+    """
+    id: str
+    version: str
+    timestamp: str
+    files: dict[str, dict]
+
+    def resolve_table(self, table: str) -> str:
+        """
+        Maps a table name or path to the archived file path.
+
+        Accepts a path under char_table/ ("meta/emoji_base.meta.json", "categories/cjk_unified.txt"),
+        a dataset name ("cjk_unified" → current/cjk/cjk_unified.json) or a file name under
+        current/ ("cjk_unified.ranges", "width_table.bin").
+
+        Raises:
+            SnapshotNotFoundError: If nothing in the snapshot matches
+        """
+        if table in self.files:
+            return table
+        for name in (f"{table}.json", table):
+            for path in sorted(self.files):
+                if path.startswith("current/") and path.rsplit("/", 1)[-1] == name:
+                    return path
+        raise SnapshotNotFoundError(f"{table} is not in snapshot {self.id}")
+
+
+class ArchiveStore:
+    """
+    Content-addressed store of char_table/ snapshots, under char_table/archive/store/.
+
+        index.json               snapshot id → version, timestamp, file path → blob digest
+        blobs/<aa>/<sha256>      zlib-compressed file contents, keyed by the SHA-256 of the raw bytes
+
+    A file that is identical across snapshots (most tables between two archives) is
+    stored once. Reading any table from any snapshot takes two file reads: the index
+    (loaded once per store object) and the table's blob.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.path.join(settings.output_dir, "archive", "store")
+        self._lock = threading.Lock()
+        self._index: Optional[dict[str, dict]] = None
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.root, "index.json")
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, "blobs", digest[:2], digest)
+
+    def _load_index(self) -> dict[str, dict]:
+        if self._index is None:
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)["snapshots"]
+            except FileNotFoundError:
+                self._index = {}
+        return self._index
+
+    def _save_index(self) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"snapshots": self._index}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def snapshots(self) -> list[Snapshot]:
+        """
+        Returns every snapshot, oldest first.
+        """
+        index = self._load_index()
+        return [Snapshot(id=key, **index[key]) for key in sorted(index, key=lambda k: index[k]["timestamp"])]
+
+    def snapshot(self, ref: str = "latest") -> Snapshot:
+        """
+        Resolves a snapshot reference.
+
+        Args:
+            ref (str): "latest", a snapshot id, a Unicode version ("15.1.0": newest snapshot
+                of that version) or a timestamp prefix ("2025-05-24", "2025-05-24_15")
+
+        Returns:
+            Snapshot: The matching snapshot (the newest, if several match)
+
+        Raises:
+            SnapshotNotFoundError: If no snapshot matches
+        """
+        snapshots = self.snapshots()
+        if ref == "latest":
+            matches = snapshots
+        else:
+            matches = [s for s in snapshots if ref in (s.id, s.version) or s.timestamp.startswith(ref)]
+        if not matches:
+            raise SnapshotNotFoundError(f"No archived snapshot matches {ref!r}")
+        return matches[-1]
+
+    def read(self, ref: str, table: str) -> bytes:
+        """
+        Reads one table from one snapshot without touching any other archived file.
+
+        Args:
+            ref (str): Snapshot reference (see snapshot())
+            table (str): Table name or path (see Snapshot.resolve_table())
+
+        Returns:
+            bytes: The file contents, checked against their recorded SHA-256
+        """
+        snapshot = self.snapshot(ref)
+        entry = snapshot.files[snapshot.resolve_table(table)]
+        with open(self.blob_path(entry["sha256"]), "rb") as f:
+            data = zlib.decompress(f.read())
+        if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            raise ValueError(f"Corrupt archive blob {entry['sha256']} for {table} in {snapshot.id}")
+        return data
+
+    def _put_blob(self, data: bytes) -> tuple[str, bool]:
+        # Returns the digest and whether a new blob had to be written.
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+        if os.path.exists(path):
+            return digest, False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(zlib.compress(data, 9))
+        os.replace(tmp_path, path)
+        return digest, True
+
+    def add(self, version: str, timestamp: str, files: Iterable[tuple[str, bytes]]) -> tuple[Snapshot, int]:
+        """
+        Stores a snapshot; blobs already in the store are reused.
+
+        Args:
+            version (str): Unicode version of the snapshot
+            timestamp (str): Snapshot time, "YYYY-MM-DD_HH-MM-SS"
+            files (Iterable[tuple[str, bytes]]): (path under char_table/, contents) pairs
+
+        Returns:
+            tuple[Snapshot, int]: The stored snapshot and how many of its files were new blobs
+        """
+        with self._lock:
+            index = self._load_index()
+            entries = {}
+            new_blobs = 0
+            for rel_path, data in files:
+                digest, created = self._put_blob(data)
+                new_blobs += created
+                entries[rel_path] = {"sha256": digest, "size": len(data)}
+
+            snapshot_id = f"{timestamp}_v{version}"
+            index[snapshot_id] = {"version": version, "timestamp": timestamp, "files": dict(sorted(entries.items()))}
+            self._save_index()
+            return Snapshot(id=snapshot_id, **index[snapshot_id]), new_blobs
+
+    def add_tree(self, version: str, timestamp: str, root: Optional[str] = None) -> tuple[Snapshot, int]:
+        """
+        Snapshots current/, categories/ and meta/ under an output root (char_table/ by default).
+        """
+        root = root or settings.output_dir
+
+        def walk() -> Iterable[tuple[str, bytes]]:
+            for subdir in SNAPSHOT_DIRS:
+                for dir_path, dir_names, file_names in os.walk(os.path.join(root, subdir)):
+                    dir_names.sort()
+                    for file_name in sorted(file_names):
+                        path = os.path.join(dir_path, file_name)
+                        with open(path, "rb") as f:
+                            yield os.path.relpath(path, root).replace(os.sep, "/"), f.read()
+
+        return self.add(version, timestamp, walk())
+
+    def import_tarball(self, path: str) -> tuple[Snapshot, int]:
+        """
+        Imports a legacy char_table_<timestamp>_v<version>.tar.gz made by scripts/archive.sh.
+
+        macOS AppleDouble entries ("._*") and directories are skipped.
+
+        Raises:
+            ValueError: If the file name is not an archive tarball name, or a member's
+                path is absolute or climbs out of the archive with ".."
+        """
+        match = TARBALL_NAME.match(os.path.basename(path))
+        if not match:
+            raise ValueError(f"Not an archive tarball name: {os.path.basename(path)}")
+
+        def members() -> Iterable[tuple[str, bytes]]:
+            with tarfile.open(path, "r:gz") as tar:
+                for member in tar:
+                    name = _member_path(member.name)
+                    if not member.isfile() or os.path.basename(name).startswith("._"):
+                        continue
+                    yield name, tar.extractfile(member).read()
+
+        return self.add(match["version"], match["timestamp"], members())
+
+    def export(self, ref: str, destination: str, tables: Optional[list[str]] = None) -> list[str]:
+        """
+        Writes a snapshot's files (or only the given tables) under a destination directory.
+
+        Returns:
+            list[str]: Absolute paths of the written files
+        """
+        snapshot = self.snapshot(ref)
+        rel_paths = [snapshot.resolve_table(t) for t in tables] if tables else list(snapshot.files)
+        written = []
+        for rel_path in rel_paths:
+            path = os.path.abspath(os.path.join(destination, rel_path))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(self.read(snapshot.id, rel_path))
+            written.append(path)
+        return written
+
+    def blob_bytes(self) -> int:
+        """
+        Returns the on-disk size of all stored blobs.
+        """
+        total = 0
+        for dir_path, _, file_names in os.walk(os.path.join(self.root, "blobs")):
+            total += sum(os.path.getsize(os.path.join(dir_path, name)) for name in file_names)
+        return total
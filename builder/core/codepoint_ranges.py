@@ -0,0 +1,55 @@
+from typing import Iterable
+
+# Inclusive (start, end) code point range.
+Span = tuple[int, int]
+
+# Total number of code points in the Unicode codespace (U+0000..U+10FFFF).
+CODESPACE = 0x110000
+
+
+def normalize(ranges: Iterable[Span]) -> list[Span]:
+    """
+    Sorts ranges and merges overlapping or adjacent ones.
+
+    Args:
+        ranges (Iterable[Span]): Inclusive (start, end) ranges in any order
+
+    Returns:
+        list[Span]: Sorted, disjoint ranges
+    """
+    result: list[Span] = []
+    for start, end in sorted(ranges):
+        if result and start <= result[-1][1] + 1:
+            result[-1] = (result[-1][0], max(result[-1][1], end))
+        else:
+            result.append((start, end))
+    return result
+
+
+def difference(ranges: Iterable[Span], removed: Iterable[Span]) -> list[Span]:
+    """
+    Subtracts one set of ranges from another in a single merge pass.
+
+    Args:
+        ranges (Iterable[Span]): Ranges to keep
+        removed (Iterable[Span]): Ranges to cut out
+
+    Returns:
+        list[Span]: Sorted, disjoint ranges covering `ranges` minus `removed`
+    """
+    cuts = normalize(removed)
+    result: list[Span] = []
+    i = 0
+    for start, end in normalize(ranges):
+        while i < len(cuts) and cuts[i][1] < start:
+            i += 1
+        j = i
+        while j < len(cuts) and cuts[j][0] <= end:
+            cut_start, cut_end = cuts[j]
+            if cut_start > start:
+                result.append((start, cut_start - 1))
+            start = max(start, cut_end + 1)
+            j += 1
+        if start <= end:
+            result.append((start, end))
+    return result
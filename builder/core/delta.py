@@ -0,0 +1,413 @@
+import os
+import json
+import hashlib
+from bisect import bisect_left
+from typing import Callable, Iterable, Optional
+
+from char_table.ranges import merge_ranges, ranges_from_pairs
+
+from builder.core.settings import settings
+from builder.core.archive_store import ArchiveStore
+from builder.writer.atomic_writer import AtomicWriter, json_encoder
+from builder.writer.binary_writer import build_two_stage_table
+from builder.writer.range_writer import ranges_payload
+
+# Snapshot reference naming the working tree (char_table/ under the output root) instead of an archive.
+CURRENT = "current"
+
+# Patch format version, bumped on incompatible changes.
+DELTA_FORMAT = 1
+
+# Binary table rebuilt from the patched datasets.
+WIDTH_TABLE = "current/width_table.bin"
+
+
+class DeltaError(RuntimeError):
+    """
+    Raised when a patch does not apply: the base files differ from the ones it was made
+    against, or a rebuilt file does not match its expected hash.
+    """
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class TreeReader:
+    """
+    Read access to one snapshot: the working tree (ref "current") or an archived snapshot.
+    """
+
+    def __init__(self, ref: str, store: Optional[ArchiveStore] = None, root: Optional[str] = None):
+        self.ref = ref
+        self.root = root or settings.output_dir
+        if ref == CURRENT:
+            self.id = CURRENT
+            self._files = None
+        else:
+            self._store = store or ArchiveStore()
+            snapshot = self._store.snapshot(ref)
+            self.id = snapshot.id
+            self._files = snapshot.files
+
+    def paths(self) -> list[str]:
+        """
+        Returns every file path under current/, categories/ and meta/, relative to char_table/.
+        """
+        if self._files is not None:
+            return sorted(self._files)
+        paths = []
+        for subdir in ("current", "categories", "meta"):
+            for dir_path, _, file_names in os.walk(os.path.join(self.root, subdir)):
+                for file_name in file_names:
+                    path = os.path.join(dir_path, file_name)
+                    paths.append(os.path.relpath(path, self.root).replace(os.sep, "/"))
+        return sorted(paths)
+
+    def read(self, rel_path: str) -> Optional[bytes]:
+        """
+        Returns a file's bytes, or None when the snapshot does not contain it.
+        """
+        if self._files is not None:
+            return self._store.read(self.id, rel_path) if rel_path in self._files else None
+        try:
+            with open(os.path.join(self.root, rel_path), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def datasets(self) -> dict[str, str]:
+        """
+        Returns dataset name → path of its JSON map, e.g. {"cjk_unified": "current/cjk/cjk_unified.json"}.
+        """
+        return {
+            path.rsplit("/", 1)[-1].removesuffix(".json"): path
+            for path in self.paths()
+            if path.startswith("current/") and path.endswith(".json") and not path.endswith(".ranges.json")
+        }
+
+    def metas(self) -> dict[str, dict]:
+        """
+        Returns every meta/*.meta.json document, keyed by its "name" field.
+        """
+        metas = {}
+        for path in self.paths():
+            if path.startswith("meta/") and path.endswith(".meta.json"):
+                meta = json.loads(self.read(path))
+                metas[meta["name"]] = meta
+        return metas
+
+
+def _stable_keys(base_order: dict[str, int], kept: list[str]) -> set[str]:
+    # Longest run of kept keys whose relative order is the same in both files
+    # (longest increasing subsequence of their base positions, patience sorting).
+    # Keys outside it moved and are re-inserted by the patch.
+    tails: list[int] = []
+    tail_keys: list[int] = []
+    previous: list[int] = [-1] * len(kept)
+    for i, key in enumerate(kept):
+        position = base_order[key]
+        j = bisect_left(tails, position)
+        if j == len(tails):
+            tails.append(position)
+            tail_keys.append(i)
+        else:
+            tails[j] = position
+            tail_keys[j] = i
+        previous[i] = tail_keys[j - 1] if j else -1
+
+    stable = set()
+    i = tail_keys[-1] if tail_keys else -1
+    while i >= 0:
+        stable.add(kept[i])
+        i = previous[i]
+    return stable
+
+
+def diff_table(base: dict[str, int], target: dict[str, int]) -> dict:
+    """
+    Computes the entry-level changes that turn one dataset map into another.
+
+    Key order is part of the file, so added entries carry an anchor: the nearest
+    preceding key present in both files, or None for the head. Tables are written in
+    code point order (the order of sorted(dict)), but older snapshots list emoji in
+    emoji-test.txt order; between such files the longest run of keys in the same
+    relative order is kept, and the other keys count as removed and added.
+
+    Args:
+        base (dict[str, int]): Old character → width map
+        target (dict[str, int]): New character → width map
+
+    Returns:
+        dict: {"removed": [key, ...], "changed": {key: [old, new]}, "added": [[anchor, key, width], ...]}
+    """
+    base_order = {key: i for i, key in enumerate(base)}
+    kept = [key for key in target if key in base_order]
+    stable = _stable_keys(base_order, kept)
+
+    removed = [key for key in base if key not in stable]
+    changed = {key: [base[key], target[key]] for key in stable if base[key] != target[key]}
+
+    added = []
+    anchor = None
+    for key, width in target.items():
+        if key in stable:
+            anchor = key
+        else:
+            added.append([anchor, key, width])
+
+    return {"removed": removed, "changed": changed, "added": added}
+
+
+def apply_table(base: dict[str, int], ops: dict) -> dict[str, int]:
+    """
+    Applies diff_table() output to a dataset map, reproducing the target's key order.
+
+    Args:
+        base (dict[str, int]): Old character → width map
+        ops (dict): Changes from diff_table()
+
+    Returns:
+        dict[str, int]: The new map
+    """
+    removed = set(ops["removed"])
+    inserts: dict[Optional[str], list[tuple[str, int]]] = {}
+    for anchor, key, width in ops["added"]:
+        inserts.setdefault(anchor, []).append((key, width))
+    changed = {key: new for key, (_, new) in ops["changed"].items()}
+
+    result = dict(inserts.get(None, ()))
+    for key, width in base.items():
+        if key in removed:
+            continue
+        result[key] = changed.get(key, width)
+        result.update(inserts.get(key, ()))
+    return result
+
+
+def _encode_like(data: dict[str, int], sha256: str) -> tuple[bytes, Optional[bool]]:
+    # Serializes a map in whichever output style (pretty or compact) reproduces the expected hash.
+    for compact in (False, True):
+        encoded = json_encoder(compact).encode(data).encode("utf-8")
+        if _sha256(encoded) == sha256:
+            return encoded, compact
+    return encoded, None
+
+
+def make_delta(base_ref: str, target_ref: str, out_dir: str, store: Optional[ArchiveStore] = None) -> dict:
+    """
+    Writes per-table patch files turning one snapshot's datasets into another's.
+
+    Each changed dataset gets `<name>.delta.json` (compact JSON) with its removed,
+    width-changed and added entries and the SHA-256 of its base and target files.
+    `delta.json` lists every table and carries the target's meta documents, whose
+    `hash` values apply_delta() checks the rebuilt files against. Other files under
+    current/ that are not dataset maps (the East_Asian_Width range table) are copied
+    whole into files/ when they change.
+
+    Args:
+        base_ref (str): "current" or an archive snapshot reference (see ArchiveStore.snapshot())
+        target_ref (str): Same, for the snapshot to produce
+        out_dir (str): Directory receiving the patch files
+        store (Optional[ArchiveStore]): Archive store; defaults to char_table/archive/store
+
+    Returns:
+        dict: The delta manifest written to out_dir/delta.json
+    """
+    base_tree = TreeReader(base_ref, store)
+    target_tree = TreeReader(target_ref, store)
+    base_sets = base_tree.datasets()
+    target_sets = target_tree.datasets()
+    target_metas = target_tree.metas()
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    manifest = {
+        "format": DELTA_FORMAT,
+        "from": base_tree.id,
+        "to": target_tree.id,
+        "tables": {},
+        "removed_tables": sorted(name for name in base_sets if name not in target_sets),
+        "files": target_tree.paths(),
+        "copied": {},
+        "meta": target_metas,
+    }
+    os.makedirs(out_dir, exist_ok=True)
+
+    for name, path in sorted(target_sets.items()):
+        target_bytes = target_tree.read(path)
+        base_bytes = base_tree.read(base_sets[name]) if name in base_sets else None
+        target_sha = _sha256(target_bytes)
+        entry = {
+            "path": path,
+            "from_sha256": _sha256(base_bytes) if base_bytes is not None else None,
+            "to_sha256": target_sha,
+        }
+
+        if base_bytes is not None and entry["from_sha256"] == target_sha and base_sets[name] == path:
+            manifest["tables"][name] = {**entry, "patch": None}
+            continue
+
+        base = json.loads(base_bytes) if base_bytes is not None else {}
+        target = json.loads(target_bytes)
+        ops = diff_table(base, target)
+        _, compact = _encode_like(target, target_sha)
+
+        patch = {"table": name, **entry, "compact": compact, **ops}
+        if compact is None:
+            # Not reproducible from entries (hand-edited layout): ship the file itself
+            patch["content"] = target_bytes.decode("utf-8")
+
+        patch_path = os.path.join(out_dir, f"{name}.delta.json")
+        with AtomicWriter(patch_path) as out:
+            out.write(encoder.encode(patch).encode("utf-8"))
+
+        manifest["tables"][name] = {
+            **entry,
+            "patch": os.path.basename(patch_path),
+            "added": len(ops["added"]),
+            "removed": len(ops["removed"]),
+            "changed": len(ops["changed"]),
+            "patch_bytes": out.result.size,
+        }
+
+    # Other files under current/ (e.g. unicode/east_asian_width.ranges.json) travel whole when changed
+    dataset_files = {WIDTH_TABLE}
+    for path in target_sets.values():
+        dataset_files.update((path, path.removesuffix(".json") + ".ranges.json"))
+    for path in target_tree.paths():
+        if not path.startswith(f"{CURRENT}/") or path in dataset_files:
+            continue
+        target_bytes = target_tree.read(path)
+        base_bytes = base_tree.read(path)
+        entry = {"sha256": _sha256(target_bytes), "patch": None}
+        if base_bytes is None or _sha256(base_bytes) != entry["sha256"]:
+            entry["patch"] = f"files/{path}"
+            with AtomicWriter(os.path.join(out_dir, "files", path)) as out:
+                out.write(target_bytes)
+        manifest["copied"][path] = entry
+
+    with AtomicWriter(os.path.join(out_dir, "delta.json")) as out:
+        out.write(json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"))
+    return manifest
+
+
+def _derived_files(name: str, path: str, data: dict[str, int], metas: dict[str, dict],
+                   categories: bool) -> Iterable[tuple[str, bytes, Optional[str]]]:
+    # Files generated from a dataset map: its .ranges.json copy and its category list.
+    # Yields (path, bytes, expected sha256 or None when the target has no meta for it).
+    ranges_meta = metas.get(f"{name}.ranges")
+    if ranges_meta is not None:
+        encoded, _ = _encode_like(ranges_payload(data), ranges_meta["hash"])
+        yield path.removesuffix(".json") + ".ranges.json", encoded, ranges_meta["hash"]
+    if categories:
+        yield f"categories/{name}.txt", "".join(ch + "\n" for ch in sorted(data)).encode("utf-8"), None
+
+
+def _width_table(datasets: dict[str, dict[str, int]]) -> bytes:
+    ranges = []
+    for data in datasets.values():
+        ranges.extend(ranges_from_pairs((ord(ch), width) for ch, width in data.items() if len(ch) == 1))
+    return build_two_stage_table(merge_ranges(ranges))
+
+
+def apply_delta(patch_dir: str, root: Optional[str] = None,
+                log: Callable[[str], None] = print) -> list[str]:
+    """
+    Rebuilds a target snapshot in place from its base files and a patch directory.
+
+    Every base dataset is checked against the patch's from_sha256 first. Each rebuilt
+    file (dataset JSON, .ranges.json copy, width_table.bin) must match the `hash`
+    of its target meta document, and files copied whole must match their SHA-256;
+    nothing is written unless every check passes. The
+    target meta files, and the category lists when the target has them, are written
+    alongside; base files that the target does not have are removed afterwards.
+
+    Args:
+        patch_dir (str): Directory written by make_delta()
+        root (Optional[str]): Output root holding current/, meta/, categories/ (default char_table/)
+        log (Callable[[str], None]): Progress sink
+
+    Returns:
+        list[str]: Paths (relative to the root) that were written
+
+    Raises:
+        DeltaError: If a base file or a rebuilt file does not have the expected hash
+    """
+    root = root or settings.output_dir
+    with open(os.path.join(patch_dir, "delta.json"), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest["format"] != DELTA_FORMAT:
+        raise DeltaError(f"Unsupported delta format {manifest['format']}")
+
+    base_tree = TreeReader(CURRENT, root=root)
+    base_sets = base_tree.datasets()
+    metas = manifest["meta"]
+    target_files = set(manifest["files"])
+    categories = any(path.startswith("categories/") for path in target_files)
+    outputs: dict[str, bytes] = {}
+    datasets: dict[str, dict[str, int]] = {}
+
+    for name, entry in manifest["tables"].items():
+        base_path = base_sets.get(name, entry["path"])
+        base_bytes = base_tree.read(base_path)
+        base_sha = _sha256(base_bytes) if base_bytes is not None else None
+        if base_sha != entry["from_sha256"]:
+            raise DeltaError(f"{base_path} does not match the patch base ({manifest['from']})")
+
+        if entry["patch"] is None:
+            data = json.loads(base_bytes)
+        else:
+            with open(os.path.join(patch_dir, entry["patch"]), "r", encoding="utf-8") as f:
+                patch = json.load(f)
+            if "content" in patch:
+                encoded = patch["content"].encode("utf-8")
+                data = json.loads(encoded)
+            else:
+                data = apply_table(json.loads(base_bytes) if base_bytes is not None else {}, patch)
+                encoded = json_encoder(patch["compact"]).encode(data).encode("utf-8")
+
+            expected = metas[name]["hash"] if name in metas else entry["to_sha256"]
+            if _sha256(encoded) != expected:
+                raise DeltaError(f"Rebuilt {entry['path']} does not match its meta hash")
+            outputs[entry["path"]] = encoded
+        datasets[name] = data
+
+        # Derived files are rebuilt for unchanged tables too, so a base missing them is completed
+        for path, derived, sha256 in _derived_files(name, entry["path"], data, metas, categories):
+            if sha256 is not None and _sha256(derived) != sha256:
+                raise DeltaError(f"Rebuilt {path} does not match its meta hash")
+            outputs[path] = derived
+
+    if "width_table" in metas:
+        table = _width_table(datasets)
+        if _sha256(table) != metas["width_table"]["hash"]:
+            raise DeltaError(f"Rebuilt {WIDTH_TABLE} does not match its meta hash")
+        outputs[WIDTH_TABLE] = table
+
+    for path, entry in manifest["copied"].items():
+        if entry["patch"] is None:
+            data = base_tree.read(path)
+        else:
+            with open(os.path.join(patch_dir, entry["patch"]), "rb") as f:
+                data = outputs[path] = f.read()
+        if data is None or _sha256(data) != entry["sha256"]:
+            raise DeltaError(f"{path} does not match its hash in the patch")
+
+    for name, meta in metas.items():
+        outputs[f"meta/{name}.meta.json"] = json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8")
+
+    for rel_path, data in outputs.items():
+        with AtomicWriter(os.path.join(root, rel_path)) as out:
+            out.write(data)
+    log(f"✅ Applied {manifest['from']} → {manifest['to']}: {len(outputs)} files verified and written")
+
+    # Files of removed tables, and derived files the target does not have
+    for rel_path in base_tree.paths():
+        if rel_path not in target_files:
+            path = os.path.join(root, rel_path)
+            os.remove(path)
+            log(f"🗑️  Removed {rel_path}")
+            if not os.listdir(os.path.dirname(path)):
+                os.rmdir(os.path.dirname(path))
+
+    return sorted(outputs)
@@ -1,21 +1,16 @@
-import requests
+import io
 
-from builder.core.version import major_minor
+from builder.core.source_cache import open_source
 
 
-def emoji_fetchers() -> list[str]:
+def open_emoji_test(version: str) -> io.TextIOWrapper:
     """
-    Automatically reads the Unicode version from VERSION.txt at the project root,
-    and fetches the corresponding emoji-test.txt from the official Unicode website.
+    Opens emoji-test.txt for a given major.minor emoji version as a line stream over the cached copy.
+
+    Args:
+        version (str): Emoji version, e.g. "16.0"
 
     Returns:
-        list[str]: A list of lines from the fetched emoji-test.txt file.
+        io.TextIOWrapper: UTF-8 text stream; iterate it for lines
     """
-    version = major_minor()
-
-    url = f"https://unicode.org/Public/emoji/{version}/emoji-test.txt"
-    print(f"🌐 Fetching emoji-test.txt from {url} ...")
-
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.text.splitlines()
+    return open_source(f"emoji/{version}/emoji-test.txt", version)
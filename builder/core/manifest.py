@@ -0,0 +1,211 @@
+import os
+import json
+import hashlib
+import threading
+import functools
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from builder.core.settings import settings
+from builder.core.version import read_version
+from builder.core.source_cache import cached_entry
+
+# Repository root: module files are resolved against it and manifest paths are relative to it.
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# Manifest file name, kept in the output root it describes.
+MANIFEST_FILE = ".build-manifest.json"
+
+# Top-level packages whose source files count as generator code.
+CODE_PACKAGES = ("builder", "char_table")
+
+
+@dataclass(frozen=True)
+class BuildTarget:
+    """
+    Describes what a generator reads and writes, for incremental builds.
+
+    Attributes:
+        modules (tuple[str, ...]): Modules the generator runs, e.g. ("builder.parser.emoji_parser",
+            "builder.writer.sinks"); they and every builder/char_table module they import
+            (transitively) are fingerprinted
+        outputs (tuple[str, ...]): Absolute paths the generator writes
+        sources (Callable[[], list[tuple[str, str]]]): Upstream (version, path) pairs read
+            through the source cache, resolved at build time
+        inputs (Callable[[], list[str]]): Absolute paths of local files the generator reads
+    """
+    modules: tuple[str, ...]
+    outputs: tuple[str, ...]
+    sources: Callable[[], list[tuple[str, str]]] = field(default=lambda: [])
+    inputs: Callable[[], list[str]] = field(default=lambda: [])
+
+
+def _module_path(name: str) -> Optional[str]:
+    # Resolved against the repository layout directly, so nothing gets imported.
+    base = os.path.join(ROOT_DIR, *name.split("."))
+    for path in (f"{base}.py", os.path.join(base, "__init__.py")):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _direct_imports(path: str) -> tuple[str, ...]:
+    # Imported here: only fingerprinting needs it, not every command that imports this module.
+    import ast
+
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    names: list[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.append(node.module)
+            names.extend(f"{node.module}.{alias.name}" for alias in node.names)
+    return tuple(n for n in names if n.split(".")[0] in CODE_PACKAGES)
+
+
+@functools.lru_cache(maxsize=None)
+def module_closure(name: str) -> tuple[str, ...]:
+    """
+    Collects the source files of a module and of every builder/char_table module it
+    imports, following imports transitively by parsing the source (nothing is executed).
+
+    Args:
+        name (str): Dotted module name
+
+    Returns:
+        tuple[str, ...]: Sorted absolute paths of the module files (cached for the process lifetime)
+    """
+    seen: dict[str, str] = {}
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        path = _module_path(current)
+        if path is None:
+            continue
+        seen[current] = path
+
+        # Importing a module also executes its parent packages' __init__ files.
+        parts = current.split(".")
+        pending.extend(".".join(parts[:i]) for i in range(1, len(parts)))
+        pending.extend(_direct_imports(path))
+
+    return tuple(sorted(set(seen.values())))
+
+
+def _file_digest(path: str) -> str:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return "<missing>"
+
+
+# Code files do not change during a run, so their digests are computed once.
+_code_digest = functools.lru_cache(maxsize=None)(_file_digest)
+
+
+def _hash_file(digest: "hashlib._Hash", path: str, file_digest: Callable[[str], str] = _file_digest) -> None:
+    digest.update(f"{os.path.relpath(path, ROOT_DIR)} {file_digest(path)}\0".encode("utf-8"))
+
+
+def fingerprint(target: BuildTarget) -> Optional[str]:
+    """
+    Fingerprints everything a generator's output depends on: the Unicode version being
+    built (VERSION.txt, or the matrix build's version), the output root and style, the
+    generator's code closure, its upstream source bytes (by cached content hash) and its
+    local inputs.
+
+    Args:
+        target (BuildTarget): Generator description
+
+    Returns:
+        Optional[str]: Hex SHA-256 fingerprint, or None if an upstream source is not cached
+            yet (the generator must then run to fetch it)
+    """
+    digest = hashlib.sha256()
+    digest.update(f"version={read_version()}\0".encode("utf-8"))
+    digest.update(f"output_dir={os.path.abspath(settings.output_dir)}\0".encode("utf-8"))
+    digest.update(f"compact={settings.compact}\0".encode("utf-8"))
+
+    closure = {path for module in target.modules for path in module_closure(module)}
+    for path in sorted(closure):
+        _hash_file(digest, path, _code_digest)
+
+    for version, rel_path in target.sources():
+        entry = cached_entry(version, rel_path)
+        if entry is None:
+            return None
+        digest.update(f"{version} {rel_path} {entry['sha256']}\0".encode("utf-8"))
+
+    for path in target.inputs():
+        _hash_file(digest, path)
+
+    return digest.hexdigest()
+
+
+def _relative_outputs(target: BuildTarget) -> list[str]:
+    return [os.path.relpath(p, ROOT_DIR) for p in target.outputs]
+
+
+class BuildManifest:
+    """
+    Records the fingerprint each generator was last built with, in <output root>/.build-manifest.json
+    (char_table/.build-manifest.json by default), so each output root has its own.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(settings.output_dir, MANIFEST_FILE)
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries: dict[str, dict] = json.load(f)
+        except FileNotFoundError:
+            self.entries = {}
+
+    def is_current(self, name: str, target: BuildTarget) -> bool:
+        """
+        Returns True if the generator's fingerprint is unchanged and it recorded exactly
+        the outputs it would write now, all of which still exist.
+        """
+        entry = self.entries.get(name)
+        if not entry or entry.get("outputs") != _relative_outputs(target):
+            return False
+        if not all(os.path.exists(p) for p in target.outputs):
+            return False
+        return entry["fingerprint"] == fingerprint(target)
+
+    def record(self, name: str, target: BuildTarget) -> None:
+        """
+        Stores the generator's current fingerprint after a successful build.
+        """
+        value = fingerprint(target)
+        with self._lock:
+            if value is None:
+                self.entries.pop(name, None)
+            else:
+                self.entries[name] = {
+                    "fingerprint": value,
+                    "outputs": _relative_outputs(target),
+                }
+            self._dirty = True
+
+    def save(self) -> None:
+        """
+        Writes the manifest if anything was recorded during this run.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
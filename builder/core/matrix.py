@@ -0,0 +1,100 @@
+import os
+import hashlib
+import contextlib
+from typing import Iterator, Optional
+
+from char_table.table import VERSIONS_DIR, version_key
+
+from builder.core.settings import settings
+
+# Directories whose files are shared between versions when identical; meta files record
+# the version and fetch time, so they always differ.
+SHARED_DIRS = ("current", "categories")
+
+
+def version_output_dir(version: str, root: Optional[str] = None) -> str:
+    """
+    Returns the output root of one Unicode version in a matrix build: <root>/versions/<version>/.
+
+    Args:
+        version (str): Full Unicode version, e.g. "15.1.0"
+        root (Optional[str]): Output root holding versions/; defaults to settings.output_dir
+    """
+    return os.path.join(root or settings.output_dir, VERSIONS_DIR, version)
+
+
+@contextlib.contextmanager
+def building_version(version: str, root: Optional[str] = None) -> Iterator[str]:
+    """
+    Points the build at one Unicode version for the duration of the block: read_version()
+    returns `version` and every writer targets its own output root. Source paths carry
+    the version, so all versions share one source cache.
+
+    Args:
+        version (str): Full Unicode version, e.g. "15.1.0"
+        root (Optional[str]): Output root holding versions/; defaults to settings.output_dir
+
+    Yields:
+        str: The version's output root
+    """
+    previous = settings.unicode_version, settings.output_dir
+    settings.unicode_version = version
+    settings.output_dir = version_output_dir(version, root)
+    try:
+        yield settings.output_dir
+    finally:
+        settings.unicode_version, settings.output_dir = previous
+
+
+def built_versions(root: Optional[str] = None) -> list[str]:
+    """
+    Lists the versions with an output root under <root>/versions/, oldest first.
+    """
+    versions_dir = os.path.join(root or settings.output_dir, VERSIONS_DIR)
+    if not os.path.isdir(versions_dir):
+        return []
+    return sorted(
+        (name for name in os.listdir(versions_dir) if os.path.isdir(os.path.join(versions_dir, name))),
+        key=version_key,
+    )
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def share_identical_files(root: Optional[str] = None) -> tuple[int, int]:
+    """
+    Hard-links every table that is byte-identical to the same file of an older version
+    (e.g. the curated punctuation map, or emoji tables of an unchanged emoji release),
+    so unchanged tables are stored once however many versions are built.
+
+    Links are swapped in atomically. Writers replace files by renaming, so rebuilding one
+    version later gives it a file of its own instead of modifying the shared one.
+
+    Args:
+        root (Optional[str]): Output root holding versions/; defaults to settings.output_dir
+
+    Returns:
+        tuple[int, int]: Files linked by this call, and the bytes they no longer duplicate
+    """
+    first: dict[tuple[str, str], str] = {}
+    linked = saved = 0
+    for version in built_versions(root):
+        version_dir = version_output_dir(version, root)
+        for subdir in SHARED_DIRS:
+            for dir_path, dir_names, file_names in os.walk(os.path.join(version_dir, subdir)):
+                dir_names.sort()
+                for file_name in sorted(file_names):
+                    path = os.path.join(dir_path, file_name)
+                    key = (os.path.relpath(path, version_dir), _file_digest(path))
+                    original = first.setdefault(key, path)
+                    if original == path or os.path.samefile(original, path):
+                        continue
+                    tmp_path = f"{path}.{os.getpid()}.link"
+                    os.link(original, tmp_path)
+                    os.replace(tmp_path, path)
+                    linked += 1
+                    saved += os.path.getsize(path)
+    return linked, saved
@@ -0,0 +1,41 @@
+import threading
+import functools
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def shared(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Thread-safe memoization for expensive shared inputs (downloads, parses).
+
+    The first caller for a given set of positional arguments computes the value;
+    concurrent callers with the same arguments block until it is ready and then
+    reuse it, so a source consumed by several generators is fetched once per run.
+
+    Args:
+        func (Callable[..., T]): Function with hashable positional arguments
+
+    Returns:
+        Callable[..., T]: Memoized wrapper exposing `cache_clear()`
+    """
+    cache: dict[tuple, T] = {}
+    locks: dict[tuple, threading.Lock] = {}
+    guard = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        with guard:
+            lock = locks.setdefault(args, threading.Lock())
+        with lock:
+            if args not in cache:
+                cache[args] = func(*args)
+            return cache[args]
+
+    def cache_clear() -> None:
+        with guard:
+            cache.clear()
+            locks.clear()
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
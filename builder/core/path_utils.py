@@ -1,5 +1,22 @@
 import os
 
+from builder.core.settings import settings
+
+
+# Path resolution is pure: nothing here creates directories. AtomicWriter creates the
+# parent directory of each file when it is actually written.
+def resolve_output_dir(subdir: str) -> str:
+    """
+    Returns an output directory under the configured output root (char_table/ by default).
+
+    Args:
+        subdir (str): Directory name under the root, e.g. "current", "meta"
+
+    Returns:
+        str: Absolute path to <output root>/<subdir>
+    """
+    return os.path.abspath(os.path.join(settings.output_dir, subdir))
+
 
 def resolve_current_path(rel_path: str) -> str:
     """
@@ -9,11 +26,9 @@ def resolve_current_path(rel_path: str) -> str:
         rel_path (str): Relative subpath under current/, e.g. "emoji/emoji_base.json"
 
     Returns:
-        str: Absolute path to char_table/current/<rel_path>, with directories created if needed
+        str: Absolute path to char_table/current/<rel_path>
     """
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    full_path = os.path.abspath(os.path.join(base_dir, "..", "..", "char_table", "current", rel_path))
-    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    full_path = os.path.abspath(os.path.join(settings.output_dir, "current", rel_path))
     return full_path
 
 
@@ -25,11 +40,9 @@ def resolve_meta_path(name: str) -> str:
         name (str): Dataset name without file extension, e.g. "emoji_base"
 
     Returns:
-        str: Absolute path to char_table/meta/<name>.meta.json, with directories created if needed
+        str: Absolute path to char_table/meta/<name>.meta.json
     """
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    full_path = os.path.abspath(os.path.join(base_dir, "..", "..", "char_table", "meta", f"{name}.meta.json"))
-    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    full_path = os.path.abspath(os.path.join(settings.output_dir, "meta", f"{name}.meta.json"))
     return full_path
 
 
@@ -41,9 +54,7 @@ def resolve_category_path(name: str) -> str:
         name (str): Dataset name without file extension, e.g. "emoji_base"
 
     Returns:
-        str: Absolute path to char_table/categories/<name>.txt, with directories created if needed
+        str: Absolute path to char_table/categories/<name>.txt
     """
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    full_path = os.path.abspath(os.path.join(base_dir, "..", "..", "char_table", "categories", f"{name}.txt"))
-    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    full_path = os.path.abspath(os.path.join(settings.output_dir, "categories", f"{name}.txt"))
     return full_path
@@ -0,0 +1,93 @@
+import os
+import time
+from typing import Callable, Optional
+
+from builder.core.trace import stage
+from builder.core.manifest import BuildManifest, BuildTarget
+
+# One stage maps generator names to their generate() callables.
+# Stages run in order; generators within a stage are independent of each other.
+Stage = dict[str, Callable[[], None]]
+
+
+def default_jobs() -> int:
+    """
+    Returns the default worker count: one per CPU.
+    """
+    return os.cpu_count() or 1
+
+
+def _run_one(name: str, generate: Callable[[], None], target: Optional[BuildTarget],
+             manifest: Optional[BuildManifest], force: bool) -> None:
+    if manifest is not None and target is not None:
+        if not force and manifest.is_current(name, target):
+            print(f"⏭️  {name} is up to date")
+            return
+        with stage(name, "generator"):
+            generate()
+        manifest.record(name, target)
+        return
+    with stage(name, "generator"):
+        generate()
+
+
+def run_stages(stages: list[Stage], jobs: int = 1, targets: Optional[dict[str, BuildTarget]] = None,
+               manifest: Optional[BuildManifest] = None, force: bool = False) -> list[str]:
+    """
+    Runs generator stages in order, executing the generators of each stage
+    concurrently on a thread pool of `jobs` workers.
+
+    Shared upstream sources are memoized (see builder/core/memo.py), so generators
+    reading the same file wait on a single fetch and parse instead of repeating it.
+    Threads rather than processes are used so that memoized sources are visible to
+    every generator; the heavy lifting (network I/O, hashing, file writes) releases
+    the GIL.
+
+    With a manifest, a generator whose fingerprint (see builder/core/manifest.py)
+    is unchanged and whose outputs all exist is skipped without writing anything,
+    unless `force` is set.
+
+    Args:
+        stages (list[Stage]): Ordered stages of independent generators
+        jobs (int): Maximum number of generators running at once
+        targets (Optional[dict[str, BuildTarget]]): Inputs/outputs per generator name
+        manifest (Optional[BuildManifest]): Fingerprints from previous builds; None disables skipping
+        force (bool): Rebuild even when fingerprints match
+
+    Returns:
+        list[str]: Names of generators that raised; empty when everything succeeded
+    """
+    targets = targets or {}
+    failed: list[str] = []
+    start = time.perf_counter()
+
+    for step in stages:
+        if jobs <= 1 or len(step) <= 1:
+            for name, generate in step.items():
+                try:
+                    _run_one(name, generate, targets.get(name), manifest, force)
+                except Exception as exc:
+                    print(f"❌ {name} failed: {exc}")
+                    failed.append(name)
+            continue
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="gen") as pool:
+            futures = {
+                pool.submit(_run_one, name, generate, targets.get(name), manifest, force): name
+                for name, generate in step.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                except Exception as exc:
+                    print(f"❌ {name} failed: {exc}")
+                    failed.append(name)
+
+    if manifest is not None:
+        manifest.save()
+
+    print(f"⏱️  Finished in {time.perf_counter() - start:.2f}s")
+    return failed
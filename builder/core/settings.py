@@ -0,0 +1,62 @@
+import os
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+def _default_cache_dir() -> str:
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    return os.environ.get("CHAR_TABLE_CACHE_DIR") or os.path.join(base_dir, "char_table", ".cache")
+
+
+def _default_output_dir() -> str:
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    return os.environ.get("CHAR_TABLE_OUTPUT_DIR") or os.path.join(base_dir, "char_table")
+
+
+@dataclass
+class BuildSettings:
+    """
+    Process-wide build options, filled from CLI flags by builder/gen_datasets.py.
+
+    Attributes:
+        offline (bool): Never touch the network; build only from cached or mirrored sources
+        cache_dir (str): Root of the on-disk source cache (env: CHAR_TABLE_CACHE_DIR)
+        mirror_dir (Optional[str]): Local mirror laid out like base_url (env: CHAR_TABLE_MIRROR)
+        base_url (str): Upstream root that source paths are resolved against
+        timeout (float): Per-request network timeout in seconds
+        retries (int): Attempts per download before falling back to the cache
+        output_dir (str): Root that current/, meta/ and categories/ are written under (env: CHAR_TABLE_OUTPUT_DIR)
+        compact (bool): Write dataset JSON with minimal separators and no indentation
+        unicode_version (Optional[str]): Unicode release to build instead of the one in VERSION.txt
+            (set per version by matrix builds, see builder/core/matrix.py)
+    """
+    offline: bool = False
+    cache_dir: str = field(default_factory=_default_cache_dir)
+    mirror_dir: Optional[str] = field(default_factory=lambda: os.environ.get("CHAR_TABLE_MIRROR"))
+    base_url: str = "https://unicode.org/Public"
+    timeout: float = 30.0
+    retries: int = 3
+    output_dir: str = field(default_factory=_default_output_dir)
+    compact: bool = False
+    unicode_version: Optional[str] = None
+
+
+settings = BuildSettings()
+
+
+def configure(**changes) -> BuildSettings:
+    """
+    Updates the process-wide build settings; None values leave a field unchanged.
+
+    Args:
+        **changes: BuildSettings field names and their new values
+
+    Returns:
+        BuildSettings: The updated settings object
+    """
+    for name, value in changes.items():
+        if not hasattr(settings, name):
+            raise AttributeError(f"Unknown build setting: {name}")
+        if value is not None:
+            setattr(settings, name, value)
+    return settings
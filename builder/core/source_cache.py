@@ -0,0 +1,237 @@
+import os
+import io
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from builder.core.settings import settings
+from builder.core.trace import annotate, traced
+
+# Download and copy granularity; bounds the memory held per source while caching it.
+CHUNK_SIZE = 64 * 1024
+
+
+class SourceUnavailableError(RuntimeError):
+    """
+    Raised when an upstream source can be neither downloaded nor found in the cache or mirror.
+    """
+
+
+_index_lock = threading.Lock()
+
+
+def source_url(rel_path: str) -> str:
+    """
+    Resolves a source path such as "emoji/16.0/emoji-test.txt" against the configured upstream root.
+    """
+    return f"{settings.base_url.rstrip('/')}/{rel_path}"
+
+
+def cache_key(version: str, rel_path: str) -> str:
+    """
+    Returns the index key for a source: Unicode version plus its path under the upstream root.
+    """
+    return f"{version} {rel_path}"
+
+
+def _index_path() -> str:
+    return os.path.join(settings.cache_dir, "index.json")
+
+
+def _blob_path(digest: str) -> str:
+    return os.path.join(settings.cache_dir, "blobs", digest[:2], digest)
+
+
+def _load_index() -> dict[str, dict]:
+    try:
+        with open(_index_path(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _store(key: str, chunks: Iterable[bytes], etag: Optional[str], last_modified: Optional[str]) -> str:
+    # Streams chunks to a temp file while hashing, then files the blob under its digest.
+    # Content-addressed: identical bytes under different keys share one blob.
+    tmp_dir = os.path.join(settings.cache_dir, "blobs")
+    os.makedirs(tmp_dir, exist_ok=True)
+    tmp_path = os.path.join(tmp_dir, f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+    hasher = hashlib.sha256()
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in chunks:
+                hasher.update(chunk)
+                f.write(chunk)
+            size = f.tell()
+    except BaseException:
+        # A stream that fails midway (e.g. a truncated download) leaves no partial blob behind
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    annotate(bytes_read=size, bytes_written=size)
+
+    digest = hasher.hexdigest()
+    blob_path = _blob_path(digest)
+    if os.path.exists(blob_path):
+        os.remove(tmp_path)
+    else:
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        os.replace(tmp_path, blob_path)
+
+    with _index_lock:
+        index = _load_index()
+        index[key] = {
+            "sha256": digest,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
+        }
+        index_tmp = f"{_index_path()}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(index_tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+        os.replace(index_tmp, _index_path())
+
+    return blob_path
+
+
+def cached_entry(version: str, rel_path: str) -> Optional[dict]:
+    """
+    Returns the cache index entry for a source if its blob is present, without any network access.
+
+    Args:
+        version (str): Unicode version the source belongs to
+        rel_path (str): Path under the upstream root, e.g. "emoji/16.0/emoji-test.txt"
+
+    Returns:
+        Optional[dict]: Entry with "sha256", "etag", "last_modified" and "fetched", or None
+    """
+    with _index_lock:
+        entry = _load_index().get(cache_key(version, rel_path))
+    if entry and os.path.exists(_blob_path(entry["sha256"])):
+        return entry
+    return None
+
+
+def cached_path(version: str, rel_path: str) -> Optional[str]:
+    """
+    Returns the path of the cached blob for a source, or None if it has not been cached.
+    """
+    entry = cached_entry(version, rel_path)
+    return _blob_path(entry["sha256"]) if entry else None
+
+
+def _iter_file(path: str) -> Iterable[bytes]:
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+def _mirror_path(rel_path: str) -> Optional[str]:
+    if not settings.mirror_dir:
+        return None
+    path = os.path.join(settings.mirror_dir, *rel_path.split("/"))
+    return path if os.path.exists(path) else None
+
+
+def _download(url: str, key: str, entry: Optional[dict]) -> Optional[str]:
+    # Returns the blob path of a fresh download, or None when the server answered 304.
+    import requests  # imported lazily so offline and cached builds work without it
+
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    last_error: Optional[Exception] = None
+    for attempt in range(settings.retries):
+        try:
+            with requests.get(url, headers=headers, timeout=settings.timeout, stream=True) as response:
+                if response.status_code == 304:
+                    return None
+                if response.status_code >= 500:
+                    raise requests.HTTPError(f"{response.status_code} Server Error for url: {url}")
+                response.raise_for_status()
+                return _store(
+                    key,
+                    response.iter_content(chunk_size=CHUNK_SIZE),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                )
+        except requests.RequestException as exc:
+            # Includes errors raised while streaming the body (ChunkedEncodingError, ContentDecodingError)
+            last_error = exc
+            status = getattr(getattr(exc, "response", None), "status_code", None)
+            if status is not None and 400 <= status < 500:
+                break
+            if attempt + 1 < settings.retries:
+                time.sleep(0.5 * 2 ** attempt)
+
+    raise SourceUnavailableError(f"Failed to fetch {url}: {last_error}")
+
+
+@traced("fetch")
+def ensure_source(rel_path: str, version: str) -> str:
+    """
+    Makes sure an upstream source is in the on-disk cache and returns the cached blob's path.
+
+    Online, a cached copy is revalidated with If-None-Match / If-Modified-Since and
+    reused on 304; downloads are streamed to disk in chunks, and a failed download
+    falls back to the cache, then the mirror. Offline (settings.offline), only the
+    cache and the local mirror are consulted.
+
+    Args:
+        rel_path (str): Path under the upstream root, e.g. "emoji/16.0/emoji-test.txt"
+        version (str): Unicode version the source belongs to (part of the cache key)
+
+    Returns:
+        str: Absolute path of the cached blob
+
+    Raises:
+        SourceUnavailableError: If the source is not reachable and not cached or mirrored
+    """
+    key = cache_key(version, rel_path)
+    entry = cached_entry(version, rel_path)
+    url = source_url(rel_path)
+    annotate(source=rel_path)
+
+    if settings.offline:
+        if entry:
+            print(f"📦 Using cached {rel_path} ({entry['sha256'][:12]})")
+            return _blob_path(entry["sha256"])
+        mirror_path = _mirror_path(rel_path)
+        if mirror_path:
+            print(f"📦 Using mirrored {rel_path}")
+            return _store(key, _iter_file(mirror_path), None, None)
+        raise SourceUnavailableError(f"{rel_path} is not cached or mirrored (offline mode)")
+
+    print(f"🌐 Fetching {url} ...")
+    try:
+        blob_path = _download(url, key, entry)
+    except SourceUnavailableError as exc:
+        if entry:
+            print(f"⚠️  {exc}; using cached copy")
+            return _blob_path(entry["sha256"])
+        mirror_path = _mirror_path(rel_path)
+        if mirror_path:
+            print(f"⚠️  {exc}; using mirrored copy")
+            return _store(key, _iter_file(mirror_path), None, None)
+        raise
+
+    if blob_path is None:
+        print(f"📦 {rel_path} not modified; using cached copy")
+        return _blob_path(entry["sha256"])
+    return blob_path
+
+
+def open_source(rel_path: str, version: str) -> io.TextIOWrapper:
+    """
+    Opens an upstream source as a UTF-8 text stream over the cached blob (see ensure_source()),
+    so callers can iterate lines without materializing the whole file.
+    """
+    return open(ensure_source(rel_path, version), "r", encoding="utf-8")
@@ -0,0 +1,298 @@
+import io
+import os
+import sys
+import json
+import time
+import threading
+import functools
+import itertools
+import contextlib
+from fnmatch import fnmatch
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, TypeVar
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+if TYPE_CHECKING:
+    import cProfile
+
+T = TypeVar("T")
+
+# Counters that add up when a stage annotates them more than once.
+COUNTERS = ("bytes_read", "bytes_written", "entries")
+
+# Lines of cumulative-time statistics printed for each profiled stage.
+PROFILE_TOP = 15
+
+
+def peak_rss_mb() -> float:
+    """
+    Returns the peak resident set size of the current process in MB (0.0 where unsupported).
+
+    Prefers Linux's VmHWM, which starts fresh at exec; ru_maxrss is inherited from
+    the parent across fork and exec, so a child spawned by a large process would
+    report the parent's peak.
+    """
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class Tracer:
+    """
+    Collects one event per finished stage of a build and writes them as a trace file.
+
+    Disabled by default, in which case stages cost a flag check. builder/gen_datasets.py
+    enables it when --trace or --profile is given and writes the events out at the end.
+
+    Attributes:
+        enabled (bool): Whether stages are recorded
+        profile_patterns (tuple[str, ...]): Stage-name globs to run under cProfile
+        profile_dir (Optional[str]): Where .prof files go; defaults to the trace directory
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.profile_patterns: tuple[str, ...] = ()
+        self.profile_dir: Optional[str] = None
+        self.events: list[dict] = []
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+
+    def start(self, profile_patterns: tuple[str, ...] = (), profile_dir: Optional[str] = None) -> None:
+        """
+        Enables recording and resets the event list and the time origin.
+
+        Args:
+            profile_patterns (tuple[str, ...]): Stage-name globs to profile, e.g. ("write_*",)
+            profile_dir (Optional[str]): Directory for .prof files
+        """
+        with self._lock:
+            self.events = []
+            self.origin = time.perf_counter()
+        self.profile_patterns = tuple(profile_patterns)
+        self.profile_dir = profile_dir
+        self.enabled = True
+
+    def stack(self) -> list[dict]:
+        # Open stages of the calling thread, innermost last.
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def wants_profile(self, name: str) -> bool:
+        # cProfile cannot nest, so only the outermost matching stage of a thread is profiled.
+        if getattr(self._local, "profiling", False):
+            return False
+        return any(fnmatch(name, pattern) for pattern in self.profile_patterns)
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def add(self, event: dict) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def write(self, path: str) -> str:
+        """
+        Writes the recorded events, as Chrome trace JSON for a .json path or JSON lines otherwise.
+
+        Chrome traces open in chrome://tracing or https://ui.perfetto.dev; JSON lines
+        hold one stage per line and suit jq or pandas.
+
+        Args:
+            path (str): Output file, e.g. "build.jsonl" or "build.json"
+
+        Returns:
+            str: The absolute path of the written file
+        """
+        path = os.path.abspath(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["start_s"])
+
+        with open(path, "w", encoding="utf-8") as f:
+            if path.endswith(".json"):
+                json.dump(chrome_trace(events), f, ensure_ascii=False)
+            else:
+                for event in events:
+                    f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+        print(f"🧭 Trace written: {path} ({len(events)} stages)")
+        return path
+
+
+tracer = Tracer()
+
+
+def chrome_trace(events: list[dict]) -> dict:
+    """
+    Converts trace events to the Chrome trace event format (complete "X" events in µs).
+
+    Args:
+        events (list[dict]): Events as recorded by stage()
+
+    Returns:
+        dict: {"traceEvents": [...]} with one thread-name record per thread
+    """
+    threads = {name: tid for tid, name in enumerate(dict.fromkeys(e["thread"] for e in events), 1)}
+    trace = [
+        {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+        for name, tid in threads.items()
+    ]
+    for event in events:
+        args = {k: v for k, v in event.items() if k not in ("name", "cat", "thread", "start_s", "wall_s")}
+        trace.append({
+            "name": event["name"],
+            "cat": event["cat"],
+            "ph": "X",
+            "ts": round(event["start_s"] * 1e6, 1),
+            "dur": round(event["wall_s"] * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": threads[event["thread"]],
+            "args": args,
+        })
+    return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+
+def _dump_profile(profiler: "cProfile.Profile", name: str, fields: dict) -> None:
+    # Saves the profile as <stage>[.<label>...].prof and prints its hottest entries.
+    import pstats
+
+    label = ".".join([name, *(v for v in fields.values() if isinstance(v, str))])
+    profile_dir = tracer.profile_dir or os.getcwd()
+    os.makedirs(profile_dir, exist_ok=True)
+    path = os.path.join(profile_dir, f"{label}.prof")
+    profiler.dump_stats(path)
+
+    report = io.StringIO()
+    pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(PROFILE_TOP)
+    print(f"🔬 Profile of {label} written: {path}\n{report.getvalue()}")
+
+
+@contextlib.contextmanager
+def stage(name: str, category: str = "stage", **labels) -> Iterator[dict]:
+    """
+    Measures one build stage: wall time, CPU time of the running thread, memory and
+    whatever counters the stage reports through annotate().
+
+    Memory is process-wide: `process_peak_rss_mb` is the process's high-water mark when
+    the stage ends, and `peak_rss_growth_mb` how far the stage raised it (0 when the
+    stage stayed below an earlier peak). Stages running on other threads at the same
+    time share both numbers.
+
+    Stages nest per thread; each event records its parent's id so the trace can be
+    folded back into a tree. Stages matching a --profile glob also run under cProfile.
+
+    Args:
+        name (str): Stage name, e.g. "write_current_json"
+        category (str): Coarse grouping: "generator", "fetch", "parse" or "write"
+        **labels: Extra fields stored on the event, e.g. dataset="cjk_unified"
+
+    Yields:
+        dict: The event's mutable fields; annotate() updates the innermost one
+    """
+    if not tracer.enabled:
+        yield {}
+        return
+
+    stack = tracer.stack()
+    fields = dict.fromkeys(COUNTERS, 0)
+    fields.update(labels)
+    fields["id"] = tracer.next_id()
+    fields["parent"] = stack[-1]["id"] if stack else None
+    stack.append(fields)
+
+    profiler = None
+    if tracer.wants_profile(name):
+        # Imported on demand: only --profile runs pay for cProfile and pstats.
+        import cProfile
+
+        profiler = cProfile.Profile()
+        tracer._local.profiling = True
+        profiler.enable()
+
+    start_peak = peak_rss_mb()
+    wall = time.perf_counter()
+    cpu = time.thread_time()
+    try:
+        yield fields
+    finally:
+        cpu = time.thread_time() - cpu
+        end = time.perf_counter()
+        if profiler is not None:
+            profiler.disable()
+            tracer._local.profiling = False
+            _dump_profile(profiler, name, fields)
+        stack.pop()
+        peak = peak_rss_mb()
+
+        tracer.add({
+            "name": name,
+            "cat": category,
+            "thread": threading.current_thread().name,
+            "start_s": round(wall - tracer.origin, 6),
+            "wall_s": round(end - wall, 6),
+            "cpu_s": round(cpu, 6),
+            "process_peak_rss_mb": round(peak, 2),
+            "peak_rss_growth_mb": round(max(0.0, peak - start_peak), 2),
+            **fields,
+        })
+
+
+def annotate(**values) -> None:
+    """
+    Adds counters or labels to the innermost open stage of the calling thread.
+
+    Counters (bytes_read, bytes_written, entries) accumulate; anything else is set.
+    Without an open stage, or with tracing disabled, this does nothing.
+
+    Args:
+        **values: e.g. bytes_written=1024, entries=97680, dataset="cjk_unified"
+    """
+    if not tracer.enabled:
+        return
+    stack = tracer.stack()
+    if not stack:
+        return
+    fields = stack[-1]
+    for key, value in values.items():
+        if key in COUNTERS:
+            fields[key] += value
+        else:
+            fields[key] = value
+
+
+def traced(category: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decorator running every call of a function as a stage named after the function.
+
+    Args:
+        category (str): Stage category, e.g. "write"
+
+    Returns:
+        Callable: Decorator preserving the wrapped function's signature
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with stage(func.__name__, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
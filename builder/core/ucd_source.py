@@ -0,0 +1,42 @@
+import io
+
+from builder.core.source_cache import open_source
+
+# UCD files read by the builders, relative to <version>/ucd/ on the upstream root.
+EAST_ASIAN_WIDTH = "EastAsianWidth.txt"
+EMOJI_DATA = "emoji/emoji-data.txt"
+
+
+def ucd_path(name: str, version: str) -> str:
+    """
+    Returns the upstream path of a UCD file, e.g. "16.0.0/ucd/EastAsianWidth.txt".
+
+    Args:
+        name (str): File under the ucd/ directory, e.g. EAST_ASIAN_WIDTH
+        version (str): Full Unicode version from VERSION.txt, e.g. "16.0.0"
+
+    Returns:
+        str: Path under the upstream root (settings.base_url)
+    """
+    return f"{version}/ucd/{name}"
+
+
+def ucd_url(name: str, version: str) -> str:
+    """
+    Returns the canonical unicode.org URL of a UCD file, as recorded in metadata.
+    """
+    return f"https://unicode.org/Public/{ucd_path(name, version)}"
+
+
+def open_ucd(name: str, version: str) -> io.TextIOWrapper:
+    """
+    Opens a UCD file as a line stream over the cached copy (see builder/core/source_cache.py).
+
+    Args:
+        name (str): File under the ucd/ directory, e.g. EAST_ASIAN_WIDTH
+        version (str): Full Unicode version, e.g. "16.0.0"
+
+    Returns:
+        io.TextIOWrapper: UTF-8 text stream; iterate it for lines
+    """
+    return open_source(ucd_path(name, version), version)
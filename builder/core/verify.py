@@ -0,0 +1,261 @@
+import os
+import re
+import json
+import mmap
+import zlib
+import struct
+import hashlib
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+from char_table.mmap_table import BLOCK_SIZE, HEADER, UNCOVERED
+
+from builder.core.archive_store import SNAPSHOT_DIRS, ArchiveStore, Snapshot
+
+# Data file suffixes tried for a meta name, in order: "cjk_unified" → current/cjk/cjk_unified.json,
+# "cjk_unified.ranges" → .ranges.json, "emoji_base.bin" → emoji_base.bin,
+# "width_table" → width_table.bin, "east_asian_width" → east_asian_width.ranges.json.
+DATA_SUFFIXES = (".json", "", ".bin", ".ranges.json")
+
+# A JSON object key: a string followed by a colon (escaped quotes stay inside the string).
+_KEY = re.compile(rb'"(?:[^"\\]|\\.)*"\s*:')
+
+# A [start, end, width] triple of a .ranges.json file; East_Asian_Width class triples end in a string.
+_RANGE = re.compile(rb"\[\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\]")
+
+# Line ends of a category list (mmap has no count()).
+_LINE = re.compile(rb"\n")
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    """
+    One failed check.
+
+    Attributes:
+        path (str): File under the output root, prefixed with "<snapshot id>:" for archived files
+        check (str): "hash", "entry_count", "size", "missing" or "unlisted"
+        expected (str): Recorded value
+        actual (str): Value found on disk
+    """
+    path: str
+    check: str
+    expected: str
+    actual: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.check} expected {self.expected}, found {self.actual}"
+
+
+def _count_leaf_runs(buf, index_end: int, block_count: int, leaf_count: int) -> int:
+    # Ranges in a two-stage table: maximal runs of equal covered values across the codespace.
+    # Each distinct leaf is scanned once; runs that continue into the next block are joined.
+    index = struct.unpack_from(f"<{block_count}H", buf, HEADER.size)
+    leaves = []
+    for leaf in range(leaf_count):
+        values = buf[index_end + leaf * BLOCK_SIZE:index_end + (leaf + 1) * BLOCK_SIZE]
+        runs = sum(1 for i, v in enumerate(values) if v != UNCOVERED and (i == 0 or v != values[i - 1]))
+        leaves.append((runs, values[0], values[-1]))
+
+    total, previous = 0, UNCOVERED
+    for leaf in index:
+        runs, first, last = leaves[leaf]
+        total += runs - (first != UNCOVERED and first == previous)
+        previous = last
+    return total
+
+
+def count_entries(rel_path: str, buf) -> Optional[int]:
+    """
+    Counts the entries of a data file the way its writer counted them for the meta file,
+    by scanning the bytes; no dict is built.
+
+    - dataset .json: keys of the flat {char: width} object
+    - .ranges.json: numeric [start, end, width] triples plus keys under "sequences"
+    - .bin: ranges of the two-stage table (runs of equal width among covered code points)
+    - categories .txt: lines
+
+    Args:
+        rel_path (str): Path under the output root, e.g. "current/cjk/cjk_unified.json"
+        buf: bytes, or an mmap of the file
+
+    Returns:
+        Optional[int]: Entry count, or None for a file kind without one
+    """
+    if rel_path.endswith(".txt"):
+        return len(_LINE.findall(buf))
+    if rel_path.endswith(".ranges.json"):
+        sequences = buf.find(b'"sequences"')
+        keys = len(_KEY.findall(buf, sequences)) - 1 if sequences >= 0 else 0
+        return len(_RANGE.findall(buf)) + keys
+    if rel_path.endswith(".json"):
+        return len(_KEY.findall(buf))
+    if rel_path.endswith(".bin") and len(buf) >= HEADER.size:
+        _, _, _, block_count, leaf_count = HEADER.unpack_from(buf)
+        return _count_leaf_runs(buf, HEADER.size + 2 * block_count, block_count, leaf_count)
+    return None
+
+
+def _inspect_file(root: str, rel_path: str) -> tuple[str, Optional[int]]:
+    # SHA-256 and entry count of one file, read through a read-only mapping.
+    # hashlib releases the GIL on the mapped buffer, so files hash in parallel.
+    with open(os.path.join(root, rel_path), "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256(b"").hexdigest(), count_entries(rel_path, b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return hashlib.sha256(buf).hexdigest(), count_entries(rel_path, buf)
+
+
+def check_files(label: str, files: dict[str, tuple[str, Optional[int]]],
+                read_meta: Callable[[str], dict]) -> tuple[int, list[Mismatch]]:
+    """
+    Checks every data file against its meta file.
+
+    Each meta/<name>.meta.json is matched to a file under current/ (see DATA_SUFFIXES),
+    whose SHA-256 and entry count must equal the recorded `hash` and `entry_count`.
+    categories/<name>.txt must have one line per entry of the <name> dataset. A file
+    under current/ or categories/ without a meta file is reported as unlisted.
+
+    Args:
+        label (str): Prefix for reported paths, e.g. a snapshot id; "" for the working tree
+        files (dict[str, tuple[str, Optional[int]]]): Path under the root → (SHA-256, entry count)
+        read_meta (Callable[[str], dict]): Loads a meta file by its path under the root
+
+    Returns:
+        tuple[int, list[Mismatch]]: Number of files checked, and the failed checks
+    """
+    by_name = {
+        os.path.basename(path): path
+        for path in files if path.startswith("current/")
+    }
+    metas = {
+        os.path.basename(path).removesuffix(".meta.json"): path
+        for path in files if path.startswith("meta/") and path.endswith(".meta.json")
+    }
+    prefix = f"{label}:" if label else ""
+    mismatches: list[Mismatch] = []
+    listed: set[str] = set()
+
+    def compare(path: str, check: str, expected, actual) -> None:
+        if expected != actual:
+            mismatches.append(Mismatch(f"{prefix}{path}", check, str(expected), str(actual)))
+
+    for name, meta_path in sorted(metas.items()):
+        meta = read_meta(meta_path)
+        data_path = next((by_name[f"{name}{s}"] for s in DATA_SUFFIXES if f"{name}{s}" in by_name), None)
+        if data_path is None:
+            compare(meta_path, "missing", "a data file under current/", "none")
+            continue
+        listed.add(data_path)
+        sha256, entry_count = files[data_path]
+        compare(data_path, "hash", meta.get("hash"), sha256)
+        compare(data_path, "entry_count", meta.get("entry_count"), entry_count)
+
+        text_path = f"categories/{name}.txt"
+        if text_path in files:
+            listed.add(text_path)
+            compare(text_path, "entry_count", meta.get("entry_count"), files[text_path][1])
+
+    for path in sorted(set(files) - listed):
+        if not path.startswith("meta/"):
+            compare(path, "unlisted", "a meta file", "none")
+    return len(listed) + len(metas), mismatches
+
+
+def _tree_files(root: str) -> list[str]:
+    paths = []
+    for subdir in SNAPSHOT_DIRS:
+        for dir_path, dir_names, file_names in os.walk(os.path.join(root, subdir)):
+            dir_names.sort()
+            paths.extend(
+                os.path.relpath(os.path.join(dir_path, name), root).replace(os.sep, "/")
+                for name in sorted(file_names)
+            )
+    return paths
+
+
+def verify_tree(root: str, jobs: int = 1) -> tuple[int, list[Mismatch]]:
+    """
+    Verifies current/ and categories/ under an output root against meta/.
+
+    Files are hashed through mmap on a pool of `jobs` threads.
+
+    Args:
+        root (str): Output root, e.g. char_table/
+        jobs (int): Worker threads
+
+    Returns:
+        tuple[int, list[Mismatch]]: Number of files checked, and the failed checks
+    """
+    paths = _tree_files(root)
+    with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="verify") as pool:
+        results = pool.map(lambda path: _inspect_file(root, path), paths)
+        files = dict(zip(paths, results))
+
+    def read_meta(path: str) -> dict:
+        with open(os.path.join(root, path), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    return check_files("", files, read_meta)
+
+
+def verify_archive(store: ArchiveStore, jobs: int = 1,
+                   snapshots: Optional[Iterable[Snapshot]] = None) -> tuple[int, list[Mismatch]]:
+    """
+    Verifies an archive store: every blob must decompress to its recorded digest and
+    size, and every snapshot's files must match the snapshot's own meta files.
+
+    Each distinct blob is decompressed, hashed and counted once, on a pool of `jobs`
+    threads (zlib and hashlib release the GIL), however many snapshots share it.
+
+    Args:
+        store (ArchiveStore): Store to check
+        jobs (int): Worker threads
+        snapshots (Optional[Iterable[Snapshot]]): Snapshots to check; all by default
+
+    Returns:
+        tuple[int, list[Mismatch]]: Number of files checked, and the failed checks
+    """
+    snapshots = list(store.snapshots() if snapshots is None else snapshots)
+    blobs: dict[str, tuple[int, set[str]]] = {}
+    for snapshot in snapshots:
+        for rel_path, entry in snapshot.files.items():
+            blobs.setdefault(entry["sha256"], (entry["size"], set()))[1].add(rel_path)
+
+    def inspect_blob(digest: str) -> tuple[Optional[bytes], list[Mismatch], dict[str, Optional[int]]]:
+        size, rel_paths = blobs[digest]
+        location = os.path.relpath(store.blob_path(digest), store.root)
+        try:
+            with open(store.blob_path(digest), "rb") as f:
+                data = zlib.decompress(f.read())
+        except (OSError, zlib.error) as exc:
+            return None, [Mismatch(location, "missing", "a readable blob", str(exc) or type(exc).__name__)], {}
+        problems = []
+        if len(data) != size:
+            problems.append(Mismatch(location, "size", str(size), str(len(data))))
+        actual = hashlib.sha256(data).hexdigest()
+        if actual != digest:
+            problems.append(Mismatch(location, "hash", digest, actual))
+        counts = {rel_path: count_entries(rel_path, data) for rel_path in rel_paths if not rel_path.startswith("meta/")}
+        return data, problems, counts
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="verify") as pool:
+        inspected = dict(zip(blobs, pool.map(inspect_blob, blobs)))
+
+    checked = 0
+    mismatches = [problem for _, problems, _ in inspected.values() for problem in problems]
+    for snapshot in snapshots:
+        files = {
+            rel_path: (entry["sha256"], inspected[entry["sha256"]][2].get(rel_path))
+            for rel_path, entry in snapshot.files.items()
+        }
+
+        def read_meta(path: str, snapshot: Snapshot = snapshot) -> dict:
+            data = inspected[snapshot.files[path]["sha256"]][0]
+            return json.loads(data) if data is not None else {}
+
+        count, problems = check_files(snapshot.id, files, read_meta)
+        checked += count
+        mismatches.extend(problems)
+    return checked, mismatches
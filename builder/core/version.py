@@ -1,13 +1,19 @@
 import os
 
+from builder.core.settings import settings
+
 
 def read_version() -> str:
     """
-    Reads the VERSION.txt file from the project root and returns the Unicode version number.
+    Returns the Unicode version being built: the one a matrix build selected
+    (settings.unicode_version), otherwise the VERSION.txt file at the project root.
 
     Returns:
         str: The version string, e.g. "15.1.0"
     """
+    if settings.unicode_version:
+        return settings.unicode_version
+
     base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
     version_file = os.path.join(base_dir, "VERSION.txt")
 
@@ -17,7 +23,7 @@ def read_version() -> str:
 
 def read_major_minor_version() -> str:
     """
-    Reads the Unicode version from VERSION.txt and returns only the major.minor part.
+    Returns only the major.minor part of the Unicode version being built (see read_version()).
 
     Returns:
         str: The major.minor version string, e.g. "15.1"
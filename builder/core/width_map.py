@@ -0,0 +1,189 @@
+import heapq
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Iterator, Mapping, Optional
+
+from char_table.ranges import WidthRange, ranges_from_pairs
+
+from builder.core.codepoint_ranges import Span, difference, normalize
+
+
+def _subtract(ranges: Iterable[WidthRange], cuts: Iterable[WidthRange]) -> list[WidthRange]:
+    # Parts of `ranges` no cut covers. Runs are cut per width with codepoint_ranges.difference
+    # (which merges adjacent spans, so widths must not be mixed) and merged back in order.
+    by_width: dict[int, list[Span]] = {}
+    for start, end, width in ranges:
+        by_width.setdefault(width, []).append((start, end))
+    removed = [(start, end) for start, end, _ in cuts]
+    return list(heapq.merge(*(
+        [(start, end, width) for start, end in difference(spans, removed)]
+        for width, spans in by_width.items()
+    )))
+
+
+class WidthMap:
+    """
+    A dataset's character → width mapping, stored as sorted intervals instead of one
+    dict entry per character.
+
+    Single code points live in parallel `array` columns of (start, end, width) runs,
+    adjacent equal widths merged, so the 93k CJK ideographs take a dozen rows.
+    Multi-codepoint keys (ZWJ emoji, "――") go to a separate sequence store, kept sorted.
+    Iteration yields keys in code point order, i.e. the order of sorted(dict), so
+    writers stream it without building or sorting a dict.
+    """
+
+    __slots__ = ("starts", "ends", "widths", "sequences")
+
+    def __init__(self, ranges: Iterable[WidthRange] = (), sequences: Optional[Mapping[str, int]] = None):
+        """
+        Args:
+            ranges (Iterable[WidthRange]): Sorted, non-overlapping (start, end, width) ranges
+            sequences (Optional[Mapping[str, int]]): Multi-codepoint key → width
+
+        Raises:
+            ValueError: If the ranges are out of order or overlap
+        """
+        self.starts = array("I")
+        self.ends = array("I")
+        self.widths = array("B")
+        for start, end, width in ranges:
+            if self.ends and start <= self.ends[-1]:
+                raise ValueError(f"Ranges out of order or overlapping at U+{start:04X}")
+            if self.ends and start == self.ends[-1] + 1 and width == self.widths[-1]:
+                self.ends[-1] = end
+                continue
+            self.starts.append(start)
+            self.ends.append(end)
+            self.widths.append(width)
+        self.sequences: dict[str, int] = dict(sorted(sequences.items())) if sequences else {}
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[tuple[int, int]], sequences: Optional[Mapping[str, int]] = None) -> "WidthMap":
+        """
+        Builds a map from (codepoint, width) pairs in any order; a repeated code point keeps its last width.
+        """
+        return cls(ranges_from_pairs(pairs), sequences)
+
+    @classmethod
+    def from_blocks(cls, blocks: Iterable[Span], width: int) -> "WidthMap":
+        """
+        Builds a map giving every code point of some blocks the same width, e.g. a whole Unicode block table.
+        """
+        return cls((start, end, width) for start, end in normalize(blocks))
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, int]) -> "WidthMap":
+        """
+        Builds a map from a character → width dict, e.g. a curated table or a dataset JSON file.
+        """
+        return cls.from_pairs(
+            ((ord(key), width) for key, width in data.items() if len(key) == 1),
+            {key: width for key, width in data.items() if len(key) != 1},
+        )
+
+    def __len__(self) -> int:
+        # Entries as a dict would count them: covered code points plus sequences.
+        return sum(self.ends) - sum(self.starts) + len(self.starts) + len(self.sequences)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts or self.sequences)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WidthMap):
+            return NotImplemented
+        return (self.starts, self.ends, self.widths, self.sequences) == \
+            (other.starts, other.ends, other.widths, other.sequences)
+
+    def __repr__(self) -> str:
+        return f"WidthMap({len(self.starts)} ranges, {len(self.sequences)} sequences)"
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        """
+        Looks up the width of a character or sequence.
+
+        Args:
+            key (str): One character or a multi-codepoint sequence
+            default (Optional[int]): Returned when the key is not in the map
+
+        Returns:
+            Optional[int]: Width of the key, or `default`
+        """
+        if len(key) != 1:
+            return self.sequences.get(key, default)
+        codepoint = ord(key)
+        i = bisect_right(self.starts, codepoint) - 1
+        if i >= 0 and codepoint <= self.ends[i]:
+            return self.widths[i]
+        return default
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def ranges(self) -> list[WidthRange]:
+        """
+        Returns:
+            list[WidthRange]: The single code points as sorted (start, end, width) triples
+        """
+        return list(zip(self.starts, self.ends, self.widths))
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """
+        Yields (key, width) in code point order: a character sorts before the sequences
+        it starts, exactly as sorted() orders the keys of the equivalent dict.
+        """
+        pending = iter(self.sequences.items())
+        sequence = next(pending, None)
+        for start, end, width in zip(self.starts, self.ends, self.widths):
+            if sequence is not None and ord(sequence[0][0]) <= end:
+                for codepoint in range(start, end + 1):
+                    ch = chr(codepoint)
+                    while sequence is not None and sequence[0] < ch:
+                        yield sequence
+                        sequence = next(pending, None)
+                    yield ch, width
+            else:
+                for codepoint in range(start, end + 1):
+                    yield chr(codepoint), width
+        if sequence is not None:
+            yield sequence
+            yield from pending
+
+    def keys(self) -> Iterator[str]:
+        """
+        Yields every key in code point order (see items()).
+        """
+        return (key for key, _ in self.items())
+
+    __iter__ = keys
+
+    def union(self, other: "WidthMap") -> "WidthMap":
+        """
+        Merges two maps in one pass over both interval lists; where both have a key,
+        `other`'s width wins, as with dict.update().
+
+        Args:
+            other (WidthMap): Map laid over this one
+
+        Returns:
+            WidthMap: Every key of either map
+        """
+        top = other.ranges()
+        merged = heapq.merge(_subtract(self.ranges(), top), top)
+        return WidthMap(merged, {**self.sequences, **other.sequences})
+
+    def difference(self, other: "WidthMap") -> "WidthMap":
+        """
+        Removes the keys of another map, whatever their widths, in one pass over both interval lists.
+
+        Args:
+            other (WidthMap): Keys to remove
+
+        Returns:
+            WidthMap: The keys of this map that `other` does not have
+        """
+        sequences = {key: width for key, width in self.sequences.items() if key not in other.sequences}
+        return WidthMap(_subtract(self.ranges(), other.ranges()), sequences)
+
+    __or__ = union
+    __sub__ = difference
@@ -0,0 +1,59 @@
+import sys
+import argparse
+
+from builder.core.archive_store import ArchiveStore, SnapshotNotFoundError
+from builder.core.delta import CURRENT, DeltaError, apply_delta, make_delta
+
+
+def cmd_diff(args: argparse.Namespace) -> int:
+    """
+    Writes the patch directory turning snapshot FROM into snapshot TO.
+    """
+    manifest = make_delta(args.base, args.target, args.output, ArchiveStore(args.store))
+    print(f"📦 Delta {manifest['from']} → {manifest['to']}")
+    for name, entry in manifest["tables"].items():
+        if entry["patch"] is None:
+            print(f"  ⏭️  {name}: unchanged")
+        else:
+            print(f"  ✅ {name}: +{entry['added']} -{entry['removed']} ~{entry['changed']} "
+                  f"({entry['patch_bytes']} bytes)")
+    for name in manifest["removed_tables"]:
+        print(f"  🗑️  {name}: removed")
+    print(f"📝 Delta written: {args.output}")
+    return 0
+
+
+def cmd_apply(args: argparse.Namespace) -> int:
+    """
+    Patches the tables under --root (char_table/ by default) and verifies them against the target meta hashes.
+    """
+    apply_delta(args.patch_dir, args.root)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m builder.delta",
+        description="Per-table patches between dataset snapshots (archived or the working tree).",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    diff = sub.add_parser("diff", help="Write patches turning one snapshot into another")
+    diff.add_argument("base", help=f"'{CURRENT}' or an archive ref: snapshot id, version or timestamp prefix")
+    diff.add_argument("target", help=f"'{CURRENT}' or an archive ref")
+    diff.add_argument("-o", "--output", required=True, help="Directory receiving delta.json and <table>.delta.json")
+    diff.add_argument("--store", help="Archive store directory (default: char_table/archive/store)")
+
+    apply = sub.add_parser("apply", help="Apply a patch directory and verify the result")
+    apply.add_argument("patch_dir", help="Directory written by 'diff'")
+    apply.add_argument("--root", help="Tree to patch, holding current/, meta/, categories/ (default: char_table/)")
+    return parser
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    try:
+        sys.exit(cmd_diff(args) if args.command == "diff" else cmd_apply(args))
+    except (DeltaError, SnapshotNotFoundError) as exc:
+        print(f"❌ {exc.args[0]}", file=sys.stderr)
+        sys.exit(1)
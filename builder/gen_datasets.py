@@ -1,12 +1,45 @@
+import os
 import sys
+import fnmatch
+import argparse
+from datetime import datetime, timezone
 
-from builder.generators.emoji_base import generate as gen_emoji_base
-from builder.generators.emoji_zwj import generate as gen_emoji_zwj
-from builder.generators.cjk_unified import generate as gen_cjk_unified
-from builder.generators.japanese_kana import generate as gen_japanese_kana
-from builder.generators.korean_syllables import generate as gen_korean_syllables
-from builder.generators.fullwidth_variants import generate as gen_fullwidth_variants
-from builder.generators.fullwidth_punctuations import generate as gen_fullwidth_punctuations
+from builder.core.trace import tracer
+from builder.core.settings import configure
+from builder.core.manifest import BuildManifest
+from builder.core.matrix import building_version, share_identical_files
+from builder.core.scheduler import default_jobs, run_stages
+
+from builder.registry import REGISTRY
+
+
+def select_targets(patterns: list[str]) -> tuple[list[str], list[str]]:
+    """
+    Resolves command-line target names and glob patterns against the registry.
+
+    Args:
+        patterns (list[str]): Names, fnmatch globs (e.g. "emoji_*") or "all"
+
+    Returns:
+        tuple[list[str], list[str]]: Selected names in build order, and the patterns that matched nothing
+    """
+    selected: set[str] = set()
+    unmatched = []
+    for pattern in patterns:
+        matches = list(REGISTRY) if pattern == "all" else fnmatch.filter(REGISTRY, pattern)
+        if not matches:
+            unmatched.append(pattern)
+        selected.update(matches)
+    return [name for name in REGISTRY if name in selected], unmatched
+
+
+def default_trace_path() -> str:
+    """
+    Returns a per-run trace path for --profile runs without --trace:
+    build-<UTC timestamp>-<pid>.jsonl in the current directory, beside the .prof files.
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return os.path.abspath(f"build-{stamp}-{os.getpid()}.jsonl")
 
 
 def print_usage() -> None:
@@ -15,55 +48,123 @@ def print_usage() -> None:
     """
     print("Usage:")
     print("  python -m builder.gen_datasets all                      # Generate all datasets")
-    print("  python -m builder.gen_datasets emoji_base               # Only generate emoji_base.json")
-    print("  python -m builder.gen_datasets emoji_zwj                # Only generate emoji_zwj.json")
-    print("  python -m builder.gen_datasets cjk_unified              # Only generate CJK unified table")
-    print("  python -m builder.gen_datasets japanese_kana            # Only generate Japanese kana table")
-    print("  python -m builder.gen_datasets korean_syllables         # Only generate Korean syllables table")
-    print("  python -m builder.gen_datasets fullwidth_variants       # Only generate fullwidth variant table")
-    print("  python -m builder.gen_datasets fullwidth_punctuations   # Only generate curated CJK punctuation table")
+    print("  python -m builder.gen_datasets --jobs 4 all             # Generate all datasets, 4 at a time")
+    print("  python -m builder.gen_datasets --offline all            # Build only from cached/mirrored sources")
+    print("  python -m builder.gen_datasets --force all              # Rebuild even if inputs are unchanged")
+    print("  python -m builder.gen_datasets --compact all            # Write dataset JSON without indentation")
+    print("  python -m builder.gen_datasets --trace build.json all   # Write a per-stage trace (.json: Chrome format)")
+    print("  python -m builder.gen_datasets --profile 'write_*' all  # Run matching stages under cProfile")
+    print("  python -m builder.gen_datasets 'emoji_*' width_table    # Several targets; globs match registry names")
+    print("  python -m builder.gen_datasets --versions 15.1.0,16.0.0 all  # Matrix build into char_table/versions/<version>/")
+    for name, spec in REGISTRY.items():
+        print(f"  python -m builder.gen_datasets {name:<24} # {spec.description}")
+
+
+def dispatch(patterns: list[str], jobs: int = 1, force: bool = False) -> bool:
+    """
+    Builds the registry targets matching the given names and patterns.
 
+    Only the selected targets' modules are imported. Datasets run first, concurrently;
+    derived tables (width_table) run after them. Targets whose inputs and code are
+    unchanged since the last build (see builder/core/manifest.py) are skipped unless
+    `force` is set.
 
-def dispatch(command: str) -> None:
+    Args:
+        patterns (list[str]): Target names, glob patterns or "all", as passed from the CLI.
+        jobs (int): Number of generators allowed to run concurrently.
+        force (bool): Rebuild even when the build manifest says outputs are current.
+
+    Returns:
+        bool: True if every generator that ran succeeded.
+    """
+    names, unmatched = select_targets(patterns)
+    if unmatched:
+        print(f"❌ Unknown target: {', '.join(unmatched)}")
+        print_usage()
+        return False
+
+    if patterns == ["all"]:
+        print("✨ Generating all datasets...")
+    specs = [REGISTRY[name] for name in names]
+    stages = [
+        {spec.name: spec.generate for spec in specs if spec.derived == derived}
+        for derived in (False, True)
+    ]
+    targets = {spec.name: spec.target() for spec in specs}
+    return not run_stages([stage for stage in stages if stage], jobs, targets, BuildManifest(), force)
+
+
+def dispatch_matrix(versions: list[str], patterns: list[str], jobs: int = 1, force: bool = False) -> bool:
     """
-    Dispatch the given command string to the appropriate generator function.
+    Builds the selected targets once per Unicode version, side by side under
+    char_table/versions/<version>/ (current/, categories/, meta/), without touching VERSION.txt.
+
+    Versions build one after another in this process, each with the build manifest of its output root,
+    so a rerun skips every table whose inputs are unchanged for that version. Sources
+    come from the shared source cache. Afterwards, tables identical to an older
+    version's are hard-linked to it (see builder/core/matrix.py).
 
     Args:
-        command (str): The command name passed from CLI.
+        versions (list[str]): Full Unicode versions, e.g. ["15.1.0", "16.0.0"]
+        patterns (list[str]): Target names, glob patterns or "all"
+        jobs (int): Number of generators allowed to run concurrently within a version
+        force (bool): Rebuild even when a version's manifest says outputs are current
+
+    Returns:
+        bool: True if every generator of every version succeeded
     """
-    match command:
-        case "emoji_base":
-            gen_emoji_base()
-        case "emoji_zwj":
-            gen_emoji_zwj()
-        case "cjk_unified":
-            gen_cjk_unified()
-        case "japanese_kana":
-            gen_japanese_kana()
-        case "korean_syllables":
-            gen_korean_syllables()
-        case "fullwidth_variants":
-            gen_fullwidth_variants()
-        case "fullwidth_punctuations":
-            gen_fullwidth_punctuations()
-        case "all":
-            print("✨ Generating all datasets...")
-            gen_emoji_base()
-            gen_emoji_zwj()
-            gen_cjk_unified()
-            gen_japanese_kana()
-            gen_korean_syllables()
-            gen_fullwidth_variants()
-            gen_fullwidth_punctuations()
-        case _:
-            print(f"❌ Unknown command: {command}")
-            print_usage()
+    _, unmatched = select_targets(patterns)
+    if unmatched:
+        print(f"❌ Unknown target: {', '.join(unmatched)}")
+        print_usage()
+        return False
+
+    ok = True
+    for version in versions:
+        with building_version(version) as output_dir:
+            print(f"🧮 Unicode {version} → {output_dir}")
+            ok = dispatch(patterns, jobs, force) and ok
+
+    linked, saved = share_identical_files()
+    if linked:
+        print(f"🔗 {linked} tables identical across versions stored once ({saved / 1e6:.1f} MB saved)")
+    return ok
 
 
 if __name__ == "__main__":
     # Entry point: parse CLI args and dispatch command
-    if len(sys.argv) != 2:
+    parser = argparse.ArgumentParser(prog="python -m builder.gen_datasets", add_help=False)
+    parser.add_argument("targets", nargs="*")
+    parser.add_argument("-j", "--jobs", type=int, default=default_jobs())
+    parser.add_argument("--offline", action="store_true")
+    parser.add_argument("--cache-dir")
+    parser.add_argument("--mirror")
+    parser.add_argument("--force", action="store_true")
+    parser.add_argument("--compact", action="store_true")
+    parser.add_argument("--trace")
+    parser.add_argument("--profile", action="append", default=[])
+    parser.add_argument("--versions")
+    args, extra = parser.parse_known_intermixed_args()
+
+    if not args.targets or extra:
         print_usage()
         sys.exit(1)
 
-    dispatch(sys.argv[1])
+    configure(offline=args.offline, cache_dir=args.cache_dir, mirror_dir=args.mirror, compact=args.compact)
+
+    # Stages are only recorded when a trace or profile is asked for; .json selects the Chrome trace format
+    trace_path = None
+    if args.trace or args.profile:
+        trace_path = args.trace or default_trace_path()
+        tracer.start(tuple(args.profile), os.path.dirname(os.path.abspath(trace_path)))
+    try:
+        if args.versions:
+            versions = [version.strip() for version in args.versions.split(",") if version.strip()]
+            ok = dispatch_matrix(versions, args.targets, args.jobs, args.force)
+        else:
+            ok = dispatch(args.targets, args.jobs, args.force)
+    finally:
+        if trace_path:
+            tracer.write(trace_path)
+
+    sys.exit(0 if ok else 1)
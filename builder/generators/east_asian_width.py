@@ -0,0 +1,34 @@
+from builder.core.version import read_version
+from builder.core.ucd_source import EAST_ASIAN_WIDTH, ucd_url
+
+from builder.parser.east_asian_width_parser import shared_east_asian_width
+
+from builder.writer.meta_writer import write_meta_json
+from builder.writer.range_writer import write_range_table
+
+# Output path under char_table/current/.
+TABLE_FILE = "unicode/east_asian_width.ranges.json"
+
+
+def generate() -> None:
+    """
+    Generates east_asian_width.ranges.json, the width and East_Asian_Width class of every
+    code point as merged ranges, and its metadata (.meta.json).
+    Only this table reads the parse; the CJK, kana, Hangul and fullwidth variant tables
+    are whole Unicode blocks (see builder/parser/language_parser.py, symbol_parser.py).
+    Source: Unicode UCD EastAsianWidth.txt and emoji/emoji-data.txt (Emoji_Presentation)
+    """
+    version = read_version()
+
+    table = shared_east_asian_width(version)
+    ranges = table.width_ranges()
+
+    written = write_range_table(TABLE_FILE, ranges, table.class_ranges())
+
+    write_meta_json(
+        name="east_asian_width",
+        source_url=ucd_url(EAST_ASIAN_WIDTH, version),
+        target_rel_path=TABLE_FILE,
+        entry_count=len(ranges),
+        sha256=written.sha256,
+    )
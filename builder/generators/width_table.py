@@ -0,0 +1,29 @@
+from char_table.table import load_table
+from char_table.mmap_table import TABLE_FILE
+
+from builder.core.trace import annotate, stage
+from builder.core.path_utils import resolve_output_dir
+
+from builder.writer.meta_writer import write_meta_json
+from builder.writer.binary_writer import write_width_table
+
+
+def generate() -> None:
+    """
+    Generates width_table.bin, a memory-mappable two-stage lookup table, and its metadata (.meta.json).
+    Merges every dataset already written under char_table/current/, so it runs after the other generators.
+    Source: char_table/current/ (merged datasets)
+    """
+    with stage("load_table", "parse"):
+        ranges = load_table(resolve_output_dir("current")).ranges()
+        annotate(entries=len(ranges))
+
+    written = write_width_table(TABLE_FILE, ranges)
+
+    write_meta_json(
+        name="width_table",
+        source_url="char_table/current/ (merged datasets)",
+        target_rel_path=TABLE_FILE,
+        entry_count=len(ranges),
+        sha256=written.sha256,
+    )
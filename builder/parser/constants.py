@@ -1,5 +1,17 @@
 from typing import Literal
 
+# Block tables, the curated punctuation map and the UAX #11 wide defaults are shared with the
+# runtime, which computes the same datasets without files (see char_table/rules_table.py).
+from char_table.blocks import (
+    CodepointRanges,
+    CJK_UNIFIED_RANGES,
+    JAPANESE_KANA_RANGES,
+    KOREAN_SYLLABLE_RANGES,
+    FULLWIDTH_PUNCTUATIONS,
+    FULLWIDTH_VARIANT_RANGES,
+    EAST_ASIAN_WIDE_DEFAULT_RANGES,
+)
+
 # LanguageMode defines all supported character extraction modes related to CJK scripts.
 # Used by language_parser.py to distinguish between CJK unified ideographs, Japanese kana, and Hangul syllables.
 LanguageMode = Literal["cjk_unified", "japanese_kana", "korean_syllables"]
@@ -11,3 +23,17 @@ SymbolMode = Literal["fullwidth_variants", "fullwidth_punctuations"]
 # EmojiMode defines emoji parsing strategies for emoji-test.txt.
 # Used by emoji_parser.py to extract either base (single-codepoint) or ZWJ (multi-codepoint) emoji.
 EmojiMode = Literal["emoji_base", "emoji_zwj"]
+
+# East_Asian_Width property values from UCD EastAsianWidth.txt (UAX #11).
+EastAsianWidthClass = Literal["F", "W", "A", "H", "Na", "N"]
+
+# Display width of each East_Asian_Width class. Ambiguous ("A") characters are narrow here;
+# the ones CJK typography renders wide are covered by the curated fullwidth_punctuations table.
+EAST_ASIAN_WIDTHS: dict[str, int] = {
+    "F": 2,    # Fullwidth
+    "W": 2,    # Wide
+    "A": 1,    # Ambiguous
+    "H": 1,    # Halfwidth
+    "Na": 1,   # Narrow
+    "N": 1,    # Neutral
+}
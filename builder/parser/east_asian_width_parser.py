@@ -0,0 +1,216 @@
+import os
+from array import array
+from bisect import bisect_right
+from typing import Iterable
+
+from builder.core.memo import shared
+from builder.core.trace import annotate, traced
+from builder.core.ucd_source import EAST_ASIAN_WIDTH, EMOJI_DATA, open_ucd
+from builder.core.codepoint_ranges import CODESPACE, Span, normalize
+from builder.parser.constants import (
+    EAST_ASIAN_WIDTHS,
+    EAST_ASIAN_WIDE_DEFAULT_RANGES,
+)
+
+
+class EastAsianWidthTable:
+    """
+    Every code point (U+0000..U+10FFFF) as sorted, gap-free (start, end, width, class) rows.
+
+    Adjacent code points with the same East_Asian_Width class and width share one row,
+    so the whole codespace fits in a few thousand rows. Columns are parallel arrays,
+    like char_table.table.WidthTable.
+    """
+
+    __slots__ = ("starts", "ends", "widths", "classes")
+
+    def __init__(self):
+        self.starts = array("I")
+        self.ends = array("I")
+        self.widths = array("B")
+        self.classes: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def append(self, start: int, end: int, width: int, eaw_class: str) -> None:
+        """
+        Adds the row following the last one, merging it into the last row when they match.
+        """
+        if self.starts and self.widths[-1] == width and self.classes[-1] == eaw_class:
+            self.ends[-1] = end
+            return
+        self.starts.append(start)
+        self.ends.append(end)
+        self.widths.append(width)
+        self.classes.append(eaw_class)
+
+    def rows(self) -> list[tuple[int, int, int, str]]:
+        """
+        Returns:
+            list[tuple[int, int, int, str]]: The table as (start, end, width, class) rows
+        """
+        return list(zip(self.starts, self.ends, self.widths, self.classes))
+
+    def width_ranges(self) -> list[tuple[int, int, int]]:
+        """
+        Returns the table as merged (start, end, width) ranges, ignoring classes.
+        """
+        ranges: list[tuple[int, int, int]] = []
+        for start, end, width in zip(self.starts, self.ends, self.widths):
+            if ranges and ranges[-1][2] == width:
+                ranges[-1] = (ranges[-1][0], end, width)
+            else:
+                ranges.append((start, end, width))
+        return ranges
+
+    def class_ranges(self) -> list[tuple[int, int, str]]:
+        """
+        Returns the table as merged (start, end, class) ranges, ignoring widths.
+        """
+        ranges: list[tuple[int, int, str]] = []
+        for start, end, eaw_class in zip(self.starts, self.ends, self.classes):
+            if ranges and ranges[-1][2] == eaw_class:
+                ranges[-1] = (ranges[-1][0], end, eaw_class)
+            else:
+                ranges.append((start, end, eaw_class))
+        return ranges
+
+    def lookup(self, codepoint: int) -> tuple[int, str]:
+        """
+        Looks up the width and East_Asian_Width class of a code point.
+
+        Args:
+            codepoint (int): Unicode code point
+
+        Returns:
+            tuple[int, str]: Width and class, e.g. (2, "W") for U+4E00
+        """
+        i = bisect_right(self.starts, codepoint) - 1
+        return self.widths[i], self.classes[i]
+
+
+def _parse_line(line: str) -> tuple[int, int, str]:
+    # "1F300..1F320  ; W  # So  [33] CYCLONE..." → (0x1F300, 0x1F320, "W")
+    codepoints, _, value = line.partition("#")[0].partition(";")
+    first, _, last = codepoints.strip().partition("..")
+    start = int(first, 16)
+    return start, int(last, 16) if last else start, value.strip()
+
+
+def parse_emoji_presentation(lines: Iterable[str]) -> list[Span]:
+    """
+    Collects the Emoji_Presentation=Yes ranges of emoji-data.txt in one streaming pass.
+
+    Args:
+        lines (Iterable[str]): emoji-data.txt lines
+
+    Returns:
+        list[Span]: Sorted, disjoint code point ranges shown as emoji by default
+    """
+    spans: list[Span] = []
+    for line in lines:
+        if line.startswith("#") or "Emoji_Presentation" not in line:
+            continue
+        start, end, prop = _parse_line(line)
+        if prop == "Emoji_Presentation":
+            spans.append((start, end))
+    return normalize(spans)
+
+
+def parse_east_asian_width(lines: Iterable[str], emoji_presentation: Iterable[Span] = ()) -> EastAsianWidthTable:
+    """
+    Builds the complete code point → width table from EastAsianWidth.txt in a single linear pass.
+
+    Lines are consumed one at a time in file order (ascending code points). Gaps between
+    listed ranges take the UAX #11 defaults, "W" inside EAST_ASIAN_WIDE_DEFAULT_RANGES
+    and "N" elsewhere, so the result covers the whole codespace. Emoji_Presentation
+    ranges are two columns wide whatever their class; they are merged in by a cursor
+    that advances alongside the file, not by a second pass.
+
+    Args:
+        lines (Iterable[str]): EastAsianWidth.txt lines, e.g. an open file
+        emoji_presentation (Iterable[Span]): Ranges from parse_emoji_presentation()
+
+    Returns:
+        EastAsianWidthTable: Gap-free table covering U+0000..U+10FFFF
+
+    Raises:
+        ValueError: If the file lists ranges out of order or overlapping
+    """
+    table = EastAsianWidthTable()
+    emoji = normalize(emoji_presentation)
+    defaults = normalize(EAST_ASIAN_WIDE_DEFAULT_RANGES)
+    emoji_i = default_i = 0
+
+    def emit(start: int, end: int, eaw_class: str) -> None:
+        # Splits [start, end] at Emoji_Presentation boundaries and appends the pieces.
+        nonlocal emoji_i
+        width = EAST_ASIAN_WIDTHS.get(eaw_class, 1)
+        while start <= end:
+            while emoji_i < len(emoji) and emoji[emoji_i][1] < start:
+                emoji_i += 1
+            if emoji_i == len(emoji) or emoji[emoji_i][0] > end:
+                table.append(start, end, width, eaw_class)
+                return
+            emoji_start, emoji_end = emoji[emoji_i]
+            if emoji_start > start:
+                table.append(start, emoji_start - 1, width, eaw_class)
+                start = emoji_start
+            piece_end = min(end, emoji_end)
+            table.append(start, piece_end, 2, eaw_class)
+            start = piece_end + 1
+
+    def fill(start: int, end: int) -> None:
+        # Unlisted code points: "W" inside the default-wide ranges, "N" elsewhere.
+        nonlocal default_i
+        while start <= end:
+            while default_i < len(defaults) and defaults[default_i][1] < start:
+                default_i += 1
+            if default_i == len(defaults) or defaults[default_i][0] > end:
+                emit(start, end, "N")
+                return
+            default_start, default_end = defaults[default_i]
+            if default_start > start:
+                emit(start, default_start - 1, "N")
+                start = default_start
+            piece_end = min(end, default_end)
+            emit(start, piece_end, "W")
+            start = piece_end + 1
+
+    cursor = 0
+    for line in lines:
+        if line.startswith("#") or not line.strip():
+            continue
+        start, end, eaw_class = _parse_line(line)
+        if start < cursor:
+            raise ValueError(f"EastAsianWidth.txt is not in code point order at U+{start:04X}")
+        fill(cursor, start - 1)
+        emit(start, end, eaw_class)
+        cursor = end + 1
+    fill(cursor, CODESPACE - 1)
+    return table
+
+
+@shared
+@traced("parse")
+def shared_east_asian_width(version: str) -> EastAsianWidthTable:
+    """
+    Streams EastAsianWidth.txt and emoji-data.txt for a version from the source cache
+    and parses them once per version; later calls in the same process (a matrix build,
+    the builder benchmarks) reuse the table. The east_asian_width generator is its only
+    consumer.
+
+    Args:
+        version (str): Full Unicode version, e.g. "16.0.0"
+
+    Returns:
+        EastAsianWidthTable: The complete width table
+    """
+    with open_ucd(EMOJI_DATA, version) as f:
+        emoji = parse_emoji_presentation(f)
+        annotate(bytes_read=os.fstat(f.fileno()).st_size)
+    with open_ucd(EAST_ASIAN_WIDTH, version) as f:
+        table = parse_east_asian_width(f, emoji)
+        annotate(bytes_read=os.fstat(f.fileno()).st_size, entries=len(table))
+    return table
@@ -1,47 +1,145 @@
+import os
+from array import array
+from itertools import repeat
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from builder.core.memo import shared
+from builder.core.trace import annotate, traced
+from builder.core.version import major_minor
+from builder.core.width_map import WidthMap
 from builder.parser.constants import EmojiMode
-from builder.core.emoji_source import emoji_fetchers
+from builder.core.emoji_source import open_emoji_test
+
 
+@dataclass
+class EmojiTables:
+    """
+    All tables extracted from one pass over emoji-test.txt.
 
-def parser_emoji(lines: list[str], mode: EmojiMode) -> dict[str, int]:
+    Attributes:
+        base (WidthMap): Single-codepoint fully-qualified emoji, width 2, as ranges
+        zwj (WidthMap): ZWJ or multi-codepoint fully-qualified sequences, width 2, in its sequence store
+        groups (Optional[dict[str, tuple[str, str]]]): Emoji → (group, subgroup), if requested
+        versions (Optional[dict[str, str]]): Emoji → version it was introduced in (e.g. "E15.0"), if requested
+    """
+    base: WidthMap = field(default_factory=WidthMap)
+    zwj: WidthMap = field(default_factory=WidthMap)
+    groups: Optional[dict[str, tuple[str, str]]] = None
+    versions: Optional[dict[str, str]] = None
+
+    def __getitem__(self, mode: EmojiMode) -> WidthMap:
+        if mode == "emoji_base":
+            return self.base
+        if mode == "emoji_zwj":
+            return self.zwj
+        raise KeyError(mode)
+
+
+def parse_emoji_stream(lines: Iterable[str], with_groups: bool = False, with_versions: bool = False) -> EmojiTables:
+    """
+    Extract fully-qualified emoji from emoji-test.txt in a single streaming pass.
+
+    Lines are consumed one at a time, so `lines` may be an open file handle or the
+    line iterator of a chunked HTTP response; memory stays bounded by the tables.
+    Each entry is routed into the base or ZWJ table as it is read: base emoji are
+    collected as code points and folded into ranges at the end. The emoji string
+    is rebuilt from the code point column, which stays correct for entries such as
+    the "#" keycap whose comment contains a "#" of its own.
+
+    Args:
+        lines (Iterable[str]): emoji-test.txt lines, with or without trailing newlines
+        with_groups (bool): Also record each emoji's group and subgroup
+        with_versions (bool): Also record each emoji's version column (e.g. "E13.0")
+
+    Returns:
+        EmojiTables: Base and ZWJ tables, plus the requested extra columns
+    """
+    tables = EmojiTables(
+        groups={} if with_groups else None,
+        versions={} if with_versions else None,
+    )
+    base = array("I")
+    zwj: dict[str, int] = {}
+    groups, versions = tables.groups, tables.versions
+    group = subgroup = ""
+
+    for line in lines:
+        if line.startswith("#"):
+            if groups is not None:
+                if line.startswith("# group:"):
+                    group = line[8:].strip()
+                elif line.startswith("# subgroup:"):
+                    subgroup = line[11:].strip()
+            continue
+
+        codepoints_str, _, rest = line.partition(";")
+        status, _, comment = rest.partition("#")
+        if status.strip() != "fully-qualified":
+            continue
+
+        codepoints = codepoints_str.split()
+        emoji_str = "".join(chr(int(cp, 16)) for cp in codepoints)
+
+        # Single code point → base; multiple code points (ZWJ, keycaps, modifiers, flags) → zwj
+        if len(codepoints) == 1:
+            base.append(ord(emoji_str))
+        else:
+            zwj[emoji_str] = 2
+
+        if groups is not None:
+            groups[emoji_str] = (group, subgroup)
+        if versions is not None:
+            # Comment layout: "<emoji> E<version> <name>"
+            fields = comment.split(None, 2)
+            versions[emoji_str] = fields[1] if len(fields) > 1 else ""
+
+    tables.base = WidthMap.from_pairs(zip(base, repeat(2)))
+    tables.zwj = WidthMap(sequences=zwj)
+    return tables
+
+
+def parser_emoji(lines: Iterable[str], mode: EmojiMode) -> WidthMap:
     """
     Extract fully-qualified emoji from emoji-test.txt lines.
 
     Args:
-        lines (list[str]): Raw content of emoji-test.txt
+        lines (Iterable[str]): Raw content of emoji-test.txt
         mode (Literal["emoji_base", "emoji_zwj"]): Extraction mode:
             - "emoji_base": only single-codepoint emoji
             - "emoji_zwj" : only ZWJ or multi-codepoint sequences
 
     Returns:
-        dict[str, int]: Mapping of emoji string → width 2
+        WidthMap: Emoji of width 2
     """
-    result: dict[str, int] = {}
+    return parse_emoji_stream(lines)[mode]
 
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith("#") or "; fully-qualified" not in line:
-            continue
 
-        codepoints_str, comment = line.split(";")[0], line.split("#")[1].strip()
-        emoji_str = comment.split(" ")[0]
+@shared
+@traced("parse")
+def shared_emoji_tables(version: str) -> EmojiTables:
+    """
+    Streams emoji-test.txt for a version from the source cache and parses it once,
+    sharing the tables across generators.
 
-        if mode == "emoji_base":
-            # Exclude multi-codepoint
-            if " " not in codepoints_str.strip():
-                result[emoji_str] = 2
-        elif mode == "emoji_zwj":
-            # Include if ZWJ or multiple codepoints
-            if "\u200D" in emoji_str or " " in codepoints_str.strip():
-                result[emoji_str] = 2
+    Args:
+        version (str): Emoji version, e.g. "16.0"
 
-    return result
+    Returns:
+        EmojiTables: All emoji tables
+    """
+    with open_emoji_test(version) as f:
+        tables = parse_emoji_stream(f)
+        annotate(bytes_read=os.fstat(f.fileno()).st_size, entries=len(tables.base) + len(tables.zwj))
+    return tables
 
 
-def extract_emoji_map(mode: EmojiMode) -> dict[str, int]:
+def extract_emoji_map(mode: EmojiMode) -> WidthMap:
     """
     Fetches emoji-test.txt from Unicode and extracts emojis based on the specified mode.
 
-    This function handles fetching the source file and delegates the parsing to `parser_emoji()`.
+    The fetch and the parse are shared: `emoji_base` and `emoji_zwj` generated in
+    the same run reuse one download and one pass over the file.
 
     Args:
         mode (Literal["base", "zwj"]): Extraction mode:
@@ -49,8 +147,6 @@ def extract_emoji_map(mode: EmojiMode) -> dict[str, int]:
             - "emoji_zwj" : only multi-codepoint or ZWJ-based emoji
 
     Returns:
-        dict[str, int]: Mapping of extracted emoji to width=2
+        WidthMap: Extracted emoji of width 2 (shared with the other mode's run; not to be modified)
     """
-    lines = emoji_fetchers()
-    result = parser_emoji(lines, mode)
-    return result
+    return shared_emoji_tables(major_minor())[mode]
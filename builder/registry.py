@@ -0,0 +1,244 @@
+import importlib
+from dataclasses import dataclass
+from typing import Callable, Optional, Union
+
+from builder.core.version import major_minor, read_version
+from builder.core.manifest import BuildTarget
+from builder.core.path_utils import resolve_current_path, resolve_meta_path
+
+# Upstream files a spec reads through the source cache, by kind.
+EMOJI = "emoji"
+UCD = "ucd"
+
+# Modules every dataset target depends on besides its extractor: the specs themselves
+# and the sinks that serialize them.
+DATASET_MODULES = ("builder.registry", "builder.writer.sinks")
+
+
+def _emoji_sources() -> list[tuple[str, str]]:
+    version = major_minor()
+    return [(version, f"emoji/{version}/emoji-test.txt")]
+
+
+def _ucd_sources() -> list[tuple[str, str]]:
+    from builder.core.ucd_source import EAST_ASIAN_WIDTH, EMOJI_DATA, ucd_path
+
+    version = read_version()
+    return [(version, ucd_path(EAST_ASIAN_WIDTH, version)), (version, ucd_path(EMOJI_DATA, version))]
+
+
+def _no_sources() -> list[tuple[str, str]]:
+    return []
+
+
+def _no_inputs() -> list[str]:
+    return []
+
+
+def _merged_dataset_inputs() -> list[str]:
+    # width_table merges the range copies of every dataset.
+    return [
+        resolve_current_path(f"{spec.category}/{spec.name}.ranges.json")
+        for spec in DATASETS
+        if "ranges" in spec.sink_names()
+    ]
+
+
+_SOURCES = {EMOJI: _emoji_sources, UCD: _ucd_sources, None: _no_sources}
+
+
+def _load(ref: str) -> Callable:
+    # "package.module:function" → the function, importing the module on first use.
+    module, _, attr = ref.partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """
+    Declares one character map dataset: where it comes from and how it is written.
+
+    Nothing is imported until the dataset is built, so selecting one dataset on the
+    command line loads only its extractor and the sinks.
+
+    Attributes:
+        name (str): Dataset name, e.g. "cjk_unified"; also the mode passed to the extractor
+        category (str): Subdirectory under current/, e.g. "cjk"
+        extractor (str): "module:function" returning the WidthMap for `name`
+        source (str): Source recorded in the meta files; "{version}" and "{emoji_version}"
+            are replaced by the VERSION.txt release and its major.minor part
+        description (str): One line for the command-line usage
+        upstream (Optional[str]): EMOJI or UCD when the extractor reads cached upstream files
+        sinks (Optional[tuple[str, ...]]): Output sinks (see builder/writer/sinks.py);
+            None writes DEFAULT_SINKS
+    """
+    name: str
+    category: str
+    extractor: str
+    source: str
+    description: str
+    upstream: Optional[str] = None
+    sinks: Optional[tuple[str, ...]] = None
+
+    # Dataset maps only read upstream sources, so they build in the first stage.
+    derived = False
+
+    @property
+    def module(self) -> str:
+        """
+        Module holding the extractor.
+        """
+        return self.extractor.partition(":")[0]
+
+    def source_url(self) -> str:
+        """
+        Returns the source recorded in the meta files, for the VERSION.txt release.
+        """
+        return self.source.format(version=read_version(), emoji_version=major_minor())
+
+    def sink_names(self) -> tuple[str, ...]:
+        """
+        Returns the sinks the dataset is written to.
+        """
+        from builder.writer.sinks import DEFAULT_SINKS
+
+        return self.sinks or DEFAULT_SINKS
+
+    def generate(self) -> None:
+        """
+        Extracts the dataset and writes it to every sink.
+        """
+        from builder.writer.sinks import Dataset, write_dataset
+
+        data = _load(self.extractor)(self.name)
+        write_dataset(Dataset(self.name, self.category, self.source_url(), data), self.sink_names())
+
+    def target(self) -> BuildTarget:
+        """
+        Returns:
+            BuildTarget: What the dataset reads and writes, for incremental builds
+        """
+        from builder.writer.sinks import SINKS
+
+        outputs = tuple(path for sink in self.sink_names() for path in SINKS[sink]().outputs(self.category, self.name))
+        return BuildTarget(modules=(self.module, *DATASET_MODULES), outputs=outputs, sources=_SOURCES[self.upstream])
+
+
+@dataclass(frozen=True)
+class GeneratorSpec:
+    """
+    Declares a table with a generator module of its own (a generate() function),
+    for outputs that are not a single character map.
+
+    Attributes:
+        name (str): Table name, e.g. "width_table"
+        module (str): Generator module, imported when the table is built
+        outputs (tuple[str, ...]): Paths written, relative to current/ (each gets meta/<name>.meta.json too)
+        description (str): One line for the command-line usage
+        upstream (Optional[str]): EMOJI or UCD when the generator reads cached upstream files
+        derived (bool): Reads the datasets under current/, so builds after every DatasetSpec
+    """
+    name: str
+    module: str
+    outputs: tuple[str, ...]
+    description: str
+    upstream: Optional[str] = None
+    derived: bool = False
+
+    def generate(self) -> None:
+        """
+        Runs the generator module's generate().
+        """
+        _load(f"{self.module}:generate")()
+
+    def target(self) -> BuildTarget:
+        """
+        Returns:
+            BuildTarget: What the generator reads and writes, for incremental builds
+        """
+        return BuildTarget(
+            modules=(self.module,),
+            outputs=(*map(resolve_current_path, self.outputs), resolve_meta_path(self.name)),
+            sources=_SOURCES[self.upstream],
+            inputs=_merged_dataset_inputs if self.derived else _no_inputs,
+        )
+
+
+_EMOJI_TEST = "https://unicode.org/Public/emoji/{emoji_version}/emoji-test.txt"
+_BLOCKS = "https://unicode.org/Public/{version}/ucd/Blocks.txt"
+
+# Character map datasets, in the order `all` builds them and char_table/table.py merges them.
+DATASETS = (
+    DatasetSpec(
+        name="emoji_base",
+        category="emoji",
+        extractor="builder.parser.emoji_parser:extract_emoji_map",
+        source=_EMOJI_TEST,
+        description="Single-codepoint fully-qualified emoji",
+        upstream=EMOJI,
+    ),
+    DatasetSpec(
+        name="emoji_zwj",
+        category="emoji",
+        extractor="builder.parser.emoji_parser:extract_emoji_map",
+        source=_EMOJI_TEST,
+        description="ZWJ / multi-codepoint emoji sequences",
+        upstream=EMOJI,
+    ),
+    DatasetSpec(
+        name="cjk_unified",
+        category="cjk",
+        extractor="builder.parser.language_parser:extract_lang_map",
+        source=_BLOCKS,
+        description="CJK Unified Ideographs (Basic + A–G + Compatibility)",
+    ),
+    DatasetSpec(
+        name="japanese_kana",
+        category="cjk",
+        extractor="builder.parser.language_parser:extract_lang_map",
+        source=_BLOCKS,
+        description="All Hiragana, Katakana, and extended kana ranges",
+    ),
+    DatasetSpec(
+        name="korean_syllables",
+        category="cjk",
+        extractor="builder.parser.language_parser:extract_lang_map",
+        source=_BLOCKS,
+        description="11,172 modern Hangul syllables (U+AC00–U+D7AF)",
+    ),
+    DatasetSpec(
+        name="fullwidth_variants",
+        category="variants",
+        extractor="builder.parser.symbol_parser:extract_symbol_map",
+        source=_BLOCKS,
+        description="Fullwidth Latin / symbol variants (FF01–FF60, FFE0–FFE6)",
+    ),
+    DatasetSpec(
+        name="fullwidth_punctuations",
+        category="variants",
+        extractor="builder.parser.symbol_parser:extract_symbol_map",
+        source="manually_curated (CJK typography conventions)",
+        description="Manually curated wide punctuation used in East Asian typography",
+    ),
+)
+
+# Tables with generator modules of their own.
+GENERATORS = (
+    GeneratorSpec(
+        name="east_asian_width",
+        module="builder.generators.east_asian_width",
+        outputs=("unicode/east_asian_width.ranges.json",),
+        description="Width and East_Asian_Width class of every code point, as ranges",
+        upstream=UCD,
+    ),
+    GeneratorSpec(
+        name="width_table",
+        module="builder.generators.width_table",
+        outputs=("width_table.bin",),
+        description="Memory-mappable binary table merged from all other datasets",
+        derived=True,
+    ),
+)
+
+# Every buildable table by name, in build order.
+REGISTRY: dict[str, Union[DatasetSpec, GeneratorSpec]] = {spec.name: spec for spec in (*DATASETS, *GENERATORS)}
@@ -0,0 +1,56 @@
+import sys
+import time
+import argparse
+
+from builder.core.settings import settings
+from builder.core.scheduler import default_jobs
+from builder.core.archive_store import ArchiveStore, SnapshotNotFoundError
+from builder.core.verify import verify_archive, verify_tree
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m builder.verify",
+        description="Check char_table/ and its archived snapshots against the meta hashes and entry counts.",
+    )
+    parser.add_argument("--root", help="Tree holding current/, categories/ and meta/ (default: char_table/)")
+    parser.add_argument("--store", help="Archive store directory (default: char_table/archive/store)")
+    parser.add_argument("--snapshot", action="append", default=[], metavar="REF",
+                        help="Only check this archived snapshot (repeatable); default: all of them")
+    parser.add_argument("--no-archive", action="store_true", help="Skip the archive store")
+    parser.add_argument("-j", "--jobs", type=int, default=default_jobs(), help="Hashing threads (default: one per CPU)")
+    return parser
+
+
+def main(args: argparse.Namespace) -> int:
+    """
+    Verifies the working tree, then the archive store; prints every mismatch.
+
+    Returns:
+        int: 0 when everything matches, 1 otherwise
+    """
+    start = time.perf_counter()
+    checked, mismatches = verify_tree(args.root or settings.output_dir, args.jobs)
+    print(f"🔬 Working tree: {checked} files checked, {len(mismatches)} mismatches")
+
+    if not args.no_archive:
+        store = ArchiveStore(args.store)
+        snapshots = [store.snapshot(ref) for ref in args.snapshot] or None
+        archived, problems = verify_archive(store, args.jobs, snapshots)
+        print(f"🗄️  Archive: {archived} files checked, {len(problems)} mismatches")
+        checked += archived
+        mismatches += problems
+
+    for mismatch in mismatches:
+        print(f"❌ {mismatch}")
+    status = "✅ All files match their meta" if not mismatches else f"❌ {len(mismatches)} mismatches"
+    print(f"{status} ({checked} files, {time.perf_counter() - start:.2f}s)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main(build_parser().parse_args()))
+    except SnapshotNotFoundError as exc:
+        print(f"❌ {exc.args[0]}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,149 @@
+import os
+import json
+import hashlib
+import threading
+from dataclasses import dataclass
+from json.encoder import encode_basestring
+from typing import Iterable, Iterator, Optional
+
+from builder.core.settings import settings
+
+# Serialized text is encoded, hashed and written in blocks of about this many bytes.
+FLUSH_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class WrittenFile:
+    """
+    A file produced by one of the writers.
+
+    Attributes:
+        path (str): Absolute path of the file
+        sha256 (str): Hex SHA-256 of its bytes, computed while writing
+        size (int): Size in bytes
+    """
+    path: str
+    sha256: str
+    size: int
+
+
+class AtomicWriter:
+    """
+    Binary file writer that hashes bytes as they are written and publishes the file atomically.
+
+    Data goes to a temporary file in the destination directory; on a clean exit it is
+    fsynced and renamed over the destination, so readers see either the old file or the
+    complete new one, never a truncated one. On an exception the temporary file is removed.
+
+        with AtomicWriter(path) as out:
+            out.write(b"...")
+        out.result.sha256
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.result: Optional[WrittenFile] = None
+        self._tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        self._hasher = hashlib.sha256()
+        self._size = 0
+        self._file = None
+
+    def __enter__(self) -> "AtomicWriter":
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self._tmp_path, "wb")
+        return self
+
+    def write(self, data: bytes) -> None:
+        self._hasher.update(data)
+        self._file.write(data)
+        self._size += len(data)
+
+    def write_text(self, chunks: Iterable[str]) -> None:
+        """
+        Encodes text chunks as UTF-8, batching small chunks into FLUSH_SIZE blocks.
+        """
+        pending: list[str] = []
+        pending_size = 0
+        for chunk in chunks:
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= FLUSH_SIZE:
+                self.write("".join(pending).encode("utf-8"))
+                pending.clear()
+                pending_size = 0
+        if pending:
+            self.write("".join(pending).encode("utf-8"))
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+
+        if exc_type is not None:
+            os.remove(self._tmp_path)
+            return
+
+        os.replace(self._tmp_path, self.path)
+        self.result = WrittenFile(self.path, self._hasher.hexdigest(), self._size)
+
+
+def json_encoder(compact: Optional[bool] = None) -> json.JSONEncoder:
+    """
+    Returns the encoder for dataset JSON files in the selected output style.
+
+    Args:
+        compact (Optional[bool]): Minimal separators and no indentation; defaults to settings.compact
+
+    Returns:
+        json.JSONEncoder: Encoder keeping non-ASCII characters as-is
+    """
+    if compact is None:
+        compact = settings.compact
+    if compact:
+        return json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    return json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def iterencode_map(items: Iterable[tuple[str, int]], compact: Optional[bool] = None) -> Iterator[str]:
+    """
+    Encodes a flat {string: integer} object from its items, one chunk per entry,
+    byte for byte as json_encoder(compact) encodes the equivalent dict.
+
+    Args:
+        items (Iterable[tuple[str, int]]): Key/value pairs in output order, e.g. WidthMap.items()
+        compact (Optional[bool]): Output style; defaults to settings.compact
+
+    Yields:
+        str: JSON text chunks
+    """
+    if compact is None:
+        compact = settings.compact
+    opening, separator, closing, colon = ("{", ",", "}", ":") if compact else ("{\n  ", ",\n  ", "\n}", ": ")
+    prefix = opening
+    for key, value in items:
+        yield f"{prefix}{encode_basestring(key)}{colon}{value}"
+        prefix = separator
+    yield "{}" if prefix == opening else closing
+
+
+def write_json_atomic(path: str, payload: object, compact: Optional[bool] = None) -> WrittenFile:
+    """
+    Streams a JSON document to disk through the hash and publishes it atomically.
+
+    The encoder's output is consumed chunk by chunk (json.JSONEncoder.iterencode),
+    so the serialized text never exists as one string.
+
+    Args:
+        path (str): Destination file
+        payload (object): JSON-serializable document
+        compact (Optional[bool]): Output style; defaults to settings.compact
+
+    Returns:
+        WrittenFile: Path, SHA-256 and size of the written file
+    """
+    with AtomicWriter(path) as out:
+        out.write_text(json_encoder(compact).iterencode(payload))
+    return out.result
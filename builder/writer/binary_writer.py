@@ -0,0 +1,64 @@
+import struct
+
+from char_table.ranges import WidthRange
+from char_table.mmap_table import BLOCK_SIZE, HEADER, MAGIC, FORMAT_VERSION, UNCOVERED
+
+from builder.core.trace import annotate, traced
+from builder.core.path_utils import resolve_current_path
+from builder.writer.atomic_writer import AtomicWriter, WrittenFile
+
+# Total number of code points in the Unicode codespace (U+0000..U+10FFFF).
+CODESPACE = 0x110000
+
+
+def build_two_stage_table(ranges: list[WidthRange]) -> bytes:
+    """
+    Builds the two-stage lookup table described in char_table/mmap_table.py.
+
+    The codespace is cut into 256-entry blocks; identical blocks are stored once
+    as leaves and the block index maps each block to its leaf.
+
+    Args:
+        ranges (list[WidthRange]): Sorted, non-overlapping (start, end, width) ranges
+
+    Returns:
+        bytes: Serialized table (header, block index, leaves)
+    """
+    flat = bytearray([UNCOVERED]) * CODESPACE
+    for start, end, width in ranges:
+        flat[start:end + 1] = bytes([width]) * (end - start + 1)
+
+    leaves: dict[bytes, int] = {}
+    index: list[int] = []
+    for offset in range(0, CODESPACE, BLOCK_SIZE):
+        block = bytes(flat[offset:offset + BLOCK_SIZE])
+        index.append(leaves.setdefault(block, len(leaves)))
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, BLOCK_SIZE, len(index), len(leaves))
+    body = struct.pack(f"<{len(index)}H", *index)
+    return header + body + b"".join(leaves)
+
+
+@traced("write")
+def write_width_table(rel_path: str, ranges: list[WidthRange]) -> WrittenFile:
+    """
+    Writes the memory-mappable two-stage width table to char_table/current/{rel_path}.
+
+    Args:
+        rel_path (str): Relative path under current/, e.g. "width_table.bin"
+        ranges (list[WidthRange]): Merged ranges from all datasets
+
+    Returns:
+        WrittenFile: Absolute path, SHA-256 and size of the written file
+    """
+    output_path = resolve_current_path(rel_path)
+    payload = build_two_stage_table(ranges)
+
+    # Replaced atomically: processes mapping the old table keep their mapping intact
+    with AtomicWriter(output_path) as out:
+        out.write(payload)
+
+    leaf_count = HEADER.unpack_from(payload)[4]
+    annotate(entries=len(ranges), bytes_written=len(payload))
+    print(f"✅ Binary table written: {output_path} ({len(payload)} bytes, {leaf_count} leaves)")
+    return out.result
@@ -1,25 +1,33 @@
-import json
-
+from builder.core.trace import annotate, traced
+from builder.core.width_map import WidthMap
 from builder.core.path_utils import resolve_current_path
+from builder.writer.atomic_writer import AtomicWriter, WrittenFile, iterencode_map
 
 
-def write_current_json(category: str, name: str, data: dict[str, int]) -> str:
+@traced("write")
+def write_current_json(category: str, name: str, data: WidthMap) -> WrittenFile:
     """
     Writes a character-width mapping JSON file to char_table/current/{category}/{name}.json.
 
+    Entries are streamed from the map's ranges in code point order, so no dict is built.
+    The file is hashed while it is written and replaced atomically; its layout follows
+    the build's output style (pretty by default, compact with `--compact`).
+
     Args:
         category (str): Subdirectory under current/, e.g. "emoji", "cjk"
         name (str): File name without extension, e.g. "emoji_base"
-        data (dict[str, int]): Character width mapping
+        data (WidthMap): Character width mapping
 
     Returns:
-        str: The full absolute path of the written JSON file
+        WrittenFile: Absolute path, SHA-256 and size of the written JSON file
     """
     rel_path = f"{category}/{name}.json"
     output_path = resolve_current_path(rel_path)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with AtomicWriter(output_path) as out:
+        out.write_text(iterencode_map(data.items()))
 
-    print(f"✅ JSON written: {output_path} ({len(data)} entries)")
-    return output_path
+    entries = len(data)
+    annotate(dataset=name, entries=entries, bytes_written=out.result.size)
+    print(f"✅ JSON written: {output_path} ({entries} entries)")
+    return out.result
@@ -1,12 +1,28 @@
 import json
 import hashlib
+from typing import Optional
 from datetime import datetime, timezone
 
 from builder.core.version import read_version
+from builder.core.trace import annotate, traced
 from builder.core.path_utils import resolve_current_path, resolve_meta_path
+from builder.writer.atomic_writer import AtomicWriter
 
 
-def write_meta_json(name: str, source_url: str, target_rel_path: str, entry_count: int) -> None:
+def _hash_existing(path: str) -> tuple[str, int]:
+    # Fallback for files not produced by the hashing writers: hash them in chunks.
+    hasher = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(chunk)
+            size += len(chunk)
+    return hasher.hexdigest(), size
+
+
+@traced("write")
+def write_meta_json(name: str, source_url: str, target_rel_path: str, entry_count: int,
+                    sha256: Optional[str] = None) -> None:
     """
     Write a corresponding metadata file for a given dataset,
     saving it under char_table/meta/.
@@ -16,14 +32,13 @@ def write_meta_json(name: str, source_url: str, target_rel_path: str, entry_coun
         source_url (str): Source URL used to generate this dataset
         target_rel_path (str): Relative path of the output file, e.g. "emoji/emoji_base.json"
         entry_count (int): Number of entries in the generated dataset
+        sha256 (Optional[str]): Digest handed over by the writer that produced the file
+            (`WrittenFile.sha256`); when omitted the file is re-read and hashed
     """
-    # Locate the target data file
-    data_path = resolve_current_path(target_rel_path)
-    with open(data_path, "rb") as f:
-        file_bytes = f.read()
-
-    # Calculate SHA-256 hash of the output file
-    file_hash = hashlib.sha256(file_bytes).hexdigest()
+    # Use the digest computed while writing, or hash the target data file
+    if sha256 is None:
+        sha256, bytes_read = _hash_existing(resolve_current_path(target_rel_path))
+        annotate(bytes_read=bytes_read)
 
     # Get current UTC time (ISO 8601 format with trailing Z)
     now = datetime.utcnow().replace(tzinfo=timezone.utc)
@@ -38,13 +53,14 @@ def write_meta_json(name: str, source_url: str, target_rel_path: str, entry_coun
         "source": source_url,
         "last_fetched": iso_time,
         "entry_count": entry_count,
-        "hash": file_hash,
+        "hash": sha256,
         "version": version
     }
 
     # Write to char_table/meta/{name}.meta.json
     meta_path = resolve_meta_path(name)
-    with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump(meta, f, ensure_ascii=False, indent=2)
+    with AtomicWriter(meta_path) as out:
+        out.write(json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8"))
+    annotate(dataset=name, bytes_written=out.result.size)
 
     print(f"📝 Meta written: {meta_path}")
@@ -0,0 +1,99 @@
+from typing import Union
+
+from char_table.ranges import WidthRange, ranges_from_pairs
+
+from builder.core.trace import annotate, traced
+from builder.core.width_map import WidthMap
+from builder.core.path_utils import resolve_current_path
+from builder.writer.atomic_writer import WrittenFile, write_json_atomic
+
+
+def ranges_payload(data: Union[WidthMap, dict[str, int]]) -> dict:
+    """
+    Builds the .ranges.json document for a character-width mapping (see write_ranges_json()).
+
+    A WidthMap already holds both parts. A dict (a dataset JSON file read back, when a
+    patch rebuilds an archived snapshot) keeps its sequences in file order, as they
+    were written.
+
+    Args:
+        data (Union[WidthMap, dict[str, int]]): Character width mapping
+
+    Returns:
+        dict: {"ranges": [[start, end, width], ...], "sequences": {sequence: width}}
+    """
+    if isinstance(data, WidthMap):
+        return {"ranges": [list(r) for r in data.ranges()], "sequences": dict(data.sequences)}
+    ranges = ranges_from_pairs((ord(ch), width) for ch, width in data.items() if len(ch) == 1)
+    return {
+        "ranges": [list(r) for r in ranges],
+        "sequences": {seq: width for seq, width in data.items() if len(seq) != 1},
+    }
+
+
+@traced("write")
+def write_ranges_json(category: str, name: str, data: WidthMap) -> tuple[WrittenFile, int]:
+    """
+    Writes a range-compressed copy of a character-width mapping to
+    char_table/current/{category}/{name}.ranges.json.
+
+    Single-codepoint entries are folded into sorted `[start, end, width]` triples
+    (inclusive, decimal code points). Multi-codepoint entries such as ZWJ emoji
+    cannot be expressed as ranges and are kept verbatim under "sequences", so the
+    file stays lossless:
+
+        {"ranges": [[13312, 19903, 2], ...], "sequences": {"👨‍👩‍👧": 2}}
+
+    Args:
+        category (str): Subdirectory under current/, e.g. "emoji", "cjk"
+        name (str): Dataset name without extension, e.g. "cjk_unified"
+        data (WidthMap): Character width mapping
+
+    Returns:
+        tuple[WrittenFile, int]: The written file (path, SHA-256, size) and its entry count
+            (number of ranges plus number of sequences)
+    """
+    rel_path = f"{category}/{name}.ranges.json"
+    output_path = resolve_current_path(rel_path)
+
+    payload = ranges_payload(data)
+    ranges, sequences = payload["ranges"], payload["sequences"]
+
+    written = write_json_atomic(output_path, payload)
+
+    entry_count = len(ranges) + len(sequences)
+    annotate(dataset=name, entries=entry_count, bytes_written=written.size)
+    print(f"✅ Ranges written: {output_path} ({len(ranges)} ranges, {len(sequences)} sequences)")
+    return written, entry_count
+
+
+@traced("write")
+def write_range_table(rel_path: str, ranges: list[WidthRange], classes: list[tuple[int, int, str]]) -> WrittenFile:
+    """
+    Writes a gap-free code point table to char_table/current/{rel_path}, in the .ranges.json
+    layout plus the property value of every range:
+
+        {"ranges": [[0, 4351, 1], [4352, 4447, 2], ...],
+         "classes": [[0, 31, "N"], [32, 126, "Na"], ...],
+         "sequences": {}}
+
+    Args:
+        rel_path (str): Relative path under current/, e.g. "unicode/east_asian_width.ranges.json"
+        ranges (list[WidthRange]): Merged (start, end, width) ranges covering the codespace
+        classes (list[tuple[int, int, str]]): Merged (start, end, property value) ranges
+
+    Returns:
+        WrittenFile: Absolute path, SHA-256 and size of the written file
+    """
+    output_path = resolve_current_path(rel_path)
+    payload = {
+        "ranges": [list(r) for r in ranges],
+        "classes": [list(r) for r in classes],
+        "sequences": {},
+    }
+
+    written = write_json_atomic(output_path, payload)
+
+    annotate(entries=len(ranges), bytes_written=written.size)
+    print(f"✅ Range table written: {output_path} ({len(ranges)} ranges, {len(classes)} class ranges)")
+    return written
@@ -1,29 +1,31 @@
-import os
-
+from builder.core.trace import annotate, traced
+from builder.core.width_map import WidthMap
 from builder.core.path_utils import resolve_category_path
+from builder.writer.atomic_writer import AtomicWriter, WrittenFile
 
 
-def write_category_text(name: str, char_map: dict[str, int]) -> None:
+@traced("write")
+def write_category_text(name: str, char_map: WidthMap) -> WrittenFile:
     """
     Writes a plain-text character list file under char_table/categories/,
     with one character per line, for category-based lookup.
 
     Args:
         name (str): Dataset name (e.g., "emoji_base", "cjk_unified")
-        char_map (dict[str, int]): Mapping of characters to display width (typically 2)
-    """
-    # Sort for deterministic output
-    sorted_chars = sorted(char_map)
+        char_map (WidthMap): Mapping of characters to display width (typically 2);
+            its keys come out already sorted, so nothing is sorted here
 
-    # Resolve absolute path
+    Returns:
+        WrittenFile: Absolute path, SHA-256 and size of the written list
+    """
+    # Resolve absolute path (parent directory is created on demand)
     output_path = resolve_category_path(name)
 
-    # Ensure parent directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-    # Write each character to a new line
-    with open(output_path, "w", encoding="utf-8") as f:
-        for ch in sorted_chars:
-            f.write(ch + "\n")
+    # Write each character to a new line, replacing the old list atomically
+    with AtomicWriter(output_path) as out:
+        out.write_text(ch + "\n" for ch in char_map)
 
-    print(f"📝 Category TXT written: {output_path} ({len(sorted_chars)} chars)")
+    entries = len(char_map)
+    annotate(dataset=name, entries=entries, bytes_written=out.result.size)
+    print(f"📝 Category TXT written: {output_path} ({entries} chars)")
+    return out.result
@@ -0,0 +1,201 @@
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Optional, Union
+
+from builder.core.trace import annotate, stage, traced
+from builder.core.width_map import WidthMap
+from builder.core.scheduler import default_jobs
+from builder.core.path_utils import resolve_category_path, resolve_current_path, resolve_meta_path
+from builder.writer.atomic_writer import AtomicWriter, WrittenFile
+from builder.writer.default_writer import write_current_json
+from builder.writer.meta_writer import write_meta_json
+from builder.writer.range_writer import write_ranges_json
+from builder.writer.row_writer import write_category_text
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """
+    One generated dataset, handed to every output sink.
+
+    Attributes:
+        name (str): Dataset name, e.g. "cjk_unified"
+        category (str): Subdirectory under current/, e.g. "cjk"
+        source_url (str): Upstream source recorded in every meta file
+        data (WidthMap): Character width mapping, iterated in code point order by every sink;
+            a plain dict (e.g. from an extractor outside builder/parser/) is converted once
+    """
+    name: str
+    category: str
+    source_url: str
+    data: Union[WidthMap, Mapping[str, int]]
+
+    def __post_init__(self):
+        if not isinstance(self.data, WidthMap):
+            with stage("index_dataset", "write", dataset=self.name):
+                object.__setattr__(self, "data", WidthMap.from_dict(self.data))
+
+    @property
+    def rel_path(self) -> str:
+        """
+        Path of the dataset JSON under current/, e.g. "cjk/cjk_unified.json".
+        """
+        return f"{self.category}/{self.name}.json"
+
+
+class Sink:
+    """
+    One output format of a dataset.
+
+    A sink writes its file and the meta document describing it, and never reads what
+    another sink wrote, so the sinks of a dataset can run concurrently.
+    Subclasses set `name` and implement write() and outputs().
+    """
+
+    name = ""
+
+    def outputs(self, category: str, name: str) -> tuple[str, ...]:
+        """
+        Returns the absolute paths write() produces for a dataset, meta files included.
+
+        Args:
+            category (str): Subdirectory under current/
+            name (str): Dataset name
+        """
+        raise NotImplementedError
+
+    def write(self, dataset: Dataset) -> list[WrittenFile]:
+        """
+        Serializes the dataset.
+
+        Args:
+            dataset (Dataset): Prepared dataset
+
+        Returns:
+            list[WrittenFile]: Files written (meta files excluded)
+        """
+        raise NotImplementedError
+
+
+class JsonSink(Sink):
+    """
+    current/{category}/{name}.json and meta/{name}.meta.json.
+    """
+
+    name = "json"
+
+    def outputs(self, category: str, name: str) -> tuple[str, ...]:
+        return resolve_current_path(f"{category}/{name}.json"), resolve_meta_path(name)
+
+    def write(self, dataset: Dataset) -> list[WrittenFile]:
+        written = write_current_json(dataset.category, dataset.name, dataset.data)
+        write_meta_json(dataset.name, dataset.source_url, dataset.rel_path, len(dataset.data), written.sha256)
+        return [written]
+
+
+class RangesSink(Sink):
+    """
+    current/{category}/{name}.ranges.json and meta/{name}.ranges.meta.json.
+    """
+
+    name = "ranges"
+
+    def outputs(self, category: str, name: str) -> tuple[str, ...]:
+        return resolve_current_path(f"{category}/{name}.ranges.json"), resolve_meta_path(f"{name}.ranges")
+
+    def write(self, dataset: Dataset) -> list[WrittenFile]:
+        written, entry_count = write_ranges_json(dataset.category, dataset.name, dataset.data)
+        rel_path = f"{dataset.category}/{dataset.name}.ranges.json"
+        write_meta_json(f"{dataset.name}.ranges", dataset.source_url, rel_path, entry_count, written.sha256)
+        return [written]
+
+
+class CategoryTextSink(Sink):
+    """
+    categories/{name}.txt, one character per line in sorted order.
+    """
+
+    name = "category"
+
+    def outputs(self, category: str, name: str) -> tuple[str, ...]:
+        return (resolve_category_path(name),)
+
+    def write(self, dataset: Dataset) -> list[WrittenFile]:
+        return [write_category_text(dataset.name, dataset.data)]
+
+
+class BinarySink(Sink):
+    """
+    current/{category}/{name}.bin, a two-stage table of the dataset's single code points
+    (the width_table.bin layout, see char_table/mmap_table.py), and meta/{name}.bin.meta.json.
+
+    Not written by default; pass sinks=(*DEFAULT_SINKS, "binary") to write_dataset().
+    """
+
+    name = "binary"
+
+    def outputs(self, category: str, name: str) -> tuple[str, ...]:
+        return resolve_current_path(f"{category}/{name}.bin"), resolve_meta_path(f"{name}.bin")
+
+    def write(self, dataset: Dataset) -> list[WrittenFile]:
+        from builder.writer.binary_writer import build_two_stage_table
+
+        rel_path = f"{dataset.category}/{dataset.name}.bin"
+        output_path = resolve_current_path(rel_path)
+        with stage("write_dataset_binary", "write", dataset=dataset.name):
+            ranges = dataset.data.ranges()
+            with AtomicWriter(output_path) as out:
+                out.write(build_two_stage_table(ranges))
+            annotate(entries=len(ranges), bytes_written=out.result.size)
+
+        print(f"✅ Binary table written: {output_path} ({out.result.size} bytes)")
+        write_meta_json(f"{dataset.name}.bin", dataset.source_url, rel_path, len(ranges), out.result.sha256)
+        return [out.result]
+
+
+# Sinks by name; register a Sink subclass here to add an output format.
+SINKS: dict[str, type[Sink]] = {
+    sink.name: sink for sink in (JsonSink, RangesSink, CategoryTextSink, BinarySink)
+}
+
+# Formats every dataset generator writes.
+DEFAULT_SINKS = ("json", "ranges", "category")
+
+
+@traced("write")
+def write_dataset(dataset: Dataset, sinks: Iterable[str] = DEFAULT_SINKS,
+                  jobs: Optional[int] = None) -> dict[str, list[WrittenFile]]:
+    """
+    Fans one dataset out to its output sinks, running them concurrently.
+
+    The dataset's WidthMap is already in code point order; each sink serializes it to
+    its own file (and meta) on a thread of its own. Encoding holds the GIL, but the fsync and
+    rename of every file do not, so an extra format costs its encoding time rather
+    than another full write. With a single CPU the sinks run one after another, since
+    threads would then only add GIL hand-offs.
+
+    Args:
+        dataset (Dataset): Prepared dataset
+        sinks (Iterable[str]): Names from SINKS
+        jobs (Optional[int]): Threads to use; defaults to one per sink, at most one per CPU
+
+    Returns:
+        dict[str, list[WrittenFile]]: Files written by each sink
+
+    Raises:
+        KeyError: If a sink name is not registered
+        Exception: The first error a sink raised, after every sink has finished
+    """
+    selected = [SINKS[name]() for name in sinks]
+    annotate(dataset=dataset.name, entries=len(dataset.data))
+    jobs = jobs or min(len(selected), default_jobs())
+    if jobs <= 1:
+        return {sink.name: sink.write(dataset) for sink in selected}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix=f"sink-{dataset.name}") as pool:
+        futures = {sink.name: pool.submit(sink.write, dataset) for sink in selected}
+    errors = [future.exception() for future in futures.values() if future.exception() is not None]
+    if errors:
+        raise errors[0]
+    return {name: future.result() for name, future in futures.items()}
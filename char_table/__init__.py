@@ -0,0 +1,14 @@
+from char_table.table import WidthTable, get_table, load_table, width
+from char_table.strwidth import StringWidthEngine, disable_cache, enable_cache, get_engine, str_width
+
+__all__ = [
+    "StringWidthEngine",
+    "WidthTable",
+    "disable_cache",
+    "enable_cache",
+    "get_engine",
+    "get_table",
+    "load_table",
+    "str_width",
+    "width",
+]
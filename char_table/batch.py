@@ -0,0 +1,223 @@
+import threading
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the batch API needs it
+    np = None
+
+from char_table.strwidth import SequenceTrie
+from char_table.table import DEFAULT_WIDTH, WidthTable, get_datasets
+
+# One past the last Unicode code point.
+CODESPACE = 0x110000
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("char_table.batch needs NumPy: pip install numpy")
+
+
+def encode_utf32(strings: Iterable[str]) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Concatenates strings into one UTF-32 code point array without creating per-character objects.
+
+    The text is joined and encoded by the codec in C, then viewed as an array in place.
+
+    Args:
+        strings (Iterable[str]): Strings to encode
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: uint32 code points, and int64 offsets of length
+            len(strings) + 1 where string i spans code points [offsets[i], offsets[i + 1])
+    """
+    _require_numpy()
+    strings = strings if isinstance(strings, (list, tuple)) else list(strings)
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, strings), dtype=np.int64, count=len(strings)), out=offsets[1:])
+    data = "".join(strings).encode("utf-32-le", "surrogatepass")
+    return np.frombuffer(data, dtype="<u4"), offsets
+
+
+class BatchWidthEngine:
+    """
+    Vectorized width computation over UTF-32 code point arrays.
+
+    Single code points are classified with one np.searchsorted over the start column
+    of a gap-free range table (uncovered gaps filled with the default width), and
+    per-string totals come from np.add.reduceat over the per-code-point widths.
+
+    Multi-codepoint sequences (ZWJ emoji, VS16 and keycap sequences, flags) are handled
+    by a pre-pass: np.isin marks every code point that is the second character of some
+    sequence (ZWJ, VS16, skin tone modifiers, regional indicators, ...), and only the
+    position before each mark is tried against the sequence trie. Candidates are
+    visited left to right and skipped once covered, so the result is the same greedy
+    scan StringWidthEngine.str_width() performs. A matched sequence adds its
+    correction (sequence width minus the sum of its code points) at its first position.
+    """
+
+    def __init__(self, table: WidthTable, sequences: dict[str, int], default: int = DEFAULT_WIDTH):
+        _require_numpy()
+        self.default = default
+
+        starts: list[int] = []
+        widths: list[int] = []
+        cursor = 0
+        for start, end, width in table.ranges():
+            if start > cursor:
+                starts.append(cursor)
+                widths.append(default)
+            starts.append(start)
+            widths.append(width)
+            cursor = end + 1
+        if cursor < CODESPACE:
+            starts.append(cursor)
+            widths.append(default)
+        self.starts = np.asarray(starts, dtype=np.uint32)
+        self.range_widths = np.asarray(widths, dtype=np.int32)
+
+        sequences = {seq: width for seq, width in sequences.items() if len(seq) > 1}
+        self.trie = SequenceTrie(sequences)
+        self.max_sequence = max(map(len, sequences), default=0)
+        self._adjust = {
+            seq: width - sum(table.lookup(ord(ch), default) for ch in seq)
+            for seq, width in sequences.items()
+        }
+        self._pivots = np.unique(np.fromiter((ord(seq[1]) for seq in sequences), dtype=np.uint32))
+
+    def codepoint_widths(self, codepoints: "np.ndarray") -> "np.ndarray":
+        """
+        Classifies code points by their single-codepoint width, ignoring sequences.
+
+        Args:
+            codepoints (np.ndarray): Code points (any unsigned integer dtype)
+
+        Returns:
+            np.ndarray: int32 width of each code point
+        """
+        return self.range_widths[np.searchsorted(self.starts, codepoints, side="right") - 1]
+
+    def sequence_corrections(self, codepoints: "np.ndarray", offsets: Optional["np.ndarray"] = None
+                             ) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        Finds the sequences a greedy left-to-right scan would consume.
+
+        Sequences never span two strings of the batch.
+
+        Args:
+            codepoints (np.ndarray): uint32 code points
+            offsets (Optional[np.ndarray]): String boundaries from encode_utf32(); None for one string
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Positions where matched sequences start, and the
+                width correction to add at each
+        """
+        if not len(self._pivots) or len(codepoints) < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32)
+
+        candidates = np.flatnonzero(np.isin(codepoints[1:], self._pivots))
+        if not len(candidates):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32)
+
+        if offsets is None:
+            limits = np.full(len(candidates), len(codepoints), dtype=np.int64)
+        else:
+            limits = offsets[np.searchsorted(offsets, candidates, side="right")]
+        limits = np.minimum(limits, candidates + self.max_sequence)
+
+        positions: list[int] = []
+        corrections: list[int] = []
+        longest_match = self.trie.longest_match
+        adjust = self._adjust
+        covered = 0
+        for start, limit in zip(candidates.tolist(), limits.tolist()):
+            if start < covered or limit - start < 2:
+                continue
+            window = codepoints[start:limit].astype("<u4").tobytes().decode("utf-32-le", "surrogatepass")
+            match = longest_match(window, 0)
+            if match is not None:
+                positions.append(start)
+                corrections.append(adjust[window[:match[0]]])
+                covered = start + match[0]
+        return np.asarray(positions, dtype=np.int64), np.asarray(corrections, dtype=np.int32)
+
+    def width_of_buffer(self, codepoints: "np.ndarray", offsets: Optional["np.ndarray"] = None):
+        """
+        Computes display widths straight from a UTF-32 code point array.
+
+        Args:
+            codepoints (np.ndarray): Code points, e.g. np.frombuffer(text.encode("utf-32-le"), "<u4")
+            offsets (Optional[np.ndarray]): String boundaries (len(strings) + 1 entries, first 0,
+                last len(codepoints)); None measures the whole buffer as one string
+
+        Returns:
+            int | np.ndarray: The total width, or the int64 width of each string when offsets are given
+        """
+        codepoints = np.asarray(codepoints)
+        widths = self.codepoint_widths(codepoints)
+        positions, corrections = self.sequence_corrections(codepoints, offsets)
+        np.add.at(widths, positions, corrections)
+
+        if offsets is None:
+            return int(widths.sum(dtype=np.int64))
+
+        totals = np.zeros(len(offsets) - 1, dtype=np.int64)
+        lengths = np.diff(offsets)
+        nonempty = lengths > 0
+        if nonempty.any():
+            # reduceat sums from each start to the next start; empty strings are skipped
+            totals[nonempty] = np.add.reduceat(widths.astype(np.int64), offsets[:-1][nonempty])
+        return totals
+
+    def widths(self, strings: Iterable[str]) -> "np.ndarray":
+        """
+        Computes the display width of many strings at once.
+
+        Args:
+            strings (Iterable[str]): Strings to measure
+
+        Returns:
+            np.ndarray: int64 width of each string, in order
+        """
+        codepoints, offsets = encode_utf32(strings)
+        return self.width_of_buffer(codepoints, offsets)
+
+
+_default_engine: Optional[BatchWidthEngine] = None
+_default_lock = threading.Lock()
+
+
+def get_batch_engine() -> BatchWidthEngine:
+    """
+    Returns the process-wide BatchWidthEngine built from the shipped datasets.
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    global _default_engine
+    if _default_engine is None:
+        with _default_lock:
+            if _default_engine is None:
+                table, sequences = get_datasets()
+                _default_engine = BatchWidthEngine(table, sequences)
+    return _default_engine
+
+
+def widths(strings: Iterable[str]) -> "np.ndarray":
+    """
+    Returns the display width of each string, treating emoji ZWJ sequences as single units.
+
+    Args:
+        strings (Iterable[str]): Strings to measure
+
+    Returns:
+        np.ndarray: int64 widths, e.g. [2, 4] for ["👨‍👩‍👧‍👦", "漢字"]
+    """
+    return get_batch_engine().widths(strings)
+
+
+def width_of_buffer(codepoints: "np.ndarray", offsets: Optional["np.ndarray"] = None):
+    """
+    Returns the display width of a UTF-32 code point buffer (see BatchWidthEngine.width_of_buffer()).
+    """
+    return get_batch_engine().width_of_buffer(codepoints, offsets)
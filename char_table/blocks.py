@@ -0,0 +1,93 @@
+# Declarative block tables: inclusive (start, end) code point ranges, sorted ascending.
+# Each block dataset is its whole table at width 2, built the same way by the builder
+# (builder/parser/language_parser.py, symbol_parser.py) and the runtime (char_table/rules_table.py);
+# the ascending order keeps dataset output in code point order.
+CodepointRanges = tuple[tuple[int, int], ...]
+
+# CJK Unified Ideographs (Basic + Extension A–G + Compatibility Ideographs).
+CJK_UNIFIED_RANGES: CodepointRanges = (
+    (0x3400, 0x4DBF),    # Extension A
+    (0x4E00, 0x9FFF),    # Basic CJK Ideographs
+    (0xF900, 0xFAFF),    # Compatibility Ideographs
+    (0x20000, 0x2A6DF),  # Extension B
+    (0x2A700, 0x2B73F),  # Extension C
+    (0x2B740, 0x2B81F),  # Extension D
+    (0x2B820, 0x2CEAF),  # Extension E
+    (0x2CEB0, 0x2EBEF),  # Extension F
+    (0x30000, 0x3134F),  # Extension G
+)
+
+# Japanese kana blocks.
+JAPANESE_KANA_RANGES: CodepointRanges = (
+    (0x3040, 0x309F),    # Hiragana
+    (0x30A0, 0x30FF),    # Katakana
+    (0x31F0, 0x31FF),    # Katakana Phonetic Extensions
+    (0x1B000, 0x1B0FF),  # Kana Supplement
+    (0x1B100, 0x1B12F),  # Kana Extended-A
+    (0x1B130, 0x1B16F),  # Kana Extended-B
+)
+
+# Hangul Syllables block.
+KOREAN_SYLLABLE_RANGES: CodepointRanges = (
+    (0xAC00, 0xD7AF),
+)
+
+# Punctuation and symbols that CJK typography renders two columns wide, curated by hand
+# (the fullwidth_punctuations dataset). "――" (two dashes) is a two-character sequence.
+FULLWIDTH_PUNCTUATIONS: dict[str, int] = {
+    # Title marks / brackets (commonly used in CJK)
+    "《": 2, "》": 2, "「": 2, "」": 2, "『": 2, "』": 2,
+    "【": 2, "】": 2, "（": 2, "）": 2, "［": 2, "］": 2,
+    "｛": 2, "｝": 2, "〈": 2, "〉": 2, "﹃": 2, "﹄": 2,
+    "︻": 2, "︼": 2,
+
+    # Quotation marks
+    "“": 2, "”": 2, "‘": 2, "’": 2,
+
+    # Sentence punctuation
+    "。": 2, "、": 2, "，": 2, "．": 2,
+    "：": 2, "；": 2, "？": 2, "！": 2,
+
+    # Tilde / middle dots / continuation marks
+    "〜": 2, "～": 2, "・": 2,
+    "—": 2, "――": 2, "…": 2, "‥": 2,
+    "︰": 2, "﹏": 2,
+
+    # Reference / symbolic marks
+    "※": 2, "†": 2, "‡": 2, "￣": 2, "　": 2,
+
+    # Circled numbers
+    "①": 2, "②": 2, "③": 2, "④": 2, "⑤": 2,
+    "⑥": 2, "⑦": 2, "⑧": 2, "⑨": 2, "⑩": 2,
+
+    # Common graphic symbols
+    "●": 2, "○": 2, "◆": 2, "◇": 2,
+    "■": 2, "□": 2, "★": 2, "☆": 2,
+
+    # Arrows
+    "→": 2, "←": 2, "↑": 2, "↓": 2,
+    "↔": 2, "⇔": 2,
+
+    # Units
+    "℃": 2, "℉": 2,
+
+    # Box drawing
+    "╭": 2, "╮": 2, "╯": 2, "╰": 2,
+    "━": 2, "┃": 2, "┏": 2, "┓": 2, "┗": 2, "┛": 2,
+}
+
+# Fullwidth forms from the Halfwidth and Fullwidth Forms block.
+FULLWIDTH_VARIANT_RANGES: CodepointRanges = (
+    (0xFF01, 0xFF60),    # Fullwidth ASCII variants and brackets
+    (0xFFE0, 0xFFE6),    # Fullwidth symbol variants
+)
+
+# Code points EastAsianWidth.txt does not list are "N", except unassigned ones in these
+# ranges, which default to "W" (see the header of EastAsianWidth.txt).
+EAST_ASIAN_WIDE_DEFAULT_RANGES: CodepointRanges = (
+    (0x3400, 0x4DBF),    # CJK Unified Ideographs Extension A
+    (0x4E00, 0x9FFF),    # CJK Unified Ideographs
+    (0xF900, 0xFAFF),    # CJK Compatibility Ideographs
+    (0x20000, 0x2FFFD),  # Plane 2
+    (0x30000, 0x3FFFD),  # Plane 3
+)
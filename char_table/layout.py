@@ -0,0 +1,251 @@
+import re
+import weakref
+import threading
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Literal, Optional
+
+from char_table.strwidth import StringWidthEngine, get_engine
+
+Align = Literal["left", "right", "center"]
+
+# A run of whitespace; wrap() breaks lines there and drops it. Newlines end paragraphs instead.
+_SPACES = re.compile(r"[^\S\n]+")
+_SPACE = re.compile(r"[^\S\n]")
+
+
+class _CharWidths(dict):
+    # Character → width, filled on first sight; map(widths.__getitem__, text) then runs in C.
+    # Holds the engine's table rather than the engine, so the cache never keeps its engine alive.
+    def __init__(self, engine: StringWidthEngine):
+        super().__init__()
+        self.lookup = engine.table.lookup
+        self.default = engine.default
+
+    def __missing__(self, ch: str) -> int:
+        width = self[ch] = self.lookup(ord(ch), self.default)
+        return width
+
+
+class MeasuredText:
+    """
+    A string with its cumulative column widths, for repeated width-aware cuts.
+
+    `columns[i]` is the width of `text[:i]`, built once in O(n). Any cut point is
+    then a binary search, so cutting the same text at many widths costs O(log n)
+    each instead of re-measuring a prefix every time.
+
+    Multi-codepoint sequences from emoji_zwj carry their whole width on their first
+    character and 0 on the rest, and cut points are never placed inside them.
+
+    Attributes:
+        text (str): The measured text
+        engine (StringWidthEngine): Engine the text was measured with
+        columns (array): Prefix sums of column widths, len(text) + 1 entries
+        width (int): Display width of the whole text
+    """
+
+    __slots__ = ("text", "engine", "columns", "width", "_span_starts", "_span_ends")
+
+    def __init__(self, text: str, engine: Optional[StringWidthEngine] = None):
+        engine = engine or get_engine()
+        self.text = text
+        self.engine = engine
+
+        widths = list(map(_char_widths(engine).__getitem__, text))
+        spans = engine.sequence_spans(text) if not text.isascii() else []
+        for start, end in spans:
+            widths[start] = engine.sequences[text[start:end]]
+            widths[start + 1:end] = [0] * (end - start - 1)
+
+        self.columns = array("I", accumulate(widths, initial=0))
+        self.width = self.columns[-1]
+        self._span_starts = [start for start, _ in spans]
+        self._span_ends = [end for _, end in spans]
+
+    def _boundary(self, index: int, limit: int) -> int:
+        # Moves an index that falls inside a sequence to its end if that still fits, else to its start.
+        i = bisect_right(self._span_starts, index) - 1
+        if i >= 0 and self._span_starts[i] < index < self._span_ends[i]:
+            end = self._span_ends[i]
+            return end if self.columns[end] <= limit else self._span_starts[i]
+        return index
+
+    def _unit_end(self, index: int) -> int:
+        # End of the unit (character or whole sequence) starting at index.
+        i = bisect_right(self._span_starts, index) - 1
+        return self._span_ends[i] if i >= 0 and self._span_starts[i] == index else index + 1
+
+    def cut(self, cols: int, start: int = 0) -> int:
+        """
+        Finds the longest prefix of `text[start:]` that fits in `cols` columns.
+
+        Args:
+            cols (int): Available columns
+            start (int): Index the prefix starts at
+
+        Returns:
+            int: End index of the prefix (== start when not even one unit fits)
+        """
+        limit = self.columns[start] + max(cols, 0)
+        index = bisect_right(self.columns, limit, start) - 1
+        return self._boundary(index, limit) if self._span_starts else index
+
+    def truncate(self, cols: int, placeholder: str = "…") -> str:
+        """
+        Shortens the text to at most `cols` columns, ending with `placeholder` when cut.
+
+        Args:
+            cols (int): Maximum display width of the result
+            placeholder (str): Appended when text is removed; dropped if it alone does not fit
+
+        Returns:
+            str: The text itself if it fits, otherwise a prefix plus the placeholder
+        """
+        if self.width <= cols:
+            return self.text
+        placeholder_width = self.engine.str_width(placeholder) if placeholder else 0
+        if placeholder_width > cols:
+            placeholder, placeholder_width = "", 0
+        return self.text[:self.cut(cols - placeholder_width)] + placeholder
+
+    def pad(self, cols: int, align: Align = "left", fill: str = " ") -> str:
+        """
+        Pads the text with a one-column fill character up to `cols` columns.
+
+        Args:
+            cols (int): Target display width; wider text is returned unchanged
+            align (Align): "left", "right" or "center" (extra column goes to the right)
+            fill (str): Single fill character
+
+        Returns:
+            str: The padded text
+
+        Raises:
+            ValueError: If align is not one of the three values
+        """
+        gap = cols - self.width
+        if align not in ("left", "right", "center"):
+            raise ValueError(f"align must be 'left', 'right' or 'center', not {align!r}")
+        if gap <= 0:
+            return self.text
+        if align == "left":
+            return self.text + fill * gap
+        if align == "right":
+            return fill * gap + self.text
+        return fill * (gap // 2) + self.text + fill * (gap - gap // 2)
+
+    def wrap(self, cols: int) -> list[str]:
+        """
+        Breaks the text into lines of at most `cols` columns.
+
+        Lines break at the last whitespace that fits, which is dropped; text without
+        whitespace (CJK runs, long tokens) breaks between characters. Existing newlines
+        are kept as breaks. A single unit wider than `cols` gets a line of its own.
+        Each line costs one binary search, so wrapping is linear in the text length.
+
+        Args:
+            cols (int): Maximum display width of each line
+
+        Returns:
+            list[str]: The lines, without trailing newlines
+        """
+        text = self.text
+        breaks = [m.start() for m in _SPACE.finditer(text)]
+        lines: list[str] = []
+        pos = 0
+        n = len(text)
+        while pos <= n:
+            newline = text.find("\n", pos)
+            stop = n if newline < 0 else newline
+            paragraph = len(lines)
+            while self.columns[stop] - self.columns[pos] > cols:
+                end = self.cut(cols, pos)
+                if end <= pos:
+                    # Wider than a line by itself: it gets one anyway
+                    end = self._unit_end(pos)
+                i = bisect_right(breaks, end) - 1
+                if i >= 0 and breaks[i] > pos:
+                    lines.append(text[pos:breaks[i]].rstrip())
+                    pos = _SPACES.match(text, breaks[i]).end()
+                else:
+                    lines.append(text[pos:end])
+                    pos = end
+            if pos < stop or len(lines) == paragraph:
+                lines.append(text[pos:stop])
+            pos = stop + 1
+        return lines
+
+
+# Weakly keyed, so an engine dropped elsewhere (e.g. a version evicted by
+# char_table.table.set_max_versions()) takes its character cache with it.
+_width_caches: "weakref.WeakKeyDictionary[StringWidthEngine, _CharWidths]" = weakref.WeakKeyDictionary()
+_cache_lock = threading.Lock()
+
+
+def _char_widths(engine: StringWidthEngine) -> _CharWidths:
+    # One character cache per engine, shared by every MeasuredText built on it.
+    cache = _width_caches.get(engine)
+    if cache is None:
+        with _cache_lock:
+            cache = _width_caches.setdefault(engine, _CharWidths(engine))
+    return cache
+
+
+def measure(text: str) -> MeasuredText:
+    """
+    Measures a string once for repeated cuts (see MeasuredText).
+
+    Args:
+        text (str): Text to measure
+
+    Returns:
+        MeasuredText: Text with cumulative column widths
+    """
+    return MeasuredText(text)
+
+
+def truncate(text: str, cols: int, placeholder: str = "…") -> str:
+    """
+    Shortens text to at most `cols` display columns without splitting emoji sequences.
+
+    Args:
+        text (str): Text to shorten
+        cols (int): Maximum display width
+        placeholder (str): Appended when text is removed
+
+    Returns:
+        str: e.g. truncate("漢字かな", 6) == "漢字…"
+    """
+    return MeasuredText(text).truncate(cols, placeholder)
+
+
+def pad(text: str, cols: int, align: Align = "left", fill: str = " ") -> str:
+    """
+    Pads text to `cols` display columns.
+
+    Args:
+        text (str): Text to pad
+        cols (int): Target display width
+        align (Align): "left", "right" or "center"
+        fill (str): Single-column fill character
+
+    Returns:
+        str: e.g. pad("漢字", 6, "right") == "  漢字"
+    """
+    return MeasuredText(text).pad(cols, align, fill)
+
+
+def wrap(text: str, cols: int) -> list[str]:
+    """
+    Wraps text into lines of at most `cols` display columns.
+
+    Args:
+        text (str): Text to wrap
+        cols (int): Maximum display width per line
+
+    Returns:
+        list[str]: Lines, breaking at whitespace where possible
+    """
+    return MeasuredText(text).wrap(cols)
@@ -0,0 +1,111 @@
+import os
+import mmap
+import struct
+import sys
+from typing import Optional
+
+from char_table.table import DEFAULT_WIDTH, resolve_data_dir
+
+# Binary layout (all integers little-endian):
+#
+#   header  : magic "CTWT", format version (u16), block size (u16),
+#             block count (u32), leaf count (u32)            — 16 bytes
+#   index   : block count × u16, leaf number for each block of the codespace
+#   leaves  : leaf count × block size × u8, one width per code point
+#
+# Identical blocks (e.g. the thousands of all-uncovered or all-wide blocks)
+# share a single leaf, so the whole codespace fits in a few dozen kilobytes.
+MAGIC = b"CTWT"
+FORMAT_VERSION = 1
+BLOCK_SIZE = 256
+HEADER = struct.Struct("<4sHHII")
+
+# Leaf value marking a code point that no dataset covers.
+UNCOVERED = 0xFF
+
+# Default file name under char_table/current/.
+TABLE_FILE = "width_table.bin"
+
+
+class MappedWidthTable:
+    """
+    Zero-copy reader for the two-stage width table.
+
+    The file is mapped read-only, so every process opening it shares the same
+    page-cache pages. Opening only validates the 16-byte header; lookups index
+    straight into the mapping through memoryviews.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(resolve_data_dir(), TABLE_FILE)
+
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        magic, version, block_size, block_count, leaf_count = HEADER.unpack_from(view)
+        if magic != MAGIC or version != FORMAT_VERSION or block_size != BLOCK_SIZE:
+            view.release()
+            self._mmap.close()
+            raise ValueError(f"Unsupported width table: {self.path}")
+
+        index_end = HEADER.size + 2 * block_count
+        index = view[HEADER.size:index_end]
+        if sys.byteorder == "little":
+            self._index = index.cast("H")
+        else:
+            # memoryview.cast uses native byte order; fall back to explicit decoding
+            self._index = struct.unpack(f"<{block_count}H", index)
+            index.release()
+
+        self._leaves = view[index_end:index_end + leaf_count * BLOCK_SIZE]
+        self._view = view
+        self.block_count = block_count
+        self.leaf_count = leaf_count
+
+    def lookup(self, codepoint: int, default: int = DEFAULT_WIDTH) -> int:
+        """
+        Looks up the display width of a single code point.
+
+        Args:
+            codepoint (int): Unicode code point
+            default (int): Width returned when no dataset covers the code point,
+                including code points outside the table (negative or above 0x10FFFF)
+
+        Returns:
+            int: Display width of the code point
+        """
+        if not 0 <= codepoint < self.block_count * BLOCK_SIZE:
+            return default
+        leaf = self._index[codepoint >> 8]
+        value = self._leaves[(leaf << 8) | (codepoint & 0xFF)]
+        return default if value == UNCOVERED else value
+
+    def close(self) -> None:
+        """
+        Releases the memoryviews and unmaps the file.
+        """
+        if isinstance(self._index, memoryview):
+            self._index.release()
+        self._leaves.release()
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedWidthTable":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def open_table(path: Optional[str] = None) -> MappedWidthTable:
+    """
+    Maps the binary width table, defaulting to char_table/current/width_table.bin.
+
+    Args:
+        path (Optional[str]): Alternative table file
+
+    Returns:
+        MappedWidthTable: Reader backed by the shared mapping
+    """
+    return MappedWidthTable(path)
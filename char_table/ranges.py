@@ -0,0 +1,81 @@
+import heapq
+from typing import Iterable
+
+# A width range is an inclusive (start, end, width) triple over Unicode code points.
+WidthRange = tuple[int, int, int]
+
+
+def ranges_from_pairs(pairs: Iterable[tuple[int, int]]) -> list[WidthRange]:
+    """
+    Coalesces (codepoint, width) pairs into sorted, merged (start, end, width) ranges.
+
+    Duplicate code points keep the last width seen. Adjacent code points with the
+    same width are folded into a single range.
+
+    Args:
+        pairs (Iterable[tuple[int, int]]): Code point → width pairs in any order
+
+    Returns:
+        list[WidthRange]: Sorted, non-overlapping ranges
+    """
+    result: list[WidthRange] = []
+    items = sorted(dict(pairs).items())
+    if not items:
+        return result
+
+    start, last_width = items[0]
+    end = start
+    for cp, width in items:
+        if cp == end + 1 and width == last_width:
+            end = cp
+        elif cp != start:
+            result.append((start, end, last_width))
+            start, end, last_width = cp, cp, width
+    result.append((start, end, last_width))
+    return result
+
+
+def merge_ranges(ranges: Iterable[WidthRange]) -> list[WidthRange]:
+    """
+    Merges possibly overlapping ranges from several tables into one sorted,
+    non-overlapping range list.
+
+    Where ranges with different widths overlap, the wider value wins, matching
+    the conservative convention used for East Asian wide characters.
+
+    Args:
+        ranges (Iterable[WidthRange]): Inclusive (start, end, width) triples
+
+    Returns:
+        list[WidthRange]: Sorted, non-overlapping ranges with adjacent equal widths coalesced
+    """
+    pending = sorted(ranges)
+    if not pending:
+        return []
+
+    # Every range start and every position just past a range end is a boundary
+    # between elementary segments whose covering set is constant.
+    boundaries = sorted({r[0] for r in pending} | {r[1] + 1 for r in pending})
+
+    result: list[WidthRange] = []
+    active: list[tuple[int, int]] = []  # heap of (-width, end)
+    index = 0
+
+    for seg_start, next_boundary in zip(boundaries, boundaries[1:]):
+        while index < len(pending) and pending[index][0] == seg_start:
+            _, end, width = pending[index]
+            heapq.heappush(active, (-width, end))
+            index += 1
+        while active and active[0][1] < seg_start:
+            heapq.heappop(active)
+        if not active:
+            continue
+
+        width = -active[0][0]
+        seg_end = next_boundary - 1
+        if result and result[-1][1] == seg_start - 1 and result[-1][2] == width:
+            result[-1] = (result[-1][0], seg_end, width)
+        else:
+            result.append((seg_start, seg_end, width))
+
+    return result
@@ -0,0 +1,215 @@
+import os
+import sys
+import json
+import zlib
+import marshal
+import argparse
+from typing import Optional
+
+from char_table.ranges import WidthRange, merge_ranges, ranges_from_pairs
+from char_table.table import DATASETS, WidthTable, dataset_version, read_dataset, resolve_data_dir
+from char_table.blocks import (
+    CodepointRanges,
+    CJK_UNIFIED_RANGES,
+    JAPANESE_KANA_RANGES,
+    KOREAN_SYLLABLE_RANGES,
+    FULLWIDTH_PUNCTUATIONS,
+    FULLWIDTH_VARIANT_RANGES,
+)
+
+# Datasets built without files, by name: whole blocks of width 2, the rules of
+# builder/parser/language_parser.py and symbol_parser.py. The curated fullwidth_punctuations
+# map is built in as well; the emoji datasets come from emoji-test.txt, which is not built
+# in, so they are always read from files.
+RULES: dict[str, CodepointRanges] = {
+    "cjk_unified": CJK_UNIFIED_RANGES,
+    "japanese_kana": JAPANESE_KANA_RANGES,
+    "korean_syllables": KOREAN_SYLLABLE_RANGES,
+    "fullwidth_variants": FULLWIDTH_VARIANT_RANGES,
+}
+CURATED = "fullwidth_punctuations"
+
+# Bumped when the layout of the cache file changes.
+CACHE_FORMAT = 1
+
+
+def derive_dataset(name: str) -> tuple[list[WidthRange], dict[str, int]]:
+    """
+    Computes one dataset exactly as the builder's parser writes it.
+
+    Args:
+        name (str): A RULES dataset name or CURATED
+
+    Returns:
+        tuple[list[WidthRange], dict[str, int]]: Merged ranges and multi-codepoint sequences
+
+    Raises:
+        KeyError: If the dataset is not built without files
+    """
+    if name == CURATED:
+        pairs = [(ord(key), value) for key, value in FULLWIDTH_PUNCTUATIONS.items() if len(key) == 1]
+        sequences = {key: value for key, value in FULLWIDTH_PUNCTUATIONS.items() if len(key) > 1}
+        return ranges_from_pairs(pairs), sequences
+
+    return merge_ranges([(start, end, 2) for start, end in RULES[name]]), {}
+
+
+def _rules_key() -> list:
+    # Everything a cached derivation depends on; a cache written under another key is rebuilt.
+    rules = repr((sorted(RULES.items()), sorted(FULLWIDTH_PUNCTUATIONS.items())))
+    return [CACHE_FORMAT, marshal.version, zlib.crc32(rules.encode("utf-8"))]
+
+
+def _read_cache(cache_path: str) -> Optional[dict]:
+    try:
+        with open(cache_path, "rb") as f:
+            payload = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(payload, dict) or payload.get("key") != _rules_key():
+        return None
+    return payload["datasets"]
+
+
+def _write_cache(cache_path: str, datasets: dict) -> None:
+    # Written beside the target and renamed over it, so concurrent readers never see half a file.
+    # A read-only location only costs the derivation again next time.
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            marshal.dump({"key": _rules_key(), "datasets": datasets}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def derive_datasets(cache_path: Optional[str] = None) -> dict[str, tuple[list[WidthRange], dict[str, int]]]:
+    """
+    Computes every dataset that is built without files (see RULES).
+
+    With `cache_path`, the result is read from that marshal file when it was written from
+    the same rules, and written there otherwise.
+
+    Args:
+        cache_path (Optional[str]): Optional cache file
+
+    Returns:
+        dict[str, tuple[list[WidthRange], dict[str, int]]]: Dataset name → (ranges, sequences)
+    """
+    if cache_path:
+        cached = _read_cache(cache_path)
+        if cached is not None:
+            return {name: (list(map(tuple, ranges)), sequences) for name, (ranges, sequences) in cached.items()}
+
+    datasets = {name: derive_dataset(name) for name in (*RULES, CURATED)}
+    if cache_path:
+        _write_cache(cache_path, datasets)
+    return datasets
+
+
+def load_rules_datasets(data_dir: Optional[str] = None,
+                      cache_path: Optional[str] = None) -> tuple[WidthTable, dict[str, int]]:
+    """
+    Builds the runtime tables like char_table/table.py load_datasets(), computing every
+    dataset it can without files (see RULES); only the emoji datasets are read from files,
+    and skipped when they are not shipped.
+
+    Args:
+        data_dir (Optional[str]): Dataset root for the emoji files; defaults to the shipped char_table/current/
+        cache_path (Optional[str]): Optional marshal cache of the derived datasets
+
+    Returns:
+        tuple[WidthTable, dict[str, int]]: Merged width table and sequence → width mapping
+    """
+    data_dir = data_dir or resolve_data_dir()
+    derived = derive_datasets(cache_path)
+
+    ranges: list[WidthRange] = []
+    sequences: dict[str, int] = {}
+    for rel_path in DATASETS:
+        name = os.path.basename(rel_path).removesuffix(".json")
+        path = os.path.join(data_dir, rel_path)
+        if name in derived:
+            dataset_ranges, dataset_sequences = derived[name]
+        elif os.path.exists(path) or os.path.exists(path.removesuffix(".json") + ".ranges.json"):
+            dataset_ranges, dataset_sequences = read_dataset(path)
+        else:
+            continue
+        ranges.extend(dataset_ranges)
+        sequences.update(dataset_sequences)
+
+    return WidthTable(merge_ranges(ranges)), sequences
+
+
+def check(data_dir: Optional[str] = None) -> list[str]:
+    """
+    Compares every derived dataset with the generated `<name>.json` under a dataset root.
+
+    Args:
+        data_dir (Optional[str]): Dataset root; defaults to the shipped char_table/current/
+
+    Returns:
+        list[str]: One line per dataset that differs; empty when all are identical
+    """
+    data_dir = data_dir or resolve_data_dir()
+    derived = derive_datasets()
+    problems = []
+    for rel_path in DATASETS:
+        name = os.path.basename(rel_path).removesuffix(".json")
+        if name not in derived:
+            continue
+        with open(os.path.join(data_dir, rel_path), "r", encoding="utf-8") as f:
+            generated: dict[str, int] = json.load(f)
+        ranges, sequences = derived[name]
+        expected = {chr(cp): width for start, end, width in ranges for cp in range(start, end + 1)}
+        expected.update(sequences)
+
+        missing = generated.keys() - expected.keys()
+        extra = expected.keys() - generated.keys()
+        changed = sum(1 for key in generated.keys() & expected.keys() if generated[key] != expected[key])
+        status = "✅" if not (missing or extra or changed) else "❌"
+        print(f"{status} {rel_path}: {len(expected)} derived, {len(generated)} generated"
+              f" ({len(missing)} missing, {len(extra)} extra, {changed} changed)")
+        if status == "❌":
+            problems.append(f"{rel_path}: {len(missing)} missing, {len(extra)} extra, {changed} changed")
+    return problems
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m char_table.rules_table",
+        description="Compute the runtime datasets without the shipped files.",
+    )
+    parser.add_argument("--check", action="store_true",
+                        help="Compare the derived datasets with the generated JSON files")
+    parser.add_argument("--data-dir", help="Dataset root to compare with (default: char_table/current/)")
+    parser.add_argument("--cache", metavar="PATH", help="Write the marshal cache file (e.g. at deploy time)")
+    return parser
+
+
+def main(args: argparse.Namespace) -> int:
+    """
+    Runs the self-check and/or writes the cache file.
+
+    Returns:
+        int: 0 when the derived datasets match (or no check was asked for), 1 otherwise
+    """
+    print(f"🔬 Built-in block rules, VERSION.txt {dataset_version() or 'missing'}")
+
+    if args.cache:
+        derive_datasets(args.cache)
+        print(f"✅ Cache written: {args.cache}")
+
+    if not args.check:
+        return 0
+    problems = check(args.data_dir)
+    print("✅ Derived datasets are identical to the generated JSON" if not problems
+          else f"❌ {len(problems)} datasets differ")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(build_parser().parse_args()))
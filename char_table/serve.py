@@ -0,0 +1,149 @@
+import os
+import sys
+import json
+import signal
+import asyncio
+import argparse
+from typing import Callable, Optional
+
+from char_table.strwidth import enable_cache, get_engine, str_width
+
+# Longest request line accepted, in bytes; a batch of strings must fit in one line.
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+# Request lines at least this long are answered in a worker thread, so one large batch
+# does not stall the event loop (and every other client) while it is measured.
+EXECUTOR_LINE_BYTES = 64 * 1024
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def respond(line: bytes, measure: Callable[[str], int] = str_width) -> bytes:
+    """
+    Answers one protocol line.
+
+    A request is a JSON object {"id": ..., "strings": [...]} or a bare JSON array of
+    strings. The response is {"id": ..., "widths": [...]} (the id is echoed when given,
+    so pipelined clients can match responses), or {"id": ..., "error": "..."} for a
+    malformed or too deeply nested request. Responses are single lines, like requests.
+
+    Args:
+        line (bytes): One request line, UTF-8 JSON
+        measure (Callable[[str], int]): Width function applied to each string
+
+    Returns:
+        bytes: The response line, newline-terminated
+    """
+    request = None
+    try:
+        request = json.loads(line)
+        strings = request.get("strings") if isinstance(request, dict) else request
+        if not isinstance(strings, list) or not all(isinstance(s, str) for s in strings):
+            raise ValueError('expected {"strings": [str, ...]} or [str, ...]')
+        response = {"widths": list(map(measure, strings))}
+    except ValueError as exc:
+        response = {"error": str(exc)}
+    except RecursionError:
+        response = {"error": "request is nested too deeply"}
+    if isinstance(request, dict) and "id" in request:
+        response = {"id": request["id"], **response}
+    return (_encode(response) + "\n").encode()
+
+
+async def handle_stream(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    Serves one connection: answers request lines in order until the client closes.
+
+    Pipelined requests are read and answered back to back: drain() only blocks while
+    the client lags behind the transport's high-water mark, so a client that sends many
+    batches without waiting never pays a round trip per request. Lines of
+    EXECUTOR_LINE_BYTES or more are answered in the default executor; responses still
+    go out in request order, since the connection waits for each one.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                # Line longer than MAX_LINE_BYTES: the stream cannot be resynchronized
+                writer.write(_encode({"error": f"request line exceeds {MAX_LINE_BYTES} bytes"}).encode() + b"\n")
+                break
+            if not line:
+                break
+            if len(line) >= EXECUTOR_LINE_BYTES:
+                writer.write(await loop.run_in_executor(None, respond, line))
+                await writer.drain()
+            elif line.strip():
+                writer.write(respond(line))
+                await writer.drain()
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve_stdio() -> None:
+    """
+    Serves a single client over stdin/stdout until stdin closes.
+
+    stdin and stdout may be pipes, terminals or regular files, which asyncio's pipe
+    transports do not all accept, so lines are read in a worker thread and each
+    response is flushed as soon as it is written.
+    """
+    loop = asyncio.get_running_loop()
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    while line := await loop.run_in_executor(None, stdin.readline):
+        if line.strip():
+            stdout.write(respond(line))
+            stdout.flush()
+
+
+async def serve(socket_path: Optional[str] = None) -> None:
+    """
+    Loads the tables once, then serves newline-delimited JSON until stopped.
+
+    Args:
+        socket_path (Optional[str]): Unix domain socket to listen on, one task per client;
+            None serves a single client over stdin/stdout
+    """
+    get_engine()
+
+    if socket_path is None:
+        print("✅ Serving widths on stdin/stdout", file=sys.stderr)
+        await serve_stdio()
+        return
+
+    server = await asyncio.start_unix_server(handle_stream, socket_path, limit=MAX_LINE_BYTES)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    print(f"✅ Serving widths on {socket_path}", file=sys.stderr)
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        print("🏁 Server stopped", file=sys.stderr)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m char_table.serve",
+        description="Serve string widths over newline-delimited JSON, loading the tables once.",
+    )
+    parser.add_argument("--socket", help="Unix domain socket path (default: stdin/stdout)")
+    parser.add_argument("--cache", type=int, metavar="ENTRIES",
+                        help="Put an LRU cache of this many strings in front of str_width")
+    return parser
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    if args.cache:
+        enable_cache(args.cache)
+    asyncio.run(serve(args.socket))
@@ -0,0 +1,293 @@
+import re
+import threading
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from char_table.ranges import ranges_from_pairs
+from char_table.table import DEFAULT_WIDTH, WidthTable, get_datasets, get_version
+
+if TYPE_CHECKING:
+    from char_table.width_cache import WidthCache
+
+# Trie node: child characters map to nodes; a terminal node stores its sequence width under _END.
+_END = ""
+
+
+class SequenceTrie:
+    """
+    Codepoint trie over multi-codepoint sequences (ZWJ emoji, keycaps, modifier and VS16 sequences).
+
+    Each node is a plain dict keyed by the next character; terminal nodes carry
+    the width of the sequence ending there.
+    """
+
+    __slots__ = ("root", "size")
+
+    def __init__(self, sequences: Optional[dict[str, int]] = None):
+        self.root: dict = {}
+        self.size = 0
+        for seq, width in (sequences or {}).items():
+            self.insert(seq, width)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def insert(self, seq: str, width: int) -> None:
+        """
+        Adds a sequence to the trie, overwriting the width of an existing entry.
+
+        Args:
+            seq (str): Non-empty character sequence
+            width (int): Display width of the whole sequence
+        """
+        node = self.root
+        for ch in seq:
+            node = node.setdefault(ch, {})
+        if _END not in node:
+            self.size += 1
+        node[_END] = width
+
+    def longest_match(self, text: str, pos: int) -> Optional[tuple[int, int]]:
+        """
+        Finds the longest sequence starting at `pos`.
+
+        Args:
+            text (str): Text to scan
+            pos (int): Start index
+
+        Returns:
+            Optional[tuple[int, int]]: (end index, sequence width), or None when nothing matches
+        """
+        node = self.root
+        match = None
+        for i in range(pos, len(text)):
+            node = node.get(text[i])
+            if node is None:
+                break
+            if _END in node:
+                match = (i + 1, node[_END])
+        return match
+
+
+# Matches runs of supplementary-plane characters, which `re` cannot test against a bitmap.
+_ASTRAL_RUN = re.compile("[\U00010000-\U0010FFFF]+")
+
+
+def _char_class(spans: list[tuple[int, int]], repeat: bool = False) -> re.Pattern:
+    parts = []
+    for start, end in spans:
+        if start == end:
+            parts.append(re.escape(chr(start)))
+        else:
+            parts.append(f"{re.escape(chr(start))}-{re.escape(chr(end))}")
+    return re.compile(f"[{''.join(parts)}]{'+' if repeat else ''}")
+
+
+class StringWidthEngine:
+    """
+    Grapheme-aware string width engine.
+
+    Per-character widths are counted with character-class regexes built from the
+    single-codepoint WidthTable, so that pass runs inside the `re` engine. BMP
+    classes compile to constant-time bitmaps; supplementary-plane classes test
+    their ranges one by one, so they only run over the astral characters pulled
+    out of the text first.
+
+    Multi-codepoint sequences are found by scanning for their second character
+    (ZWJ, VS16, skin tone modifiers, regional indicators, ...): only the position
+    before such a pivot can start a sequence, and the trie consumes the longest
+    match there. Candidates are visited left to right and skipped once covered,
+    which reproduces a single greedy left-to-right scan.
+    """
+
+    def __init__(self, table: WidthTable, sequences: dict[str, int], default: int = DEFAULT_WIDTH):
+        self.table = table
+        self.default = default
+        self.sequences = {seq: width for seq, width in sequences.items() if seq}
+        self.trie = SequenceTrie(self.sequences)
+
+        # Character-class runs per non-default width; each matched character shifts the total by (width - default).
+        bmp: dict[int, list[tuple[int, int]]] = {}
+        astral: dict[int, list[tuple[int, int]]] = {}
+        for start, end, width in table.ranges():
+            if width == default:
+                continue
+            if start <= 0xFFFF:
+                bmp.setdefault(width, []).append((start, min(end, 0xFFFF)))
+            if end > 0xFFFF:
+                astral.setdefault(width, []).append((max(start, 0x10000), end))
+        self._bmp_classes = [(width - default, _char_class(spans, repeat=True)) for width, spans in bmp.items()]
+        self._astral_classes = [(width - default, _char_class(spans, repeat=True)) for width, spans in astral.items()]
+
+        # Per-sequence correction: sequence width minus the sum of its per-character widths.
+        self._adjust = {
+            seq: width - sum(table.lookup(ord(ch), default) for ch in seq)
+            for seq, width in self.sequences.items()
+        }
+
+        # Characters that appear second in some sequence; see the class docstring.
+        pivots = ranges_from_pairs((ord(seq[1]), 0) for seq in self.sequences if len(seq) > 1)
+        self._pivot_re = _char_class([(start, end) for start, end, _ in pivots]) if pivots else None
+
+    def _sequence_matches(self, text: str) -> Iterator[tuple[int, int]]:
+        # Yields (start, end) of every sequence a greedy left-to-right scan would consume.
+        if self._pivot_re is None:
+            return
+
+        longest_match = self.trie.longest_match
+        covered = 0
+        for m in self._pivot_re.finditer(text):
+            start = m.start() - 1
+            if start < covered:
+                continue
+            match = longest_match(text, start)
+            if match is not None:
+                yield start, match[0]
+                covered = match[0]
+
+    def sequence_spans(self, text: str) -> list[tuple[int, int]]:
+        """
+        Locates the multi-codepoint sequences a greedy left-to-right scan consumes.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            list[tuple[int, int]]: (start index, end index) of each sequence, in order
+        """
+        return list(self._sequence_matches(text))
+
+    def char_width(self, ch: str) -> int:
+        """
+        Returns the width of a single character from the single-codepoint table.
+        """
+        return self.table.lookup(ord(ch), self.default)
+
+    def str_width(self, text: str) -> int:
+        """
+        Computes the display width of a string.
+
+        Args:
+            text (str): Text to measure
+
+        Returns:
+            int: Total display columns
+        """
+        if text.isascii():
+            return len(text) * self.default
+
+        total = len(text) * self.default
+        for delta, pattern in self._bmp_classes:
+            total += delta * len("".join(pattern.findall(text)))
+
+        if self._astral_classes:
+            astral = "".join(_ASTRAL_RUN.findall(text))
+            if astral:
+                for delta, pattern in self._astral_classes:
+                    total += delta * len("".join(pattern.findall(astral)))
+
+        adjust = self._adjust
+        for start, end in self._sequence_matches(text):
+            total += adjust[text[start:end]]
+
+        return total
+
+    def iter_segments(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """
+        Splits text into width units: whole sequences or single characters.
+
+        Args:
+            text (str): Text to segment
+
+        Yields:
+            tuple[int, int, int]: (start index, end index, width) for each unit, in order
+        """
+        lookup = self.table.lookup
+        default = self.default
+        pos = 0
+        for start, end in self._sequence_matches(text):
+            for i in range(pos, start):
+                yield i, i + 1, lookup(ord(text[i]), default)
+            yield start, end, self.sequences[text[start:end]]
+            pos = end
+        for i in range(pos, len(text)):
+            yield i, i + 1, lookup(ord(text[i]), default)
+
+
+_default_engine: Optional[StringWidthEngine] = None
+_default_lock = threading.Lock()
+
+# Opt-in LRU cache str_width() goes through; see enable_cache().
+_cache: Optional["WidthCache"] = None
+
+
+def get_engine(version: Optional[str] = None) -> StringWidthEngine:
+    """
+    Returns the process-wide StringWidthEngine built from the shipped datasets.
+
+    Args:
+        version (Optional[str]): Unicode release from a matrix build, e.g. "15.1.0"; its engine
+            is built on first use and evicted together with the release's tables (see get_version())
+    """
+    if version is not None:
+        tables = get_version(version)
+        engine = tables.derived.get("engine")
+        if engine is None:
+            engine = tables.derived.setdefault("engine", StringWidthEngine(tables.table, tables.sequences))
+        return engine
+
+    global _default_engine
+    if _default_engine is None:
+        with _default_lock:
+            if _default_engine is None:
+                table, sequences = get_datasets()
+                _default_engine = StringWidthEngine(table, sequences)
+    return _default_engine
+
+
+def enable_cache(max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> "WidthCache":
+    """
+    Puts a bounded LRU cache in front of str_width() for workloads with recurring strings.
+
+    Args:
+        max_entries (Optional[int]): Most strings kept (default: DEFAULT_MAX_ENTRIES)
+        max_bytes (Optional[int]): Most bytes of cached strings kept, unbounded when None
+
+    Returns:
+        WidthCache: The installed cache, for its stats(); replaces any previous one
+    """
+    global _cache
+    from char_table.width_cache import DEFAULT_MAX_ENTRIES, WidthCache
+
+    _cache = WidthCache(get_engine(), max_entries or DEFAULT_MAX_ENTRIES, max_bytes)
+    return _cache
+
+
+def disable_cache() -> None:
+    """
+    Removes the cache installed by enable_cache(); str_width() measures every call again.
+    """
+    global _cache
+    _cache = None
+
+
+def str_width(text: str, version: Optional[str] = None) -> int:
+    """
+    Returns the display width of a string, treating emoji ZWJ sequences as single units.
+
+    Args:
+        text (str): Text to measure
+        version (Optional[str]): Unicode release to measure with, e.g. "15.1.0" (see get_engine());
+            such calls bypass the enable_cache() cache, which belongs to the shipped tables
+
+    Returns:
+        int: Total display columns, e.g. 2 for "👨‍👩‍👧‍👦" and 4 for "漢字"
+
+    Raises:
+        ValueError: If no tables were built for `version`
+    """
+    if version is not None:
+        return get_engine(version).str_width(text)
+    cache = _cache
+    if cache is not None:
+        return cache.str_width(text)
+    return get_engine().str_width(text)
@@ -0,0 +1,378 @@
+import os
+import json
+import threading
+from array import array
+from collections import OrderedDict
+from bisect import bisect_right
+from typing import Iterable, Optional
+
+from char_table.ranges import WidthRange, merge_ranges, ranges_from_pairs
+
+# Dataset files under char_table/current/ that feed the runtime tables,
+# in the order of builder/registry.py DATASETS (the order `gen_datasets all` builds them).
+DATASETS = (
+    "emoji/emoji_base.json",
+    "emoji/emoji_zwj.json",
+    "cjk/cjk_unified.json",
+    "cjk/japanese_kana.json",
+    "cjk/korean_syllables.json",
+    "variants/fullwidth_variants.json",
+    "variants/fullwidth_punctuations.json",
+)
+
+# Width reported for code points that none of the datasets cover.
+DEFAULT_WIDTH = 1
+
+# Where get_datasets() takes the tables from, chosen by CHAR_TABLE_BACKEND:
+# "files" reads char_table/current/; "rules" computes every dataset but the emoji ones from
+# the built-in block rules (see char_table/rules_table.py); "auto" (the default) reads the
+# files when char_table/current/ is shipped and uses the rules otherwise.
+BACKENDS = ("auto", "files", "rules")
+
+# Unicode release the shipped char_table/current/ datasets were generated from (the repository's VERSION.txt).
+VERSION_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "VERSION.txt")
+
+# Matrix builds write each Unicode release to char_table/versions/<version>/current/.
+VERSIONS_DIR = "versions"
+
+# Unicode releases whose tables get_datasets(version=...) keeps loaded at once, by default.
+DEFAULT_MAX_VERSIONS = 4
+
+
+def dataset_version() -> Optional[str]:
+    """
+    Returns the Unicode release in VERSION.txt, or None when the file is not shipped.
+    """
+    try:
+        with open(VERSION_FILE, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def version_key(version: str) -> tuple[int, ...]:
+    """
+    Sort key ordering Unicode versions numerically: "9.0.0" < "15.1.0" < "16.0.0".
+    """
+    return tuple(int(part) if part.isdigit() else 0 for part in version.split("."))
+
+
+def resolve_data_dir(version: Optional[str] = None) -> str:
+    """
+    Returns the absolute path to a dataset directory: the shipped char_table/current/,
+    or the char_table/versions/<version>/current/ written by a matrix build.
+
+    Args:
+        version (Optional[str]): Unicode release, e.g. "15.1.0"; None for the shipped tables.
+            The VERSION.txt release falls back to char_table/current/ without a matrix copy.
+
+    Returns:
+        str: Absolute path of the directory
+
+    Raises:
+        ValueError: If no tables were built for `version`
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    if version is None:
+        return os.path.join(package_dir, "current")
+    path = os.path.join(package_dir, VERSIONS_DIR, version, "current")
+    if os.path.isdir(path):
+        return path
+    if version == dataset_version():
+        return os.path.join(package_dir, "current")
+    raise ValueError(f"No tables for Unicode {version}: build them with `make matrix VERSIONS={version}`")
+
+
+def available_versions() -> list[str]:
+    """
+    Returns the Unicode releases get_datasets(version=...) can load, oldest first.
+    """
+    versions_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), VERSIONS_DIR)
+    versions = {dataset_version()} - {None}
+    if os.path.isdir(versions_dir):
+        versions.update(
+            name for name in os.listdir(versions_dir)
+            if os.path.isdir(os.path.join(versions_dir, name, "current"))
+        )
+    return sorted(versions, key=version_key)
+
+
+class WidthTable:
+    """
+    Sorted, merged (start, end, width) intervals answering code point lookups by bisection.
+
+    The three columns are stored as parallel `array` objects, so the whole table
+    costs a few kilobytes instead of one dict entry per code point.
+    """
+
+    __slots__ = ("starts", "ends", "widths")
+
+    def __init__(self, ranges: Iterable[WidthRange]):
+        self.starts = array("I")
+        self.ends = array("I")
+        self.widths = array("B")
+        for start, end, width in ranges:
+            self.starts.append(start)
+            self.ends.append(end)
+            self.widths.append(width)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def ranges(self) -> list[WidthRange]:
+        """
+        Returns:
+            list[WidthRange]: The table contents as (start, end, width) triples
+        """
+        return list(zip(self.starts, self.ends, self.widths))
+
+    def lookup(self, codepoint: int, default: int = DEFAULT_WIDTH) -> int:
+        """
+        Looks up the display width of a single code point.
+
+        Args:
+            codepoint (int): Unicode code point
+            default (int): Width returned when no range covers the code point
+
+        Returns:
+            int: Display width of the code point
+        """
+        i = bisect_right(self.starts, codepoint) - 1
+        if i >= 0 and codepoint <= self.ends[i]:
+            return self.widths[i]
+        return default
+
+
+def read_dataset(path: str) -> tuple[list[WidthRange], dict[str, int]]:
+    """
+    Reads one char → width dataset and splits it into code point ranges and sequences.
+
+    When the range-compressed sibling `<name>.ranges.json` exists it is read
+    instead of the per-character map, so loading costs kilobytes rather than
+    megabytes. Otherwise single-codepoint keys are folded into merged ranges.
+    Multi-codepoint keys (e.g. ZWJ emoji sequences) cannot be expressed as
+    ranges and are returned separately; empty keys are dropped.
+
+    Args:
+        path (str): Absolute path to a dataset JSON file, e.g. ".../cjk/cjk_unified.json"
+
+    Returns:
+        tuple[list[WidthRange], dict[str, int]]: Merged ranges and multi-codepoint sequences
+    """
+    ranges_path = path.removesuffix(".json") + ".ranges.json"
+    if os.path.exists(ranges_path):
+        with open(ranges_path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        ranges = [(start, end, value) for start, end, value in payload["ranges"]]
+        sequences = {key: value for key, value in payload["sequences"].items() if key}
+        return ranges, sequences
+
+    with open(path, "r", encoding="utf-8") as f:
+        data: dict[str, int] = json.load(f)
+
+    pairs: list[tuple[int, int]] = []
+    sequences = {}
+    for key, value in data.items():
+        if len(key) == 1:
+            pairs.append((ord(key), value))
+        elif key:
+            sequences[key] = value
+
+    return ranges_from_pairs(pairs), sequences
+
+
+def load_datasets(data_dir: Optional[str] = None) -> tuple[WidthTable, dict[str, int]]:
+    """
+    Reads every dataset under char_table/current/ once, returning the merged
+    single-codepoint table and all multi-codepoint sequences.
+
+    Args:
+        data_dir (Optional[str]): Alternative dataset root; defaults to the shipped char_table/current/
+
+    Returns:
+        tuple[WidthTable, dict[str, int]]: Merged width table and sequence → width mapping
+    """
+    data_dir = data_dir or resolve_data_dir()
+
+    ranges: list[WidthRange] = []
+    sequences: dict[str, int] = {}
+    for rel_path in DATASETS:
+        path = os.path.join(data_dir, rel_path)
+        if os.path.exists(path) or os.path.exists(path.removesuffix(".json") + ".ranges.json"):
+            dataset_ranges, dataset_sequences = read_dataset(path)
+            ranges.extend(dataset_ranges)
+            sequences.update(dataset_sequences)
+
+    return WidthTable(merge_ranges(ranges)), sequences
+
+
+def load_table(data_dir: Optional[str] = None) -> WidthTable:
+    """
+    Builds a WidthTable from all datasets under char_table/current/.
+
+    Args:
+        data_dir (Optional[str]): Alternative dataset root; defaults to the shipped char_table/current/
+
+    Returns:
+        WidthTable: Merged width table covering every dataset
+    """
+    return load_datasets(data_dir)[0]
+
+
+class VersionTables:
+    """
+    The runtime tables of one Unicode release, as kept resident by get_version().
+
+    Attributes:
+        version (str): Unicode release, e.g. "15.1.0"
+        table (WidthTable): Merged single-codepoint table
+        sequences (dict[str, int]): Multi-codepoint sequence → width mapping
+        derived (dict[str, object]): Objects other modules build from these tables on first use
+            (e.g. the StringWidthEngine behind str_width(version=...)); evicted along with them
+    """
+
+    __slots__ = ("version", "table", "sequences", "derived")
+
+    def __init__(self, version: str, table: WidthTable, sequences: dict[str, int]):
+        self.version = version
+        self.table = table
+        self.sequences = sequences
+        self.derived: dict[str, object] = {}
+
+
+_default_datasets: Optional[tuple[WidthTable, dict[str, int]]] = None
+_default_lock = threading.Lock()
+
+# Loaded releases, least recently used first; see get_version().
+_versions: "OrderedDict[str, VersionTables]" = OrderedDict()
+_versions_lock = threading.Lock()
+_max_versions = DEFAULT_MAX_VERSIONS
+
+
+def get_version(version: str) -> VersionTables:
+    """
+    Returns the tables of one Unicode release, loading only that release's datasets on first use.
+
+    At most `max_versions` releases (see set_max_versions()) stay resident; loading
+    another evicts the least recently used one. Loads happen under the lock, so
+    concurrent first lookups of a release read its files once.
+
+    Args:
+        version (str): Unicode release, e.g. "15.1.0"
+
+    Returns:
+        VersionTables: The release's tables
+
+    Raises:
+        ValueError: If no tables were built for `version`
+    """
+    with _versions_lock:
+        tables = _versions.get(version)
+        if tables is not None:
+            _versions.move_to_end(version)
+            return tables
+        tables = VersionTables(version, *load_datasets(resolve_data_dir(version)))
+        _versions[version] = tables
+        while len(_versions) > _max_versions:
+            _versions.popitem(last=False)
+        return tables
+
+
+def set_max_versions(max_versions: int) -> None:
+    """
+    Bounds how many Unicode releases get_version() keeps loaded, evicting the least
+    recently used ones beyond the new bound.
+
+    Raises:
+        ValueError: If `max_versions` is not positive
+    """
+    global _max_versions
+    if max_versions < 1:
+        raise ValueError(f"max_versions must be positive, not {max_versions}")
+    with _versions_lock:
+        _max_versions = max_versions
+        while len(_versions) > _max_versions:
+            _versions.popitem(last=False)
+
+
+def resident_versions() -> list[str]:
+    """
+    Returns the Unicode releases currently loaded by get_version(), least recently used first.
+    """
+    with _versions_lock:
+        return list(_versions)
+
+
+def load_default_datasets() -> tuple[WidthTable, dict[str, int]]:
+    """
+    Loads the (table, sequences) pair from the backend CHAR_TABLE_BACKEND selects (see BACKENDS).
+
+    The rules backend reuses the marshal cache file named by CHAR_TABLE_RULES_CACHE, if set.
+
+    Raises:
+        ValueError: If CHAR_TABLE_BACKEND is not one of BACKENDS
+    """
+    backend = os.environ.get("CHAR_TABLE_BACKEND", "auto")
+    if backend not in BACKENDS:
+        raise ValueError(f"CHAR_TABLE_BACKEND must be one of {', '.join(BACKENDS)}, not {backend!r}")
+    if backend == "files" or (backend == "auto" and os.path.isdir(resolve_data_dir())):
+        return load_datasets()
+
+    from char_table.rules_table import load_rules_datasets
+
+    return load_rules_datasets(cache_path=os.environ.get("CHAR_TABLE_RULES_CACHE"))
+
+
+def get_datasets(version: Optional[str] = None) -> tuple[WidthTable, dict[str, int]]:
+    """
+    Returns the process-wide (table, sequences) pair, loading it on first use (see load_default_datasets()).
+
+    Args:
+        version (Optional[str]): Unicode release from a matrix build (see get_version()); None for the shipped tables
+    """
+    if version is not None:
+        tables = get_version(version)
+        return tables.table, tables.sequences
+
+    global _default_datasets
+    if _default_datasets is None:
+        with _default_lock:
+            if _default_datasets is None:
+                _default_datasets = load_default_datasets()
+    return _default_datasets
+
+
+def get_table(version: Optional[str] = None) -> WidthTable:
+    """
+    Returns the process-wide WidthTable (of a Unicode release, if given), loading it on first use.
+    """
+    return get_datasets(version)[0]
+
+
+def get_sequences(version: Optional[str] = None) -> dict[str, int]:
+    """
+    Returns the process-wide multi-codepoint sequence → width mapping (of a Unicode release,
+    if given), loading it on first use.
+    """
+    return get_datasets(version)[1]
+
+
+def width(codepoint: int | str, default: int = DEFAULT_WIDTH, version: Optional[str] = None) -> int:
+    """
+    Returns the display width of a single code point using the shipped datasets.
+
+    Args:
+        codepoint (int | str): Unicode code point, or a one-character string
+        default (int): Width returned for code points outside every dataset
+        version (Optional[str]): Unicode release to answer for, e.g. "15.1.0" (see get_version());
+            None for the shipped tables
+
+    Returns:
+        int: Display width, e.g. 2 for "字" and 1 for "a"
+
+    Raises:
+        ValueError: If no tables were built for `version`
+    """
+    if isinstance(codepoint, str):
+        codepoint = ord(codepoint)
+    return get_table(version).lookup(codepoint, default)
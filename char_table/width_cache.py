@@ -0,0 +1,128 @@
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from char_table.strwidth import StringWidthEngine, get_engine
+
+# Default bound on cached strings.
+DEFAULT_MAX_ENTRIES = 65_536
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Counters of a WidthCache at one point in time.
+
+    Attributes:
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups that measured the string and stored it
+        evictions (int): Entries dropped to stay within the bounds
+        entries (int): Strings currently cached
+        bytes (int): Approximate memory held by the cached strings
+    """
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Share of lookups that were hits (ASCII strings are not counted), 0.0 when none ran.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class WidthCache:
+    """
+    Bounded LRU cache of string widths in front of a StringWidthEngine.
+
+    Meant for workloads where the same values recur (hostnames, status words, CJK
+    labels in log columns): a hit costs one dict lookup instead of the engine's regex
+    and sequence passes. ASCII-only strings skip the cache entirely, since their width
+    is just their length; they are not counted either.
+
+    The cache holds at most `max_entries` strings and, when `max_bytes` is set, at most
+    that many bytes of keys (sys.getsizeof of each string); the least recently used
+    entries are evicted first. All access goes through one lock, so a cache can be
+    shared between threads. Widths are computed outside the lock.
+    """
+
+    def __init__(self, engine: Optional[StringWidthEngine] = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: Optional[int] = None):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, not {max_entries}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be positive, not {max_bytes}")
+        self.engine = engine or get_engine()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def str_width(self, text: str) -> int:
+        """
+        Returns the display width of a string, from the cache when it was seen recently.
+
+        Args:
+            text (str): Text to measure
+
+        Returns:
+            int: Total display columns, same as StringWidthEngine.str_width()
+        """
+        if text.isascii():
+            return len(text) * self.engine.default
+
+        with self._lock:
+            width = self._entries.get(text)
+            if width is not None:
+                self._entries.move_to_end(text)
+                self._hits += 1
+                return width
+
+        width = self.engine.str_width(text)
+        size = sys.getsizeof(text)
+        with self._lock:
+            self._misses += 1
+            if self.max_bytes is not None and size > self.max_bytes:
+                return width
+            if text not in self._entries:
+                self._entries[text] = width
+                self._bytes += size
+                self._evict()
+        return width
+
+    def _evict(self) -> None:
+        # Drops least recently used entries until both bounds hold; called with the lock held.
+        entries = self._entries
+        while len(entries) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes):
+            text, _ = entries.popitem(last=False)
+            self._bytes -= sys.getsizeof(text)
+            self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        """
+        Returns:
+            CacheStats: A consistent snapshot of the counters and current size
+        """
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._bytes)
+
+    def clear(self) -> None:
+        """
+        Drops every entry and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
@@ -1,17 +1,7 @@
 #!/bin/bash
 set -e
 
-VERSION=$(cat VERSION.txt)
-TIMESTAMP=$(date -u +"%Y-%m-%d_%H-%M-%S")
-ARCHIVE_DIR="char_table/archive"
-FILENAME="char_table_${TIMESTAMP}_v${VERSION}.tar.gz"
-TAR_OPTS="--owner=char --group=table"
-
-mkdir -p "$ARCHIVE_DIR"
-
-tar $TAR_OPTS -czf "$ARCHIVE_DIR/$FILENAME" \
-    char_table/current \
-    char_table/categories \
-    char_table/meta
-
-echo "✅ Archive created: $ARCHIVE_DIR/$FILENAME"
+# Snapshots char_table/current, categories and meta into the content-addressed
+# store under char_table/archive/store/ (files unchanged since an earlier
+# snapshot are stored once). See builder/archive.py.
+python -m builder.archive create
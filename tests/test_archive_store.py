@@ -0,0 +1,45 @@
+import io
+import tarfile
+
+import pytest
+
+from builder.core.archive_store import ArchiveStore
+
+TARBALL = "char_table_2025-05-25_17-30-49_v16.0.0.tar.gz"
+
+
+def make_tarball(path, names):
+    with tarfile.open(path, "w:gz") as tar:
+        for name in names:
+            data = name.encode("utf-8")
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+def test_import_strips_the_char_table_prefix(tmp_path):
+    path = tmp_path / TARBALL
+    make_tarball(path, ["./char_table/current/cjk/cjk_unified.json", "char_table/meta/._cjk_unified.meta.json"])
+    store = ArchiveStore(str(tmp_path / "store"))
+
+    snapshot, new_blobs = store.import_tarball(str(path))
+
+    assert list(snapshot.files) == ["current/cjk/cjk_unified.json"]
+    assert new_blobs == 1
+    assert store.read("latest", "cjk_unified") == b"./char_table/current/cjk/cjk_unified.json"
+
+
+@pytest.mark.parametrize("name", [
+    "../evil.json",
+    "char_table/../../evil.json",
+    "current/../../evil.json",
+    "/etc/passwd",
+])
+def test_import_rejects_paths_outside_the_archive(tmp_path, name):
+    path = tmp_path / TARBALL
+    make_tarball(path, ["char_table/current/cjk/cjk_unified.json", name])
+    store = ArchiveStore(str(tmp_path / "store"))
+
+    with pytest.raises(ValueError, match="Unsafe path"):
+        store.import_tarball(str(path))
+    assert store.snapshots() == []
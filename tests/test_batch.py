@@ -0,0 +1,29 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from benchmarks.bench_batch import CELL_CHARS
+from benchmarks.corpora import build_corpora
+from char_table.batch import encode_utf32, get_batch_engine, widths
+from char_table.strwidth import get_engine
+
+CORPORA = build_corpora()
+
+
+@pytest.mark.parametrize("name", sorted(CORPORA))
+def test_widths_match_str_width(name):
+    engine = get_engine()
+    lines = CORPORA[name]
+    cells = [line[i:i + CELL_CHARS] for line in lines for i in range(0, len(line), CELL_CHARS)]
+
+    for strings in (lines, cells):
+        assert widths(strings).tolist() == [engine.str_width(s) for s in strings]
+
+
+def test_width_of_buffer_matches_str_width():
+    engine = get_engine()
+    strings = ["👨‍👩‍👧‍👦", "漢字 ok", "", "🇯🇵🇰🇷", "1️⃣", "ｶﾞ"]
+    codepoints, offsets = encode_utf32(strings)
+    batch = get_batch_engine()
+    assert batch.width_of_buffer(codepoints, offsets).tolist() == [engine.str_width(s) for s in strings]
+    assert batch.width_of_buffer(codepoints) == sum(engine.str_width(s) for s in strings)
@@ -0,0 +1,48 @@
+import gc
+import weakref
+
+import pytest
+
+from char_table.layout import MeasuredText, _width_caches, truncate, wrap
+from char_table.strwidth import StringWidthEngine, get_engine
+from char_table.table import WidthTable
+
+FAMILY = "👨‍👩‍👧‍👦"
+
+
+@pytest.mark.parametrize("text, cols, expected", [
+    ("漢字かな", 4, ["漢字", "かな"]),
+    ("漢字 ok", 4, ["漢字", "ok"]),
+    ("a b\tc", 1, ["a", "b", "c"]),
+    ("漢字\n\nかな", 4, ["漢字", "", "かな"]),
+    # A unit wider than the line, directly before a newline
+    ("漢\nx", 1, ["漢", "x"]),
+    (f"{FAMILY}\nab", 1, [FAMILY, "a", "b"]),
+    (f"x {FAMILY}\n", 1, ["x", FAMILY, ""]),
+])
+def test_wrap(text, cols, expected):
+    assert wrap(text, cols) == expected
+
+
+def test_truncate_keeps_sequences_whole():
+    assert truncate("漢字かな", 6) == "漢字…"
+    assert truncate(f"a{FAMILY}b", 2, ".") == "a."
+    assert truncate("漢字", 1, ".") == "."
+
+
+def test_truncate_measures_placeholder_with_own_engine():
+    # Every character is three columns wide under this engine, the placeholder included
+    engine = StringWidthEngine(WidthTable([(0, 0x10FFFF, 3)]), {})
+    assert MeasuredText("abc", engine).truncate(6) == "a…"
+    assert MeasuredText("abc", get_engine()).truncate(2, ".") == "a."
+
+
+def test_character_cache_does_not_keep_engine_alive():
+    engine = StringWidthEngine(WidthTable([(0x4E00, 0x9FFF, 2)]), {})
+    assert MeasuredText("漢字", engine).width == 4
+    assert engine in _width_caches
+
+    ref = weakref.ref(engine)
+    del engine
+    gc.collect()
+    assert ref() is None
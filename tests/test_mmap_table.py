@@ -0,0 +1,22 @@
+import pytest
+
+from char_table.mmap_table import MappedWidthTable
+from char_table.table import get_table
+
+
+@pytest.fixture(scope="module")
+def mapped():
+    with MappedWidthTable() as table:
+        yield table
+
+
+def test_matches_range_table(mapped):
+    table = get_table()
+    for cp in (0x41, 0x1100, 0x3042, 0x4E00, 0xAC00, 0xFF01, 0x1F600, 0x10FFFF):
+        assert mapped.lookup(cp) == table.lookup(cp)
+
+
+@pytest.mark.parametrize("cp", [-1, -0x110000, 0x110000, 0x7FFFFFFF])
+def test_out_of_range_code_points_use_default(mapped, cp):
+    assert mapped.lookup(cp) == get_table().lookup(cp)
+    assert mapped.lookup(cp, default=7) == 7
@@ -0,0 +1,50 @@
+import os
+import json
+
+import pytest
+
+from char_table.ranges import merge_ranges
+from char_table.table import DATASETS, load_datasets, read_dataset, resolve_data_dir
+from char_table.rules_table import CURATED, RULES, check, derive_dataset, derive_datasets, load_rules_datasets
+
+DERIVED = [rel_path for rel_path in DATASETS if os.path.basename(rel_path).removesuffix(".json") in (*RULES, CURATED)]
+
+
+def name_of(rel_path):
+    return os.path.basename(rel_path).removesuffix(".json")
+
+
+@pytest.mark.parametrize("rel_path", DERIVED)
+def test_derived_dataset_equals_shipped_range_file(rel_path):
+    path = os.path.join(resolve_data_dir(), rel_path.removesuffix(".json") + ".ranges.json")
+    with open(path, "r", encoding="utf-8") as f:
+        shipped = json.load(f)
+    ranges, sequences = derive_dataset(name_of(rel_path))
+    assert [list(r) for r in ranges] == shipped["ranges"]
+    assert sequences == shipped["sequences"]
+
+
+@pytest.mark.parametrize("rel_path", DERIVED)
+def test_derived_dataset_equals_shipped(rel_path):
+    ranges, sequences = read_dataset(os.path.join(resolve_data_dir(), rel_path))
+    derived_ranges, derived_sequences = derive_datasets()[name_of(rel_path)]
+    assert merge_ranges(derived_ranges) == merge_ranges(ranges)
+    assert derived_sequences == sequences
+
+
+def test_derived_tables_equal_shipped_tables():
+    table, sequences = load_rules_datasets()
+    shipped_table, shipped_sequences = load_datasets()
+    assert table.ranges() == shipped_table.ranges()
+    assert sequences == shipped_sequences
+
+
+def test_check_finds_no_differences():
+    assert check() == []
+
+
+def test_cache_round_trip(tmp_path):
+    cache_path = str(tmp_path / "rules.marshal")
+    assert derive_datasets(cache_path) == derive_datasets()
+    assert os.path.exists(cache_path)
+    assert derive_datasets(cache_path) == derive_datasets()
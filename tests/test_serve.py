@@ -0,0 +1,59 @@
+import json
+import asyncio
+
+from char_table import serve
+from char_table.serve import EXECUTOR_LINE_BYTES, handle_stream, respond
+from char_table.strwidth import str_width
+
+
+def test_respond_echoes_id():
+    assert json.loads(respond(b'{"id": 7, "strings": ["\\u6f22", "ok"]}')) == {"id": 7, "widths": [2, 2]}
+    assert json.loads(respond(b'["ab", ""]')) == {"widths": [2, 0]}
+
+
+def test_respond_reports_malformed_requests():
+    assert "error" in json.loads(respond(b'{"strings": [1]}'))
+    assert "error" in json.loads(respond(b"not json"))
+
+
+def test_respond_reports_deeply_nested_requests():
+    line = b"[" * 100_000 + b"]" * 100_000
+    assert json.loads(respond(line)) == {"error": "request is nested too deeply"}
+
+
+def test_large_batches_do_not_block_other_clients(tmp_path, monkeypatch):
+    strings = ["漢字 ok"] * (EXECUTOR_LINE_BYTES // 8)
+
+    async def main():
+        release = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        original = serve.respond
+
+        # The large batch is held until the small client has its answer; answered on the
+        # event loop instead of a worker thread, it would block the loop and time out.
+        def gated_respond(line: bytes) -> bytes:
+            if len(line) >= EXECUTOR_LINE_BYTES:
+                asyncio.run_coroutine_threadsafe(release.wait(), loop).result(timeout=5)
+            return original(line)
+
+        monkeypatch.setattr(serve, "respond", gated_respond)
+        path = str(tmp_path / "serve.sock")
+        server = await asyncio.start_unix_server(handle_stream, path, limit=serve.MAX_LINE_BYTES)
+        async with server:
+            big_reader, big_writer = await asyncio.open_unix_connection(path, limit=serve.MAX_LINE_BYTES)
+            big_writer.write(json.dumps({"id": "big", "strings": strings}).encode() + b"\n")
+            await big_writer.drain()
+
+            small_reader, small_writer = await asyncio.open_unix_connection(path)
+            small_writer.write(b'{"id": "small", "strings": ["\\u6f22"]}\n')
+            small = json.loads(await asyncio.wait_for(small_reader.readline(), 5))
+            release.set()
+            big = json.loads(await asyncio.wait_for(big_reader.readline(), 5))
+
+            for writer in (big_writer, small_writer):
+                writer.close()
+        return small, big
+
+    small, big = asyncio.run(main())
+    assert small == {"id": "small", "widths": [2]}
+    assert big == {"id": "big", "widths": [7] * len(strings)}
@@ -0,0 +1,166 @@
+import os
+import threading
+import dataclasses
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+from builder.core import source_cache
+from builder.core.settings import settings
+from builder.core.source_cache import SourceUnavailableError, cached_entry, ensure_source
+
+REL_PATH = "16.0.0/ucd/EastAsianWidth.txt"
+VERSION = "16.0.0"
+BODY = b"4E00..9FFF;W\n"
+ETAG = '"v1"'
+LAST_MODIFIED = "Tue, 10 Sep 2024 00:00:00 GMT"
+
+# Scripted response: 200 headers announcing the whole body, then half of it and a closed connection.
+TRUNCATED = "truncated"
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """
+    Local stand-in for unicode.org: answers each GET with the next scripted status
+    (200 serves BODY with validators; 304 only when the request revalidates; TRUNCATED
+    cuts the body short).
+    """
+
+    script: list[int] = []
+    requests: list[dict] = []
+
+    def do_GET(self):
+        type(self).requests.append({"path": self.path, **self.headers})
+        status = self.script.pop(0) if self.script else 200
+        if status == TRUNCATED:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY[:len(BODY) // 2])
+            self.close_connection = True
+            return
+        if status == 304 and self.headers.get("If-None-Match") != ETAG:
+            status = 200
+        self.send_response(status)
+        if status == 200:
+            self.send_header("ETag", ETAG)
+            self.send_header("Last-Modified", LAST_MODIFIED)
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+        else:
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    StandIn.script, StandIn.requests = [], []
+    try:
+        yield httpd
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path, server, monkeypatch):
+    # Points the source cache at a scratch directory and the stand-in; backoff sleeps are recorded, not slept.
+    saved = dataclasses.replace(settings)
+    settings.cache_dir = str(tmp_path / "cache")
+    settings.mirror_dir = None
+    settings.offline = False
+    settings.retries = 3
+    settings.base_url = f"http://127.0.0.1:{server.server_port}"
+    sleeps: list[float] = []
+    monkeypatch.setattr(source_cache.time, "sleep", sleeps.append)
+    try:
+        yield sleeps
+    finally:
+        for field in dataclasses.fields(settings):
+            setattr(settings, field.name, getattr(saved, field.name))
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_download_then_not_modified(cache):
+    first = ensure_source(REL_PATH, VERSION)
+    assert read(first) == BODY
+    assert cached_entry(VERSION, REL_PATH)["etag"] == ETAG
+    assert StandIn.requests[0]["path"] == f"/{REL_PATH}"
+    assert "If-None-Match" not in StandIn.requests[0]
+
+    StandIn.script = [304]
+    assert ensure_source(REL_PATH, VERSION) == first
+    assert StandIn.requests[1]["If-None-Match"] == ETAG
+    assert StandIn.requests[1]["If-Modified-Since"] == LAST_MODIFIED
+
+
+def test_retries_server_errors_with_backoff(cache):
+    StandIn.script = [503, 500]
+    assert read(ensure_source(REL_PATH, VERSION)) == BODY
+    assert len(StandIn.requests) == 3
+    assert cache == [0.5, 1.0]
+
+
+def leftover_temp_files():
+    blobs = os.path.join(settings.cache_dir, "blobs")
+    return [name for name in os.listdir(blobs) if name.endswith(".tmp")] if os.path.isdir(blobs) else []
+
+
+def test_truncated_body_is_retried(cache):
+    StandIn.script = [TRUNCATED]
+    assert read(ensure_source(REL_PATH, VERSION)) == BODY
+    assert len(StandIn.requests) == 2
+    assert cache == [0.5]
+    assert leftover_temp_files() == []
+
+
+def test_truncated_body_on_every_attempt_is_unavailable(cache):
+    StandIn.script = [TRUNCATED] * 3
+    with pytest.raises(SourceUnavailableError):
+        ensure_source(REL_PATH, VERSION)
+    assert len(StandIn.requests) == 3
+    assert leftover_temp_files() == []
+
+
+def test_client_error_is_not_retried(cache):
+    StandIn.script = [404]
+    with pytest.raises(SourceUnavailableError):
+        ensure_source(REL_PATH, VERSION)
+    assert len(StandIn.requests) == 1
+
+
+def test_failed_download_falls_back_to_cache(cache):
+    first = ensure_source(REL_PATH, VERSION)
+    StandIn.script = [503, 503, 503]
+    assert ensure_source(REL_PATH, VERSION) == first
+    assert len(StandIn.requests) == 4
+
+
+def test_offline_hit_and_miss(cache, tmp_path):
+    cached = ensure_source(REL_PATH, VERSION)
+    settings.offline = True
+    assert ensure_source(REL_PATH, VERSION) == cached
+    assert len(StandIn.requests) == 1
+
+    with pytest.raises(SourceUnavailableError):
+        ensure_source("15.1.0/ucd/EastAsianWidth.txt", "15.1.0")
+
+    mirror = tmp_path / "mirror" / "15.1.0" / "ucd"
+    mirror.mkdir(parents=True)
+    (mirror / "EastAsianWidth.txt").write_bytes(BODY)
+    settings.mirror_dir = str(tmp_path / "mirror")
+    assert read(ensure_source("15.1.0/ucd/EastAsianWidth.txt", "15.1.0")) == BODY
+    assert len(StandIn.requests) == 1
@@ -0,0 +1,10 @@
+import char_table
+import char_table.table as table
+
+
+def test_width_function_does_not_shadow_a_module():
+    assert callable(char_table.width)
+    assert char_table.width("字") == 2
+    assert char_table.width(ord("a")) == 1
+    assert table.get_table is char_table.get_table
+    assert char_table.table.width is char_table.width